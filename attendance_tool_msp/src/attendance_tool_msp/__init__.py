@@ -6,8 +6,14 @@ validating student information, and generating formatted reports.
 
 Modules:
 - processor: CSV data validation and processing
+- record: Compact attendance record and columnar batch types
+- reader: Memory-mapped CSV reader with quote-aware chunking and row access
+- xlsx_reader: Streaming reader for Excel .xlsx workbooks
+- vectorized: Optional NumPy column-wise validation engine
 - exporter: Word and PDF report generation
+- profiling: Opt-in stage timing and counter instrumentation
 - argument_parser: Command-line interface handling
+- server: Local HTTP report service (python -m attendance_tool_msp.server)
 
 Subpackages:
 - gui: Graphical user interface components
@@ -21,12 +27,50 @@ Subpackages:
 # Doesn't replace the module-level imports - it adds package-level convenience imports.
 
 from .processor import Processor
-from .exporter import Exporter
+from .record import AttendanceRecord, AttendanceBatch
+from .profiling import Profile
 from .argument_parser import initialize_parser, validate_arguments
-from .gui import launch_gui
+
+# Exporter (python-docx) and launch_gui (customtkinter, tkinter, Pillow) are loaded lazily
+# on first access, so validation-only use of the package doesn't import the GUI or document stack
+_LAZY_ATTRIBUTES = ["Exporter", "launch_gui"]
+
+
+def __getattr__(name):
+    """
+    Lazily import package attributes on first access (PEP 562).
+
+    Args:
+        name (str): Attribute name, e.g. "Exporter"
+
+    Returns:
+        The requested class or function
+
+    Raises:
+        AttributeError: If the package has no such attribute
+    """
+    if name == "Exporter":
+        from .exporter import Exporter as value
+    elif name == "launch_gui":
+        from .gui import launch_gui as value
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Cache on the package so __getattr__ is not called again
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include the lazily imported attributes in dir(package)."""
+    return sorted(list(globals()) + _LAZY_ATTRIBUTES)
+
 
 __all__ = [
     "Processor",
+    "AttendanceRecord",
+    "AttendanceBatch",
+    "Profile",
     "Exporter",
     "initialize_parser",
     "validate_arguments",
@@ -6,7 +6,7 @@ def initialize_parser():
     Configure a customized command line argument parser for attendance processing.
 
     Sets up argument parsing for CSV file processing with Word/PDF export options.
-    Supports both GUI mode (no arguments) and command-line export mode.
+    Supports GUI mode (no arguments), command-line export mode and batch export mode.
 
     Returns:
         argparse.ArgumentParser: Configured parser with CSV file, export format, and title arguments
@@ -16,24 +16,22 @@ def initialize_parser():
     parser = argparse.ArgumentParser(allow_abbrev=False)
 
     # Usage: output incase invalid command used
-    parser.usage = 'python main.py [file.csv (--word | --pdf) --title "Title"]'
+    parser.usage = 'python main.py [file.csv [--word] [--pdf] --title "Title"]'
 
     # Add optional positional argument (no --) for CSV file, nargs=? means it's either provided
     # or not provided as the 1st argument, which allows for 2 different modes (GUI & CMD Modes)
     parser.add_argument("csv_file", nargs="?", help="Path to the CSV file to process")
 
-    # Create a group to run either --word or --pdf one at time
-    group = parser.add_mutually_exclusive_group()
-
+    # --word and --pdf can be combined to export both documents from a single processing pass
     # --word argument
-    group.add_argument(
+    parser.add_argument(
         "--word",
         action="store_true",  # No value required after the flag (True Or False whether provided)
         help="Process CSV data and export attendance report as Word document",
     )
 
     # --pdf argument
-    group.add_argument(
+    parser.add_argument(
         "--pdf",
         action="store_true",  # No value required after the flag (True Or False whether provided)
         help="Process CSV data and export attendance report as PDF document",
@@ -46,6 +44,49 @@ def initialize_parser():
         help="Title for the Word/PDF document (e.g., 'Monday 5/5/2025')",
     )
 
+    # --dedupe argument: keep one submission per student, course and time
+    parser.add_argument(
+        "--dedupe",
+        choices=["first", "latest"],
+        help="Drop duplicate form submissions, keeping the first or latest one (by Timestamp)",
+    )
+
+    # --no-cache argument: always validate, ignoring previously cached results
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",  # No value required after the flag (True Or False whether provided)
+        help="Validate the CSV data again instead of reusing cached results of the same file",
+    )
+
+    # --profile argument: print where the time went, stage by stage
+    parser.add_argument(
+        "--profile",
+        action="store_true",  # No value required after the flag (True Or False whether provided)
+        help="Print a per-stage timing, counter and validator breakdown of the export",
+    )
+
+    # --profile-json argument: same breakdown, written as JSON
+    parser.add_argument(
+        "--profile-json",
+        metavar="FILE",
+        help="Write the per-stage timing, counter and validator breakdown to a JSON file",
+    )
+
+    # --batch argument: one or more CSV files and/or directories of CSV files
+    parser.add_argument(
+        "--batch",
+        nargs="+",  # At least one value required after the flag
+        metavar="PATH",
+        help="Export one report per CSV file, for CSV files and/or directories of CSV files",
+    )
+
+    # --jobs argument for batch mode
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Number of parallel worker processes in batch mode (default: CPU count)",
+    )
+
     return parser
 
 
@@ -53,25 +94,45 @@ def validate_arguments(parser, args):
     """
     Validate parsed command line arguments and determine application mode.
 
-    Analyzes the provided arguments to determine whether to run in GUI mode
-    or export mode, and validates that required arguments are present for each mode.
+    Analyzes the provided arguments to determine whether to run in GUI mode,
+    export mode or batch mode, and validates that required arguments are present for each mode.
 
     Args:
         parser (argparse.ArgumentParser): The argument parser object for error reporting
         args (argparse.Namespace): Parsed command line arguments
 
     Returns:
-        str: Application mode - either "gui" or "export"
+        str: Application mode - either "gui", "export" or "batch"
 
     Raises:
         SystemExit: Via parser.error() if invalid argument combinations are provided
     """
 
+    # Handle batch mode (--batch with files/directories), --title is an optional prefix
+    profiling = args.profile or args.profile_json
+
+    if args.batch:
+        if profiling:
+            parser.error("--profile and --profile-json can only be used with a single CSV file")
+        if args.csv_file:
+            parser.error("CSV file cannot be combined with --batch, list it after --batch")
+        if not args.word and not args.pdf:
+            parser.error("Either --word or --pdf is required when using --batch")
+        if args.jobs is not None and args.jobs < 1:
+            parser.error("--jobs must be at least 1")
+        return "batch"
+
+    if args.jobs is not None:
+        parser.error("--jobs can only be used with --batch")
+
     # Handle GUI mode (no arguments)
     if not args.csv_file:
         # If no CSV file but other arguments provided, it's an error
-        if args.title or args.word or args.pdf:
-            parser.error("CSV file is required when using --title, --word, or --pdf")
+        if args.title or args.word or args.pdf or args.dedupe or args.no_cache or profiling:
+            parser.error(
+                "CSV file is required when using --title, --word, --pdf, --dedupe, --no-cache, "
+                "--profile, or --profile-json"
+            )
         # If no arguments are provided, then launch the GUI
         return "gui"
 
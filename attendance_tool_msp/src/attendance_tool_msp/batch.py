@@ -0,0 +1,209 @@
+import os, time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from .processor import Processor
+from .cache import open_result_cache
+from .exporter import Exporter
+
+# Batch export format -> Exporter.export() formats
+EXPORT_FORMATS = {"word": ("docx",), "pdf": ("pdf",), "both": ("docx", "pdf")}
+
+
+def collect_csv_files(paths):
+    """
+    Expand directories into the CSV files (and .xlsx workbooks) they contain.
+
+    Args:
+        paths (list): CSV file paths and/or directory paths
+
+    Returns:
+        list: CSV file paths, directories expanded to their .csv and .xlsx files in name order
+
+    Raises:
+        FileNotFoundError: If a path does not exist
+        ValueError: If no CSV files were found
+    """
+    csv_files = []
+    for path in paths:
+        if os.path.isdir(path):
+            # Only the directory's own CSV files and workbooks, sorted for a stable report order
+            for name in sorted(os.listdir(path)):
+                file_path = os.path.join(path, name)
+                if name.endswith((".csv", ".xlsx")) and os.path.isfile(file_path):
+                    csv_files.append(file_path)
+        elif os.path.exists(path):
+            csv_files.append(path)
+        else:
+            raise FileNotFoundError(f"The path '{path}' does not exist.")
+
+    if not csv_files:
+        raise ValueError("No CSV files found to process")
+    return csv_files
+
+
+def export_file(csv_file, file_format, title, dedupe=None, use_cache=True):
+    """
+    Process a single CSV file and export its report. Runs inside a worker process.
+    Errors are captured in the result instead of raised, so one bad sheet does not stop a batch.
+
+    Args:
+        csv_file (str): Path to the CSV file to process
+        file_format (str): Export format ('word', 'pdf' or 'both')
+        title (str): Report title
+        dedupe (str, optional): Duplicate submission policy passed to Processor ("first" or "latest")
+        use_cache (bool, optional): Reuse persistent validation results of unchanged files. Defaults to True
+
+    Returns:
+        dict: Result with keys 'file', 'report', 'valid', 'invalid', 'seconds' and 'error'
+            ('report' and 'error' are None on failure and success respectively,
+            'report' lists both documents separated by ', ' for the 'both' format)
+    """
+    result = {
+        "file": csv_file,
+        "report": None,
+        "valid": 0,
+        "invalid": 0,
+        "seconds": 0.0,
+        "error": None,
+    }
+    start = time.perf_counter()
+
+    try:
+        processor = Processor(
+            csv_file, dedupe=dedupe, result_cache=open_result_cache(use_cache)
+        )
+        valid_rows, invalid_rows = processor.process_records()
+        result["valid"] = len(valid_rows)
+        result["invalid"] = len(invalid_rows)
+
+        exporter = Exporter(valid_rows, invalid_rows, title)
+        # Every requested document is built from the same processing pass
+        files = exporter.export(EXPORT_FORMATS[file_format])
+        result["report"] = ", ".join(files.values())
+    except Exception as error:
+        result["error"] = f"{type(error).__name__}: {error}"
+
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def batch_titles(csv_files, title=None):
+    """
+    Build one unique report title per CSV file.
+    Titles are based on the file name (e.g. 'Monday week_1'), since exported file names
+    are derived from the title and must not collide within the same second.
+
+    Args:
+        csv_files (list): CSV file paths
+        title (str, optional): Common title prefix for every report
+
+    Returns:
+        list: Report titles in the same order as csv_files
+    """
+    titles = []
+    seen = {}
+    for csv_file in csv_files:
+        name = os.path.splitext(os.path.basename(csv_file))[0]
+        report_title = f"{title} {name}" if title and title.strip() else name
+
+        # Same file name in different directories: number the duplicates
+        seen[report_title] = seen.get(report_title, 0) + 1
+        if seen[report_title] > 1:
+            report_title = f"{report_title} ({seen[report_title]})"
+        titles.append(report_title)
+    return titles
+
+
+def run_batch(
+    csv_files, file_format, title=None, jobs=None, dedupe=None, use_cache=True
+):
+    """
+    Process and export many CSV files in parallel, one report per file.
+
+    Args:
+        csv_files (list): CSV file paths
+        file_format (str): Export format ('word', 'pdf' or 'both')
+        title (str, optional): Common title prefix for every report
+        jobs (int, optional): Number of worker processes. Defaults to the CPU count
+        dedupe (str, optional): Duplicate submission policy ("first" or "latest"). Defaults to None
+        use_cache (bool, optional): Reuse persistent validation results of unchanged files. Defaults to True
+
+    Returns:
+        list: One result dictionary per CSV file (see export_file), in input order
+
+    Raises:
+        ValueError: If file_format or jobs is invalid
+    """
+    if file_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {file_format}")
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    if not isinstance(jobs, int) or jobs < 1:
+        raise ValueError("Jobs must be a positive integer")
+    if dedupe not in (None, "first", "latest"):
+        raise ValueError('Dedupe must be None, "first" or "latest"')
+
+    titles = batch_titles(csv_files, title)
+
+    # No pool needed for a single job, avoids the worker startup cost
+    if jobs == 1 or len(csv_files) == 1:
+        return list(
+            map(
+                export_file,
+                csv_files,
+                repeat(file_format),
+                titles,
+                repeat(dedupe),
+                repeat(use_cache),
+            )
+        )
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(csv_files))) as executor:
+        return list(
+            executor.map(
+                export_file,
+                csv_files,
+                repeat(file_format),
+                titles,
+                repeat(dedupe),
+                repeat(use_cache),
+            )
+        )
+
+
+def format_summary(results, total_seconds=None):
+    """
+    Format batch results as a plain-text summary table.
+
+    Args:
+        results (list): Result dictionaries returned by run_batch
+        total_seconds (float, optional): Wall-clock time of the whole batch
+
+    Returns:
+        str: The summary table, one line per file followed by a totals line
+    """
+    width = max([len("File")] + [len(result["file"]) for result in results])
+    lines = [f"{'File':<{width}}  {'Rows':>7}  {'Invalid':>7}  {'Time (s)':>8}  Report"]
+    lines.append("-" * len(lines[0]))
+
+    for result in results:
+        rows = result["valid"] + result["invalid"]
+        # Show the error instead of the report name for failed files
+        report = result["report"] if result["error"] is None else result["error"]
+        lines.append(
+            f"{result['file']:<{width}}  {rows:>7}  {result['invalid']:>7}  "
+            f"{result['seconds']:>8.2f}  {report}"
+        )
+
+    failed = sum(1 for result in results if result["error"] is not None)
+    total_rows = sum(result["valid"] + result["invalid"] for result in results)
+    total_invalid = sum(result["invalid"] for result in results)
+    summary = (
+        f"{len(results)} files, {total_rows} rows, {total_invalid} invalid, {failed} failed"
+    )
+    if total_seconds is not None:
+        summary += f" in {total_seconds:.2f}s"
+    lines.append(summary)
+
+    return "\n".join(lines)
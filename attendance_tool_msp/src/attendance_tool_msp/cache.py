@@ -0,0 +1,308 @@
+import os, json, hashlib
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Bounded least-recently-used cache for validator results.
+
+    Design Note:
+        Validators are pure functions of their input, so their result (or the error
+        they raise) can be safely reused for repeated values. Failures are cached as
+        their error message and replayed as a new ValueError with the same message.
+
+    Attributes:
+        max_size (int): Maximum number of cached entries
+        hits (int): Number of lookups answered from the cache
+        misses (int): Number of lookups that had to run the validator
+    """
+
+    def __init__(self, max_size=1024):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_size (int, optional): Maximum number of cached entries. Defaults to 1024
+
+        Raises:
+            ValueError: If max_size is not a positive integer
+        """
+        if not isinstance(max_size, int) or max_size < 1:
+            raise ValueError("Cache size must be a positive integer")
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        """
+        Returns the number of cached entries.
+
+        Returns:
+            int: Number of entries currently in the cache
+        """
+        return len(self._entries)
+
+    def call(self, validator, value):
+        """
+        Return validator(value), reusing the cached result for repeated values.
+
+        Args:
+            validator (callable): Validator taking a single value
+            value: The value to validate (must be hashable)
+
+        Returns:
+            The (possibly cached) validator result
+
+        Raises:
+            ValueError: The validator's error, replayed with the same message when cached
+        """
+        key = (validator, value)
+
+        if key in self._entries:
+            self.hits += 1
+            # Mark as most recently used
+            self._entries.move_to_end(key)
+            result, error = self._entries[key]
+        else:
+            self.misses += 1
+            try:
+                result, error = validator(value), None
+            except ValueError as validation_error:
+                result, error = None, str(validation_error)
+
+            self._entries[key] = (result, error)
+            # Evict the least recently used entry once the cache is full
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+        if error is not None:
+            raise ValueError(error)
+        return result
+
+    def clear(self):
+        """
+        Remove all cached entries and reset the hit/miss counters.
+
+        Returns:
+            None: This method modifies the cache in place
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class ResultCache:
+    """
+    On-disk cache of whole-file validation results, one JSON file per entry.
+
+    Design Note:
+        Keys are derived from the CSV file's content hash plus every other input of
+        the validation (see Processor), so an entry can never be reused for a changed
+        file or changed rules. Entries are evicted least recently used first once the
+        directory grows beyond max_bytes.
+
+    Attributes:
+        directory (str): Directory holding the cache entries
+        max_bytes (int): Maximum total size of the entries, in bytes
+        hits (int): Number of lookups answered from the cache
+        misses (int): Number of lookups without a cached entry
+    """
+
+    def __init__(self, directory=None, max_bytes=64 * 1024 * 1024):
+        """
+        Initialize the cache, creating its directory if needed.
+
+        Args:
+            directory (str, optional): Cache directory. Defaults to default_cache_directory()
+            max_bytes (int, optional): Maximum total size of the entries. Defaults to 64 MiB
+
+        Raises:
+            ValueError: If max_bytes is not a positive integer
+            OSError: If the cache directory cannot be created
+        """
+        if not isinstance(max_bytes, int) or max_bytes < 1:
+            raise ValueError("Cache size must be a positive integer")
+
+        self.directory = directory or default_cache_directory()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def file_key(file_path, *parts):
+        """
+        Build a cache key from a file's content and any other inputs.
+
+        Args:
+            file_path (str): Path of the file whose content is hashed
+            *parts: Other values the cached data depends on (converted with str())
+
+        Returns:
+            str: SHA-256 hex digest identifying the entry
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as file:
+            for block in iter(lambda: file.read(1 << 20), b""):
+                digest.update(block)
+
+        # The file hash and every part, separated so ("ab", "c") and ("a", "bc") differ
+        for part in parts:
+            digest.update(b"\0" + str(part).encode())
+        return digest.hexdigest()
+
+    def get(self, key):
+        """
+        Load a cached entry.
+
+        Args:
+            key (str): Key returned by file_key()
+
+        Returns:
+            The cached JSON data, or None if there is no (readable) entry
+        """
+        path = self.__entry_path(key)
+        try:
+            with open(path, encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        # Mark as recently used for eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def put(self, key, data):
+        """
+        Store an entry, then evict old entries until the cache fits in max_bytes.
+        Entries larger than max_bytes on their own are not stored, and neither are
+        entries the cache directory can't take (full disk, lost write permission):
+        caching is an optimization, it never fails the caller.
+
+        Args:
+            key (str): Key returned by file_key()
+            data: JSON serializable data
+
+        Returns:
+            bool: True if the entry was stored, False if it was skipped
+        """
+        # json.dumps() uses the C encoder, json.dump() streams through the pure Python one
+        content = json.dumps(data)
+        if len(content.encode()) > self.max_bytes:
+            return False
+
+        # Write to a temporary file first, so readers never see a partial entry
+        path = self.__entry_path(key)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            # The directory may have been removed since __init__
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temporary_path, "w", encoding="utf-8") as file:
+                file.write(content)
+            os.replace(temporary_path, path)
+            self.__evict()
+        except OSError:
+            try:
+                os.remove(temporary_path)
+            except OSError:
+                pass
+            return False
+        return True
+
+    def clear(self):
+        """
+        Remove all cached entries and reset the hit/miss counters.
+
+        Returns:
+            None: The cache directory is emptied of entries
+        """
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+        self.hits = 0
+        self.misses = 0
+
+    def __entry_path(self, key):
+        """
+        Helper method for the cache - Get the file path of an entry.
+
+        Args:
+            key (str): Entry key
+
+        Returns:
+            str: Path of the entry's JSON file
+        """
+        return os.path.join(self.directory, f"{key}.json")
+
+    def __evict(self):
+        """
+        Helper method for the cache - Remove least recently used entries beyond max_bytes.
+
+        Returns:
+            None: Entries are deleted from the cache directory
+        """
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                try:
+                    stat = os.stat(os.path.join(self.directory, name))
+                except OSError:
+                    continue  # Removed by another process meanwhile
+                entries.append((stat.st_mtime, stat.st_size, name))
+
+        total = sum(size for _, size, _ in entries)
+        # Oldest first
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+            total -= size
+
+
+def open_result_cache(enabled=True):
+    """
+    Open the default result cache, without failing when it cannot be used.
+
+    Args:
+        enabled (bool, optional): False to disable caching. Defaults to True
+
+    Returns:
+        ResultCache: The cache, or None if disabled or the cache directory is not writable
+    """
+    if not enabled:
+        return None
+    try:
+        return ResultCache()
+    except OSError:
+        return None
+
+
+def default_cache_directory():
+    """
+    Get the per-user cache directory of the package.
+
+    Returns:
+        str: %LOCALAPPDATA%\\attendance_tool_msp\\Cache on Windows,
+            $XDG_CACHE_HOME/attendance_tool_msp (default ~/.cache) elsewhere
+    """
+    if os.name == "nt" and os.environ.get("LOCALAPPDATA"):
+        return os.path.join(os.environ["LOCALAPPDATA"], "attendance_tool_msp", "Cache")
+
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "attendance_tool_msp")
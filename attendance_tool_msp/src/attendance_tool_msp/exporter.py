@@ -1,6 +1,14 @@
-import docx, docx.shared, docx.oxml, os
+import os, io, copy
 from datetime import datetime
-from docx2pdf import convert
+from .lazy_loader import lazy_import
+from .processor import PROGRESS_INTERVAL
+from .profiling import profile_stage
+from .record import AttendanceRecord, AttendanceBatch
+
+# Heavy document libraries are only loaded once a document is actually exported
+# Importing python-docx also loads its submodules (docx.shared, docx.oxml, docx.enum.style...)
+docx = lazy_import("docx")
+docx2pdf = lazy_import("docx2pdf")
 
 
 class Exporter:
@@ -15,28 +23,40 @@ class Exporter:
         outside, and would likely cause unexpected results if used independently.
 
     Attributes:
-        valid_rows (list): Valid attendance records
-        invalid_rows (list): Invalid records with error messages
+        valid_rows (list or AttendanceBatch): Valid attendance records (AttendanceRecord)
+        invalid_rows (list or AttendanceBatch): Invalid records with error messages (AttendanceRecord)
         title (str): Document title
+        profile (Profile): Instrumentation collector, None when profiling is disabled
     """
 
+    # Formats supported by export(), in their default order
+    EXPORT_FORMATS = ("docx", "pdf")
+
+    # Named paragraph styles used by the attendance table cells
+    CELL_STYLE = "AttendanceCell"
+    INVALID_CELL_STYLE = "AttendanceInvalidCell"
+
     # Constructor with valid and invalid rows, and the document's title
-    def __init__(self, valid_rows, invalid_rows, title="Attendance Report"):
+    def __init__(self, valid_rows, invalid_rows, title="Attendance Report", profile=None):
         """
         Initialize the Exporter with attendance data.
 
         Args:
-            valid_rows (list): Valid attendance records
-            invalid_rows (list): Invalid records with error info
+            valid_rows (list or AttendanceBatch): Valid attendance records (AttendanceRecord or row dictionaries)
+            invalid_rows (list or AttendanceBatch): Invalid records with error info (AttendanceRecord or row dictionaries)
             title (str, optional): Document title. Defaults to "Attendance Report"
+            profile (Profile, optional): Collects the timings of the export stages
+                (document construction, table rows, save, PDF rendering/conversion). Defaults to None
 
         Raises:
-            ValueError: If valid_rows/invalid_rows are not lists or contain non-dictionary elements,
+            ValueError: If valid_rows/invalid_rows are not lists/batches or contain elements that are
+                       neither AttendanceRecord nor dictionaries,
                        or if title is not a string or is empty after trimming whitespace
         """
         self.valid_rows = valid_rows
         self.invalid_rows = invalid_rows
         self.title = title
+        self.profile = profile
 
     # Getter for valid_rows
     @property
@@ -45,7 +65,7 @@ class Exporter:
         Get the list of valid attendance rows.
 
         Returns:
-            list: List of dictionaries containing valid attendance data
+            list or AttendanceBatch: AttendanceRecord objects containing valid attendance data
         """
         return self._valid_rows
 
@@ -54,22 +74,18 @@ class Exporter:
     def valid_rows(self, valid_rows):
         """
         Set valid attendance rows with type and structure validation.
+        Row dictionaries (e.g. from Processor.process()) are converted to AttendanceRecord.
 
         Args:
-            valid_rows (list): List of dictionaries containing valid attendance data
+            valid_rows (list or AttendanceBatch): AttendanceRecord objects or dictionaries containing valid attendance data
 
         Returns:
             None: This setter does not return a value
 
         Raises:
-            ValueError: If not a list or contains non-dictionary elements
+            ValueError: If not a list/batch or contains elements that are neither records nor dictionaries
         """
-        if not isinstance(valid_rows, list):
-            raise ValueError("Valid rows must be a list")
-        # Check if list is not empty and first item is dict
-        if valid_rows and not isinstance(valid_rows[0], dict):
-            raise ValueError("Valid rows data must be dictionaries")
-        self._valid_rows = valid_rows
+        self._valid_rows = self.__to_records(valid_rows, "Valid")
 
     # Getter for invalid_rows
     @property
@@ -78,7 +94,7 @@ class Exporter:
         Get the list of invalid attendance rows.
 
         Returns:
-            list: List of dictionaries containing invalid attendance data with error messages
+            list or AttendanceBatch: AttendanceRecord objects containing invalid attendance data with error messages
         """
         return self._invalid_rows
 
@@ -87,22 +103,18 @@ class Exporter:
     def invalid_rows(self, invalid_rows):
         """
         Set invalid attendance rows with type and structure validation.
+        Row dictionaries (e.g. from Processor.process()) are converted to AttendanceRecord.
 
         Args:
-            invalid_rows (list): List of dictionaries containing invalid attendance data
+            invalid_rows (list or AttendanceBatch): AttendanceRecord objects or dictionaries containing invalid attendance data
 
         Returns:
             None: This setter does not return a value
 
         Raises:
-            ValueError: If not a list or contains non-dictionary elements
+            ValueError: If not a list/batch or contains elements that are neither records nor dictionaries
         """
-        if not isinstance(invalid_rows, list):
-            raise ValueError("Invalid rows must be a list")
-        # Check if list is not empty and first item is dict
-        if invalid_rows and not isinstance(invalid_rows[0], dict):
-            raise ValueError("Invalid rows data must be dictionaries")
-        self._invalid_rows = invalid_rows
+        self._invalid_rows = self.__to_records(invalid_rows, "Invalid")
 
     # Getter for title
     @property
@@ -136,16 +148,256 @@ class Exporter:
             raise ValueError("Title cannot be empty")
         self._title = title.strip()
 
-    def export_word(self):
+    @staticmethod
+    def __to_records(rows, kind):
+        """
+        Helper method for the row setters - Validate rows and adapt dictionaries to AttendanceRecord.
+
+        Args:
+            rows (list or AttendanceBatch): AttendanceRecord objects or row dictionaries
+            kind (str): "Valid" or "Invalid", used in error messages
+
+        Returns:
+            list or AttendanceBatch: The rows as AttendanceRecord objects
+                (the same list or batch if no conversion is needed)
+
+        Raises:
+            ValueError: If not a list/batch or contains elements that are neither records nor dictionaries
+        """
+        # Batches decode their rows to records while they are exported
+        if isinstance(rows, AttendanceBatch):
+            return rows
+        if not isinstance(rows, list):
+            raise ValueError(f"{kind} rows must be a list")
+        # Check if list is not empty and first item is a record or dict
+        if not rows or isinstance(rows[0], AttendanceRecord):
+            return rows
+        if not isinstance(rows[0], dict):
+            raise ValueError(f"{kind} rows data must be attendance records or dictionaries")
+        return [AttendanceRecord.from_row(row) for row in rows]
+
+    def export_word(self, progress=None, stream=None):
         """
         Generate a Word document containing attendance data.
 
+        Args:
+            progress (callable, optional): Called as progress(stage, done, total) while the
+                document is built: "writing" every PROGRESS_INTERVAL table rows, then "saving".
+                Exceptions raised by the callback propagate and abort the export
+            stream (file-like, optional): Writable binary stream (e.g. io.BytesIO) to write the
+                document into instead of a timestamped file in the current directory
+
         Returns:
-            str: The file path of the generated Word document
+            str: The file path of the generated Word document (stream when a stream is given)
 
         Raises:
+            ValueError: If stream is not a writable binary stream
             PermissionError: If document cannot be created or saved
         """
+        if stream is not None:
+            with profile_stage(self.profile, "export"):
+                self.__save_word_document(self.__check_stream(stream), progress)
+            return stream
+
+        return self.export(("docx",), progress=progress)["docx"]
+
+    def export_pdf(self, backend="native", progress=None, stream=None):
+        """
+        Generate a PDF document containing attendance data.
+
+        The "native" backend renders the PDF directly with ReportLab and works headless
+        on any platform. The "word" backend converts a Word document through Microsoft
+        Word (docx2pdf); the temporary Word document is automatically deleted after conversion.
+
+        Args:
+            backend (str, optional): "native" or "word". Defaults to "native"
+            progress (callable, optional): Called as progress(stage, done, total). The native
+                backend reports "rendering"; the word backend reports the export_word() stages
+                followed by "converting"
+            stream (file-like, optional): Writable binary stream (e.g. io.BytesIO) to write the
+                PDF into instead of a timestamped file in the current directory.
+                Native backend only, Microsoft Word can only convert files
+
+        Returns:
+            str: The file path of the generated PDF document (stream when a stream is given)
+
+        Raises:
+            ValueError: If backend is not "native" or "word", or stream is used with the
+                word backend or is not a writable binary stream
+            PermissionError: If the document cannot be created or saved
+            Exception: If Word document creation fails or PDF conversion fails
+        """
+        if stream is not None:
+            if backend != "native":
+                raise ValueError("Only the native PDF backend can export to a stream")
+            with profile_stage(self.profile, "export"):
+                self.__export_native_pdf(self.__check_stream(stream), progress)
+            return stream
+
+        return self.export(("pdf",), backend, progress)["pdf"]
+
+    def export(self, formats=EXPORT_FORMATS, pdf_backend="native", progress=None):
+        """
+        Generate the attendance report in one or more formats from a single pass.
+
+        Every format shares one base filename. The Word document is built once: with the
+        "word" PDF backend the PDF is converted from it, and the .docx is kept if it was
+        requested too (instead of rebuilding it and deleting it after the conversion).
+
+        Args:
+            formats (tuple, optional): Formats to export, any of "docx" and "pdf". Defaults to both
+            pdf_backend (str, optional): "native" or "word", see export_pdf(). Defaults to "native"
+            progress (callable, optional): Called as progress(stage, done, total), see
+                export_word() and export_pdf() for the stages
+
+        Returns:
+            dict: Format -> file path of the generated document, in the requested order
+
+        Raises:
+            ValueError: If formats is empty or contains unknown or repeated formats,
+                or pdf_backend is not "native" or "word"
+            PermissionError: If a document cannot be created or saved
+            Exception: If PDF conversion through Microsoft Word fails
+        """
+        formats = self.__validate_formats(formats)
+        if pdf_backend not in ("native", "word"):
+            raise ValueError(f"Unknown PDF backend: {pdf_backend}")
+
+        with profile_stage(self.profile, "export"):
+            return self.__export_formats(formats, pdf_backend, progress)
+
+    def __export_formats(self, formats, pdf_backend, progress=None):
+        """
+        Helper method for exporting - Write every validated format, see export().
+
+        Args:
+            formats (tuple): Validated formats
+            pdf_backend (str): "native" or "word"
+            progress (callable, optional): Progress callback
+
+        Returns:
+            dict: Format -> file path of the generated document
+        """
+        # Generate unique filename with title and timestamp, shared by every format
+        word_filename = self.__generate_filename()
+        pdf_filename = word_filename.replace(".docx", ".pdf")
+
+        keep_word = "docx" in formats
+        convert_word = "pdf" in formats and pdf_backend == "word"
+
+        # Build and save the Word document once, for the .docx and/or the conversion
+        if keep_word or convert_word:
+            try:
+                self.__save_word_document(word_filename, progress)
+            except PermissionError as error:
+                if keep_word:
+                    # Raised possibly because file is open, and we're trying to save it
+                    raise PermissionError(error)
+                raise PermissionError(
+                    f"Failed to create Word document for PDF conversion: {error}"
+                )
+            except Exception as error:
+                if keep_word:
+                    raise
+                raise Exception(f"Error creating Word document for PDF conversion: {error}")
+
+        files = {}
+        for export_format in formats:
+            if export_format == "docx":
+                files["docx"] = word_filename
+            elif pdf_backend == "native":
+                files["pdf"] = self.__export_native_pdf(pdf_filename, progress)
+            else:
+                files["pdf"] = self.__convert_word_to_pdf(
+                    word_filename, pdf_filename, keep_word, progress
+                )
+        return files
+
+    @staticmethod
+    def __validate_formats(formats):
+        """
+        Helper method for exporting - Validate the requested export formats.
+
+        Args:
+            formats (tuple): Requested formats
+
+        Returns:
+            tuple: The formats as a tuple
+
+        Raises:
+            ValueError: If formats is empty or contains unknown or repeated formats
+        """
+        # A single string would be iterated character by character
+        if isinstance(formats, str):
+            formats = (formats,)
+        formats = tuple(formats)
+
+        if not formats:
+            raise ValueError("At least one export format is required")
+        for export_format in formats:
+            if export_format not in Exporter.EXPORT_FORMATS:
+                raise ValueError(f"Unknown export format: {export_format}")
+        if len(set(formats)) != len(formats):
+            raise ValueError("Export formats must not be repeated")
+        return formats
+
+    @staticmethod
+    def __check_stream(stream):
+        """
+        Helper method for exporting - Validate a caller-supplied output stream.
+
+        Args:
+            stream (file-like): Stream passed to export_word() or export_pdf()
+
+        Returns:
+            file-like: The same stream
+
+        Raises:
+            ValueError: If stream is a file path, a text stream or has no write() method
+        """
+        # Paths go through export(), text streams would fail halfway through the document
+        if isinstance(stream, (str, bytes, os.PathLike)) or not callable(
+            getattr(stream, "write", None)
+        ):
+            raise ValueError("Stream must be a writable binary file object")
+        if isinstance(stream, io.TextIOBase):
+            raise ValueError("Stream must be opened in binary mode")
+        return stream
+
+    def __save_word_document(self, output, progress=None):
+        """
+        Helper method for exporting word document - Build the Word document and save it.
+
+        Args:
+            output (str or file-like): Path of the .docx file to write, or binary stream
+            progress (callable, optional): See export_word()
+
+        Returns:
+            None: The document is written to output
+
+        Raises:
+            PermissionError: If the document cannot be saved
+        """
+        with profile_stage(self.profile, "docx_build"):
+            document = self.__build_word_document(progress)
+
+        if progress:
+            total = len(self.valid_rows) + len(self.invalid_rows)
+            progress("saving", total, total)
+
+        with profile_stage(self.profile, "docx_save"):
+            document.save(output)
+
+    def __build_word_document(self, progress=None):
+        """
+        Helper method for exporting word document - Build the document in memory.
+
+        Args:
+            progress (callable, optional): See export_word()
+
+        Returns:
+            docx.document.Document: The complete report document
+        """
         # Initialize Document
         document = docx.Document()
 
@@ -156,6 +408,9 @@ class Exporter:
             section.left_margin = docx.shared.Inches(1)
             section.right_margin = docx.shared.Inches(1)
 
+        # Register the table cell styles once, rows only reference them
+        self.__add_table_styles(document)
+
         # Add and style document heading
         self.__add_document_heading(document)
 
@@ -165,53 +420,49 @@ class Exporter:
         # Create and setup the attendance table
         table = self.__create_attendance_table(document)
 
-        # Add valid data rows
-        self.__add_data_rows(table)
+        total = len(self.valid_rows) + len(self.invalid_rows)
+
+        with profile_stage(self.profile, "docx_table_rows"):
+            # Add valid data rows
+            self.__add_data_rows(table, progress=progress, total=total)
 
-        # Add invalid data rows (highlighted in red)
-        self.__add_data_rows(table, False)
+            # Add invalid data rows (highlighted in red), numbered after the valid ones
+            self.__add_data_rows(
+                table, False, progress, total, offset=len(self.valid_rows)
+            )
+        if self.profile is not None:
+            self.profile.count("docx_table_rows", total)
 
         # Add error log section if there are invalid rows
         if self.invalid_rows:
-            self.__add_error_log(document)
-
-        # Generate unique filename with title and timestamp
-        filename = self.__generate_filename()
+            with profile_stage(self.profile, "docx_error_log"):
+                self.__add_error_log(document)
 
-        try:
-            document.save(filename)
-            return filename
-        except PermissionError as error:
-            # Raised possibly because file is open, and we're trying to save it
-            raise PermissionError(error)
+        return document
 
-    def export_pdf(self):
+    def __convert_word_to_pdf(self, word_filename, pdf_filename, keep_word, progress=None):
         """
-        Generate a PDF document by converting a Word document.
-        The temporary Word document is automatically deleted after conversion.
+        Helper method for exporting pdf document - Convert the saved Word document through Microsoft Word.
+
+        Args:
+            word_filename (str): Path of the saved .docx file
+            pdf_filename (str): Path of the .pdf file to write
+            keep_word (bool): Keep the .docx file (False deletes it after the conversion)
+            progress (callable, optional): Called as progress("converting", total, total)
 
         Returns:
             str: The file path of the generated PDF document
 
         Raises:
-            PermissionError: If Word document creation fails due to file access issues
-            Exception: If Word document creation fails or PDF conversion fails
+            Exception: If PDF conversion fails
         """
-        # First create the Word document
-        try:
-            word_filename = self.export_word()
-        except PermissionError as error:
-            raise PermissionError(
-                f"Failed to create Word document for PDF conversion: {error}"
-            )
-        except Exception as error:
-            raise Exception(f"Error creating Word document for PDF conversion: {error}")
-
-        # Convert .docx to .pdf (replace extension)
-        pdf_filename = word_filename.replace(".docx", ".pdf")
+        if progress:
+            total = len(self.valid_rows) + len(self.invalid_rows)
+            progress("converting", total, total)
         try:
             # Utilize docx2pdf package's convert method
-            convert(word_filename, pdf_filename)
+            with profile_stage(self.profile, "pdf_convert"):
+                docx2pdf.convert(word_filename, pdf_filename)
         except Exception as error:
             # Check if PDF was actually created despite the error
             if os.path.exists(pdf_filename):
@@ -222,12 +473,16 @@ class Exporter:
                 print(f"Conversion completed with minor issues: {error}")
             # Clean up & delete Word file if conversion truly failed
             else:
-                try:
-                    os.remove(word_filename)
-                except OSError:
-                    pass  # Ignore cleanup errors
+                if not keep_word:
+                    try:
+                        os.remove(word_filename)
+                    except OSError:
+                        pass  # Ignore cleanup errors
                 raise Exception(f"Failed to convert .docx to .pdf: {error}")
 
+        if keep_word:
+            return pdf_filename
+
         # Clean up - delete the temporary Word document after successful conversion
         try:
             os.remove(word_filename)
@@ -262,6 +517,64 @@ class Exporter:
             0, 0, 0
         )  # Set text color to black
 
+    def __export_native_pdf(self, output, progress=None):
+        """
+        Helper method for exporting pdf document - Render the PDF directly, without Word.
+
+        Args:
+            output (str or file-like): Path of the .pdf file to write, or binary stream
+            progress (callable, optional): Called as progress("rendering", 0, total) before rendering
+
+        Returns:
+            str or file-like: output
+
+        Raises:
+            PermissionError: If the PDF cannot be saved
+        """
+        # Imported here so ReportLab is only loaded when a native PDF is exported
+        from .pdf_renderer import PdfRenderer
+
+        renderer = PdfRenderer(self.title, self.valid_rows, self.invalid_rows)
+        if progress:
+            progress("rendering", 0, len(self.valid_rows) + len(self.invalid_rows))
+        try:
+            with profile_stage(self.profile, "pdf_render"):
+                renderer.render(output)
+            return output
+        except PermissionError as error:
+            # Raised possibly because file is open, and we're trying to save it
+            raise PermissionError(error)
+
+    def __add_table_styles(self, document):
+        """
+        Helper method for exporting word document - Register the paragraph styles used by table cells.
+
+        Fonts and colors are defined once on named styles instead of on every run,
+        which keeps the document XML small for large reports.
+
+        Args:
+            document (docx.Document): The Word document object
+
+        Returns:
+            None: This method modifies the document's styles in place
+        """
+        styles = document.styles
+
+        # Regular cell text: Roboto 11.5pt
+        cell_style = styles.add_style(
+            self.CELL_STYLE, docx.enum.style.WD_STYLE_TYPE.PARAGRAPH
+        )
+        cell_style.base_style = styles["Normal"]
+        cell_style.font.name = "Roboto"
+        cell_style.font.size = docx.shared.Pt(11.5)
+
+        # Invalid rows: same as regular cells, in red
+        invalid_cell_style = styles.add_style(
+            self.INVALID_CELL_STYLE, docx.enum.style.WD_STYLE_TYPE.PARAGRAPH
+        )
+        invalid_cell_style.base_style = cell_style
+        invalid_cell_style.font.color.rgb = docx.shared.RGBColor(255, 0, 0)
+
     def __create_attendance_table(self, document):
         """
         Helper method for exporting word document - Create the main attendance data table.
@@ -294,63 +607,121 @@ class Exporter:
         # Set table border color to blue
         self.__set_table_border_color(table)
 
+        # Set default margins for every cell of the table
+        self.__set_cell_margins(table)
+
         # --- Header Row ---
         hdr_cells = table.rows[0].cells
-        # Set margins for header cells
-        self.__set_cell_margins(hdr_cells)
 
         for i, col_name in enumerate(columns):
             paragraph = hdr_cells[i].paragraphs[0]
+            paragraph.style = self.CELL_STYLE
             run = paragraph.add_run(col_name)
             run.font.bold = True
-            run.font.name = "Roboto"
-            run.font.size = docx.shared.Pt(11.5)
             # paragraph.alignment = docx.enum.text.WD_PARAGRAPH_ALIGNMENT.CENTER
 
         return table
 
-    def __add_data_rows(self, table, valid=True):
+    def __add_data_rows(self, table, valid=True, progress=None, total=0, offset=0):
         """
         Helper method for exporting word document - Add data rows to the attendance table.
 
+        A single template row is built once with python-docx, then each data row is a
+        deep copy of its XML with only the cell texts replaced. This avoids re-creating
+        cells for every row, and formatting comes from the cell styles and table margins.
+
         Args:
             table (docx.table.Table): The table object to add rows to
             valid (bool): True for valid rows, False for invalid rows
+            progress (callable, optional): Called as progress("writing", done, total)
+            total (int): Total number of data rows in the table, passed to progress
+            offset (int): Number of data rows already written before these rows
 
         Returns:
             None: This method modifies the table in place
         """
         # Choose which data to process based on valid parameter - Pythonic Ternary Operator!
-        for row in self.valid_rows if valid else self.invalid_rows:
-            cells = table.add_row().cells
-            cells[0].text = row["Full Name"]
-            cells[1].text = row["University ID"]
-            cells[2].text = row["Course Code"]
-            cells[3].text = row["Course Time"]
-            cells[4].text = row["Doctor/TA Name"]
-
-            # Set margins for data cells
-            self.__set_cell_margins(cells)
-
-            # Format row text
-            for cell in cells:
-                for paragraph in cell.paragraphs:
-                    for run in paragraph.runs:
-                        run.font.size = docx.shared.Pt(11.5)
-                        run.font.name = "Roboto"
-                        # Make invalid rows red
-                        if not valid:
-                            run.font.color.rgb = docx.shared.RGBColor(255, 0, 0)
-
-    def __set_cell_margins(self, cells):
-        """
-        Helper method for exporting word document - Set cell margins using XML manipulation.
+        rows = self.valid_rows if valid else self.invalid_rows
+        if not rows:
+            return
+
+        template = self.__create_row_template(table, valid)
+        tbl = table._tbl
+        run_tag = docx.oxml.ns.qn("w:r")
+
+        for count, record in enumerate(rows, offset + 1):
+            tr = copy.deepcopy(template)
+            # One run per cell, in column order
+            for run, text in zip(tr.iter(run_tag), record.table_cells()):
+                self.__set_run_text(run, text)
+            tbl.append(tr)
+
+            if progress and count % PROGRESS_INTERVAL == 0:
+                progress("writing", count, total)
+
+        if progress:
+            progress("writing", offset + len(rows), total)
+
+    def __create_row_template(self, table, valid=True):
+        """
+        Helper method for exporting word document - Build a styled data row to clone.
+
+        The row is created with the regular python-docx API (so it is identical to a
+        normally added row), then detached from the table.
+
+        Args:
+            table (docx.table.Table): The table the template row belongs to
+            valid (bool): True for valid rows, False for invalid rows (red text style)
+
+        Returns:
+            lxml.etree._Element: The detached <w:tr> template element
+        """
+        cells = table.add_row().cells
+        for cell in cells:
+            cell.text = "-"  # Placeholder, gives every run a <w:t> to fill in
+            # Make invalid rows red through their style
+            cell.paragraphs[0].style = (
+                self.CELL_STYLE if valid else self.INVALID_CELL_STYLE
+            )
+
+        # Detach the template row from the table
+        tr = table._tbl.tr_lst[-1]
+        table._tbl.remove(tr)
+        return tr
+
+    def __set_run_text(self, run, text):
+        """
+        Helper method for exporting word document - Replace the text of a cloned template run.
+
+        Plain text only updates the run's existing <w:t> element. Empty text, tabs and
+        line breaks go through python-docx, which produces the matching XML elements.
 
         Args:
-            cells (list): List of table cells to apply margins to
+            run (docx.oxml.text.run.CT_R): Cloned <w:r> element ending with a <w:t>
+            text (str): The text to write into the run
 
         Returns:
-            None: This method modifies the cells in place
+            None: This method modifies the run in place
+        """
+        if text and "\t" not in text and "\n" not in text and "\r" not in text:
+            t = run[-1]
+            t.text = text
+            # Same rule as python-docx: keep leading/trailing whitespace
+            if len(text.strip()) < len(text):
+                t.set(docx.oxml.ns.qn("xml:space"), "preserve")
+        else:
+            run.text = text
+
+    def __set_cell_margins(self, table):
+        """
+        Helper method for exporting word document - Set default cell margins for the whole table.
+        Uses a single table-level <w:tblCellMar> instead of margins on every cell.
+
+        Args:
+            table (docx.table.Table): The table object to apply margins to
+
+        Returns:
+            None: This method modifies the table in place
         """
 
         # Specific Margin Sizes
@@ -359,16 +730,20 @@ class Exporter:
         bottom_margin = 360
         left_margin = 150
 
-        for cell in cells:
-            cell_element = cell._element
-            cell_properties = cell_element.get_or_add_tcPr()
-            margins = docx.oxml.parse_xml(f'<w:tcMar xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
-                                        f'<w:top w:w="{top_margin}" w:type="dxa"/>'
-                                        f'<w:left w:w="{left_margin}" w:type="dxa"/>'
-                                        f'<w:bottom w:w="{bottom_margin}" w:type="dxa"/>'
-                                        f'<w:right w:w="{right_margin}" w:type="dxa"/>'
-                                        f'</w:tcMar>')
-            cell_properties.append(margins)
+        margins = docx.oxml.parse_xml(f'<w:tblCellMar xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+                                    f'<w:top w:w="{top_margin}" w:type="dxa"/>'
+                                    f'<w:left w:w="{left_margin}" w:type="dxa"/>'
+                                    f'<w:bottom w:w="{bottom_margin}" w:type="dxa"/>'
+                                    f'<w:right w:w="{right_margin}" w:type="dxa"/>'
+                                    f'</w:tblCellMar>')
+
+        # Cell margins must come before <w:tblLook> in the table properties
+        tblPr = table._tbl.tblPr
+        tblLook = tblPr.find(docx.oxml.ns.qn("w:tblLook"))
+        if tblLook is not None:
+            tblLook.addprevious(margins)
+        else:
+            tblPr.append(margins)
 
     def __set_table_border_color(self, table, color="0000FF"):
         """
@@ -414,39 +789,68 @@ class Exporter:
         log_heading_run.font.name = "Roboto"
         log_heading_run.font.color.rgb = docx.shared.RGBColor(255, 0, 0)  # Red color
 
-        # Add each error as a separate paragraph
-        for i, row in enumerate(self.invalid_rows, 1):
-            if "error" in row and row["error"]:
-                error_paragraph = document.add_paragraph()
-
-                # Add error number (invalid_row index + 1)
-                error_run = error_paragraph.add_run(f"{i}. ")
-                error_run.font.bold = True
-                error_run.font.name = "Roboto"
-                error_run.font.size = docx.shared.Pt(11)
+        # Build one formatted error paragraph, then clone it for every error
+        template = self.__create_error_template(document)
+        run_tag = docx.oxml.ns.qn("w:r")
 
+        # Add each error as a separate paragraph
+        for i, record in enumerate(self.invalid_rows, 1):
+            if record.error:
                 # Add student identifier (name or ID)
-                student_name = row["Full Name"]
+                student_name = record.full_name
                 if not student_name.strip():
                     # Default value 'Unknown'
-                    if row["University ID"]:
-                        student_name = f'Student with ID: {row["University ID"]}'
+                    if record.university_id:
+                        student_name = f"Student with ID: {record.university_id}"
                     else:
                         student_name = f"Unknown Student"
 
-                # Student -
-                name_run = error_paragraph.add_run(f"{student_name} - ")
-                name_run.font.bold = True
-                name_run.font.name = "Roboto"
-                name_run.font.size = docx.shared.Pt(11)
-
-                # Add error message
-                error_msg_run = error_paragraph.add_run(row["error"])
-                error_msg_run.font.name = "Roboto"
-                error_msg_run.font.size = docx.shared.Pt(11)
-                error_msg_run.font.color.rgb = docx.shared.RGBColor(
-                    128, 128, 128
-                )  # Gray color
+                # Error number (invalid_row index + 1), Student -, and error message
+                texts = (f"{i}. ", f"{student_name} - ", record.error)
+
+                error_paragraph = copy.deepcopy(template)
+                for run, text in zip(error_paragraph.iter(run_tag), texts):
+                    self.__set_run_text(run, text)
+
+                # Insert before the template, which stays last until it is removed
+                template.addprevious(error_paragraph)
+
+        template.getparent().remove(template)
+
+    def __create_error_template(self, document):
+        """
+        Helper method for exporting word document - Build a formatted error log paragraph to clone.
+
+        Args:
+            document (docx.Document): The Word document to add the template to
+
+        Returns:
+            docx.oxml.text.paragraph.CT_P: The <w:p> template element, still attached at the end
+                of the document body so clones can be inserted before it
+        """
+        error_paragraph = document.add_paragraph()
+
+        # Error number, placeholder text gives every run a <w:t> to fill in
+        error_run = error_paragraph.add_run("-")
+        error_run.font.bold = True
+        error_run.font.name = "Roboto"
+        error_run.font.size = docx.shared.Pt(11)
+
+        # Student -
+        name_run = error_paragraph.add_run("-")
+        name_run.font.bold = True
+        name_run.font.name = "Roboto"
+        name_run.font.size = docx.shared.Pt(11)
+
+        # Error message
+        error_msg_run = error_paragraph.add_run("-")
+        error_msg_run.font.name = "Roboto"
+        error_msg_run.font.size = docx.shared.Pt(11)
+        error_msg_run.font.color.rgb = docx.shared.RGBColor(
+            128, 128, 128
+        )  # Gray color
+
+        return error_paragraph._p
 
     def __generate_filename(self):
         """
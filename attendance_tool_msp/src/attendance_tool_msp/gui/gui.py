@@ -1,15 +1,20 @@
-import os, ctypes, customtkinter as ctk, subprocess, platform
+import os, ctypes, customtkinter as ctk, subprocess, platform, threading, queue
 from tkinter import filedialog, messagebox
 from PIL import Image
 
 # Import the core functionality from the parent package
 from ..processor import Processor
 from ..exporter import Exporter
+from ..cache import open_result_cache
 
 # Configure CustomTkinter
 ctk.set_appearance_mode("light")  # For Light/Gray Background Behind The Root
 
 
+class ExportCancelled(Exception):
+    """Raised from a progress callback to stop a running export."""
+
+
 class AttendanceExporterApp(ctk.CTk):
     """
     GUI application for processing CSV attendance files and exporting to Word/PDF.
@@ -18,6 +23,8 @@ class AttendanceExporterApp(ctk.CTk):
     Attributes:
         csv_file_path (str): Path to the currently selected CSV file
         report_title (str): Current title for the report being exported
+        result_cache (ResultCache): Persistent validation results, so exporting the same
+            sheet again (e.g. Word, then PDF) skips validation (None if unavailable)
 
         # UI Container Elements
         card_frame (ctk.CTkFrame): Main white card container for all UI elements
@@ -49,12 +56,20 @@ class AttendanceExporterApp(ctk.CTk):
 
         # Status Elements
         status_label (ctk.CTkLabel): Status display showing current operation state
+        cancel_button (ctk.CTkButton): Cancels the running export (shown only while exporting)
+
+        # Background Export
+        export_queue (queue.Queue): Progress messages posted by the export worker thread
+        cancel_event (threading.Event): Set to ask the export worker thread to stop
     """
 
     # Window dimensions constants
     WINDOW_WIDTH = 400
     WINDOW_HEIGHT = 650
 
+    # How often the main thread checks the export queue, in milliseconds
+    EXPORT_POLL_INTERVAL = 100
+
     def __init__(self):
         # Call the parent constructor
         super().__init__()
@@ -74,6 +89,13 @@ class AttendanceExporterApp(ctk.CTk):
         self.csv_file_path = None
         self.report_title = ""
 
+        # Only one export runs at a time, so the worker thread can use the cache directly
+        self.result_cache = open_result_cache()
+
+        # Background export state (created per export)
+        self.export_queue = None
+        self.cancel_event = None
+
         # Create the UI
         self.__create_widgets()
 
@@ -142,6 +164,9 @@ class AttendanceExporterApp(ctk.CTk):
         # Create status label
         self.__create_status_label()
 
+        # Create cancel button (hidden until an export starts)
+        self.__create_cancel_button()
+
     def __create_logo(self, assets_dir):
         """Create MSP logo with fallback handling."""
         logo_path = os.path.join(assets_dir, "msp_logo.png")
@@ -316,6 +341,22 @@ class AttendanceExporterApp(ctk.CTk):
         )
         self.status_label.pack(pady=20)  # Reduced padding
 
+    def __create_cancel_button(self):
+        """Create the cancel button, packed below the status label only while exporting."""
+        self.cancel_button = ctk.CTkButton(
+            self.card_frame,
+            text="Cancel",
+            width=90,
+            height=32,
+            font=("Arial", 12, "bold"),
+            fg_color="white",
+            hover_color="#f0f0f0",
+            text_color="#DC3545",
+            border_width=1,
+            border_color="#e0e0e0",
+            command=self.__cancel_export,
+        )
+
     def __create_word_button(self, assets_dir):
         """Create Word export button with icon and fallback handling."""
         word_path = os.path.join(assets_dir, "word_icon.png")
@@ -444,10 +485,10 @@ class AttendanceExporterApp(ctk.CTk):
 
     def __upload_file(self):
         """Handle CSV file selection dialog."""
-        #  Only CSV files shown by default (unless user switches to "All files")
+        #  Only CSV files and Excel workbooks shown by default (unless user switches to "All files")
         file_path = filedialog.askopenfilename(
             title="Select CSV File",
-            filetypes=[("CSV Files", "*.csv"), ("All files", "*.*")],
+            filetypes=[("CSV Files", "*.csv *.xlsx"), ("All files", "*.*")],
         )
 
         # If a file was selected, update the GUI's attribute for file path, and UI status label
@@ -488,69 +529,163 @@ class AttendanceExporterApp(ctk.CTk):
         self.status_label.configure(
             text=f"Status:\nExporting to {format_type}...", text_color="orange"
         )
-        self.update()  # Force GUI update
 
-        # Disable export buttons to prevent spam clicking
+        # Disable export buttons to prevent spam clicking, and offer cancelling instead
         self.__disable_export_buttons()
+        self.cancel_button.configure(state="normal")
+        self.cancel_button.pack(pady=(0, 10))
+
+        # Run the export on a worker thread so the window stays responsive.
+        # The worker never touches widgets, it only posts messages to the queue.
+        self.export_queue = queue.Queue()
+        self.cancel_event = threading.Event()
+        worker = threading.Thread(
+            target=self.__run_export,
+            args=(
+                file_type,
+                self.csv_file_path,
+                self.report_title,
+                self.result_cache,
+                self.export_queue,
+                self.cancel_event,
+            ),
+            daemon=True,  # Don't keep the process alive if the window is closed
+        )
+        worker.start()
+
+        self.after(self.EXPORT_POLL_INTERVAL, self.__poll_export_queue)
+
+    @staticmethod
+    def __run_export(
+        file_type, csv_file_path, report_title, result_cache, export_queue, cancel_event
+    ):
+        """
+        Process the CSV file and export it - runs on the export worker thread.
+
+        Posts ("progress", text), then exactly one of ("done", filename),
+        ("cancelled", None) or ("error", text) to the export queue.
+
+        Args:
+            file_type (str): Export format ('word' or 'pdf')
+            csv_file_path (str): Path to the selected CSV file
+            report_title (str): Report title, empty for the Exporter's default title
+            result_cache (ResultCache): Persistent validation result cache, or None
+            export_queue (queue.Queue): Queue polled by the main thread
+            cancel_event (threading.Event): Set by the main thread to cancel the export
+        """
 
-        # Simple 700ms delay for smoother UI experience
-        # This allows the user to see the "Exporting..." status before the export starts
-        self.after(700, lambda: self.__start_export(file_type))
+        def progress(stage, done, total):
+            # Called by Processor/Exporter between rows - the safe place to stop
+            if cancel_event.is_set():
+                raise ExportCancelled()
+
+            if stage == "validating":
+                text = f"Validating rows... {done}"
+            elif stage == "writing":
+                text = f"Writing rows... {done}/{total}"
+            elif stage == "rendering":
+                text = f"Rendering PDF... {total} rows"
+            elif stage == "converting":
+                text = "Converting to PDF..."
+            else:
+                text = "Saving document..."
+            export_queue.put(("progress", f"Status:\n{text}"))
 
-    def __start_export(self, file_type):
-        """Starts exports after UI delay."""
         try:
             # Process file
-            processor = Processor(self.csv_file_path)
-            valid_rows, invalid_rows = processor.process()
+            processor = Processor(csv_file_path, result_cache=result_cache)
+            valid_rows, invalid_rows = processor.process_records(progress=progress)
 
             # Create exporter - pass title only if user provided one
-            if self.report_title:
-                exporter = Exporter(valid_rows, invalid_rows, self.report_title)
+            if report_title:
+                exporter = Exporter(valid_rows, invalid_rows, report_title)
             else:
                 # Let Exporter use its default title by not passing the title parameter
                 exporter = Exporter(valid_rows, invalid_rows)
 
             # Export based on type
             if file_type == "word":
-                filename = exporter.export_word()
+                filename = exporter.export_word(progress)
             elif file_type == "pdf":
-                filename = exporter.export_pdf()
-
-            # Reset status to show selected file (export is complete)
-            self.__show_selected_file_status()
-
-            # Show success pop-up with filename and option to open location
-            display_filename = self.__get_display_filename(filename)
-            format_type = "Word" if file_type == "word" else "PDF"
-            result = messagebox.askyesno(
-                "Export Complete!",
-                f"Successfully exported {format_type} file:\n{display_filename}\n\nWould you like to open the file location?",
-                icon='question'
-            )
-            
-            if result:  # User clicked "Yes"
-                self.__open_exported_file_location(filename)
+                filename = exporter.export_pdf(progress=progress)
+
+            export_queue.put(("done", filename))
+
+        except ExportCancelled:
+            export_queue.put(("cancelled", None))
 
         except FileNotFoundError as e:
-            self.status_label.configure(
-                text=f"File not found:\n {str(e)}", text_color="#DC3545"
-            )
+            export_queue.put(("error", f"File not found:\n {str(e)}"))
 
         except ValueError as e:
-            self.status_label.configure(
-                text=f"Data validation error:\n {str(e)}", text_color="#DC3545"
-            )
+            export_queue.put(("error", f"Data validation error:\n {str(e)}"))
 
         except Exception as e:
+            export_queue.put(("error", f"Unexpected error:\n {str(e)}"))
+
+    def __poll_export_queue(self):
+        """Apply the export worker's messages to the UI, until the export finishes."""
+        try:
+            while True:
+                kind, payload = self.export_queue.get_nowait()
+
+                if kind == "progress":
+                    # A late progress message must not overwrite "Cancelling..."
+                    if not self.cancel_event.is_set():
+                        self.status_label.configure(text=payload, text_color="orange")
+                else:
+                    self.__finish_export(kind, payload)
+                    return
+        except queue.Empty:
+            pass
+
+        # Worker still running - check again later
+        self.after(self.EXPORT_POLL_INTERVAL, self.__poll_export_queue)
+
+    def __finish_export(self, kind, payload):
+        """
+        Restore the UI after the export worker finished, and report the result.
+
+        Args:
+            kind (str): "done", "cancelled" or "error"
+            payload (str): Exported filename for "done", error text for "error"
+        """
+        # Always re-enable export buttons, regardless of success or failure
+        self.cancel_button.pack_forget()
+        self.__enable_export_buttons()
+
+        if kind == "error":
+            self.status_label.configure(text=payload, text_color="#DC3545")
+            return
+
+        # Reset status to show selected file (export is complete or cancelled)
+        self.__show_selected_file_status()
+
+        if kind == "cancelled":
+            return
+
+        # Show success pop-up with filename and option to open location
+        filename = payload
+        display_filename = self.__get_display_filename(filename)
+        format_type = "PDF" if filename.endswith(".pdf") else "Word"
+        result = messagebox.askyesno(
+            "Export Complete!",
+            f"Successfully exported {format_type} file:\n{display_filename}\n\nWould you like to open the file location?",
+            icon='question'
+        )
+
+        if result:  # User clicked "Yes"
+            self.__open_exported_file_location(filename)
+
+    def __cancel_export(self):
+        """Ask the export worker thread to stop at its next progress report."""
+        if self.cancel_event is not None:
+            self.cancel_event.set()
+            self.cancel_button.configure(state="disabled")
             self.status_label.configure(
-                text=f"Unexpected error:\n {str(e)}", text_color="#DC3545"
+                text="Status:\nCancelling...", text_color="orange"
             )
 
-        finally:
-            # Always re-enable export buttons, regardless of success or failure
-            self.__enable_export_buttons()
-
 
 def launch_gui():
     """Launch the MSP Attendance Exporter GUI application."""
@@ -0,0 +1,41 @@
+import sys, importlib.util
+
+
+def lazy_import(name):
+    """
+    Import a module lazily: it is only executed on first attribute access.
+
+    Heavy optional dependencies (python-docx, docx2pdf) are bound at module level
+    with this function, so importing the package for validation-only work does not
+    pay for document export libraries that are never used. (The GUI imports Pillow
+    directly: customtkinter imports it anyway, and the whole GUI module is only
+    imported when the GUI is launched.)
+
+    Examples:
+        docx = lazy_import("docx")  # Nothing is loaded yet
+        docx.Document()  # python-docx is imported here
+
+    Args:
+        name (str): Absolute module name, e.g. "docx"
+
+    Returns:
+        module: The (lazily loading) module object
+
+    Raises:
+        ModuleNotFoundError: If the module is not installed
+    """
+    # Already imported (lazily or not): reuse it
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+
+    # Standard library recipe: importlib.util.LazyLoader defers exec_module until first use
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -0,0 +1,387 @@
+from xml.sax.saxutils import escape
+from reportlab.lib import colors, pagesizes
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.lib.utils import simpleSplit
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Table, TableStyle
+import os
+
+
+class PdfRenderer:
+    """
+    Native PDF rendering class for attendance reports, built on ReportLab.
+
+    Design Note:
+        Renders the same layout as the Word export (heading, blue-bordered table with
+        red invalid rows, and the validation issues log) directly from the rows,
+        without Microsoft Word. Works headless on any platform.
+        Roboto and Arial are not among the standard PDF fonts, so Helvetica is used.
+        Helvetica only covers Latin-1: when any text (e.g. an Arabic name) is outside
+        it, a Unicode TrueType font found on the system (see UNICODE_FONTS) is embedded
+        instead, so those names aren't drawn as empty boxes. Arabic letters are drawn
+        unjoined; use the Word backend for fully shaped right-to-left text.
+
+    Attributes:
+        title (str): Document title
+        valid_rows (list): Valid attendance records (AttendanceRecord)
+        invalid_rows (list): Invalid records with error messages (AttendanceRecord)
+    """
+
+    # Table header labels, matching AttendanceRecord.table_cells()
+    COLUMNS = ["Name", "ID", "Course Code", "Time", "Name of the Doctor"]
+
+    # Word's default Letter page with 1 inch margins on all sides
+    PAGE_SIZE = pagesizes.LETTER
+    MARGIN = inch
+
+    # Same cell margins as the Word table (150/360 twips = 7.5/18 points)
+    CELL_PADDING = {"top": 7.5, "left": 7.5, "bottom": 18, "right": 18}
+
+    # (regular, bold) TrueType fonts covering Arabic, Cyrillic, Greek and Hebrew, first found is used
+    UNICODE_FONTS = [
+        # Windows
+        (
+            os.path.join(os.environ.get("WINDIR", "C:\\Windows"), "Fonts", "arial.ttf"),
+            os.path.join(os.environ.get("WINDIR", "C:\\Windows"), "Fonts", "arialbd.ttf"),
+        ),
+        # macOS
+        (
+            "/System/Library/Fonts/Supplemental/Arial.ttf",
+            "/System/Library/Fonts/Supplemental/Arial Bold.ttf",
+        ),
+        ("/Library/Fonts/Arial Unicode.ttf", None),
+        # Linux (Debian/Ubuntu, Fedora, Arch)
+        (
+            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+        ),
+        (
+            "/usr/share/fonts/dejavu-sans-fonts/DejaVuSans.ttf",
+            "/usr/share/fonts/dejavu-sans-fonts/DejaVuSans-Bold.ttf",
+        ),
+        ("/usr/share/fonts/TTF/DejaVuSans.ttf", "/usr/share/fonts/TTF/DejaVuSans-Bold.ttf"),
+    ]
+
+    def __init__(self, title, valid_rows, invalid_rows):
+        """
+        Initialize the renderer with the report data.
+
+        Args:
+            title (str): Document title
+            valid_rows (list): Valid attendance records (AttendanceRecord)
+            invalid_rows (list): Invalid records with error messages (AttendanceRecord)
+        """
+        self.title = title
+        self.valid_rows = valid_rows
+        self.invalid_rows = invalid_rows
+
+        # Wrapped cell texts, keyed by (text, column width, font)
+        self._wrapped = {}
+
+        # Helvetica keeps Latin-1 reports small, other text needs an embedded font
+        # Pythonic Ternary Operator!
+        fonts = None if self.__is_latin1() else self.__register_unicode_font()
+        font, bold_font = fonts if fonts is not None else ("Helvetica", "Helvetica-Bold")
+
+        # Paragraph styles matching the Word document's fonts and colors
+        self.heading_style = ParagraphStyle(
+            "Heading", fontName=font, fontSize=21, leading=26, spaceAfter=24
+        )
+        self.cell_style = ParagraphStyle(
+            "AttendanceCell", fontName=font, fontSize=11.5, leading=14
+        )
+        self.header_cell_style = ParagraphStyle(
+            "AttendanceHeaderCell", parent=self.cell_style, fontName=bold_font
+        )
+        self.log_heading_style = ParagraphStyle(
+            "LogHeading",
+            fontName=bold_font,
+            fontSize=14,
+            leading=18,
+            textColor=colors.red,
+            spaceBefore=24,
+            spaceAfter=8,
+        )
+        self.log_entry_style = ParagraphStyle(
+            "LogEntry", fontName=font, fontSize=11, leading=14, spaceAfter=8
+        )
+
+    def render(self, output):
+        """
+        Render the report as a PDF.
+
+        Args:
+            output (str or file-like): Destination file path or binary stream
+
+        Returns:
+            None: The PDF is written to output
+        """
+        document = SimpleDocTemplate(
+            output,
+            pagesize=self.PAGE_SIZE,
+            topMargin=self.MARGIN,
+            bottomMargin=self.MARGIN,
+            leftMargin=self.MARGIN,
+            rightMargin=self.MARGIN,
+            title=self.title,
+        )
+
+        heading = Paragraph(escape(self.title), self.heading_style)
+        story = [heading]
+
+        # Usable frame height (the default frame has 6pt padding on each side)
+        page_height = document.height - 12
+        _, heading_height = heading.wrap(document.width, page_height)
+        first_page_height = page_height - heading_height - self.heading_style.spaceAfter
+
+        story.extend(
+            self.__create_attendance_tables(
+                document.width - 12, first_page_height, page_height
+            )
+        )
+
+        # Add error log section if there are invalid rows
+        if self.invalid_rows:
+            story.extend(self.__create_error_log())
+
+        document.build(story)
+
+    def __is_latin1(self):
+        """
+        Helper method for rendering - Check whether every text of the report is Latin-1.
+
+        Returns:
+            bool: True if Helvetica can draw the whole report
+        """
+        def texts():
+            yield self.title
+            for records in (self.valid_rows, self.invalid_rows):
+                for record in records:
+                    yield from record.table_cells()
+                    yield record.error
+
+        try:
+            for text in texts():
+                if text and not text.isascii():
+                    text.encode("latin-1")
+        except UnicodeEncodeError:
+            return False
+        return True
+
+    @classmethod
+    def __register_unicode_font(cls):
+        """
+        Helper method for rendering - Register the first available font of UNICODE_FONTS.
+
+        Returns:
+            tuple: (regular, bold) registered font names, or None if no font was found
+                (Helvetica is then used, drawing unsupported characters as boxes)
+        """
+        for regular_path, bold_path in cls.UNICODE_FONTS:
+            if not os.path.isfile(regular_path):
+                continue
+            # Fonts are registered globally in ReportLab, once per process
+            name = f"AttendanceUnicode-{os.path.basename(regular_path)}"
+            bold_name = f"{name}-Bold"
+            if bold_name not in pdfmetrics.getRegisteredFontNames():
+                try:
+                    pdfmetrics.registerFont(TTFont(name, regular_path))
+                    # Use the regular font for bold text if there is no bold variant
+                    # Pythonic Ternary Operator!
+                    bold_file = bold_path if bold_path and os.path.isfile(bold_path) else regular_path
+                    pdfmetrics.registerFont(TTFont(bold_name, bold_file))
+                except Exception:
+                    continue  # Unreadable or unsupported font file, try the next one
+                # Lets <b> markup in the issues log switch to the bold font
+                pdfmetrics.registerFontFamily(
+                    name, normal=name, bold=bold_name, italic=name, boldItalic=bold_name
+                )
+            return name, bold_name
+        return None
+
+    def __create_attendance_tables(self, available_width, first_page_height, page_height):
+        """
+        Helper method for rendering - Create the attendance table, one table per page.
+
+        Cell text is wrapped up front so every row height is known exactly. Rows are then
+        split into page-sized tables, each starting with the header row. This gives the
+        same result as one long table with a repeating header, but avoids ReportLab
+        re-measuring the remaining rows at every page break.
+
+        Args:
+            available_width (float): Width of the page frame, in points
+            first_page_height (float): Height left on the first page below the heading
+            page_height (float): Height of the page frame on following pages
+
+        Returns:
+            list: Table flowables in page order
+        """
+        # Word lays the table out with equal cell widths across the page, do the same
+        column_widths = [available_width / len(self.COLUMNS)] * len(self.COLUMNS)
+
+        header, header_height = self.__wrap_row(self.COLUMNS, column_widths, bold=True)
+
+        # Valid rows first, then invalid rows (in red)
+        rows = []
+        for records, invalid in ((self.valid_rows, False), (self.invalid_rows, True)):
+            for record in records:
+                texts = [text or "" for text in record.table_cells()]
+                cells, height = self.__wrap_row(texts, column_widths)
+                rows.append((cells, height, invalid))
+
+        # Greedily fill each page, the header row repeats on every page
+        tables = []
+        chunk = []
+        space_left = first_page_height - header_height
+        for row in rows:
+            if chunk and row[1] > space_left:
+                tables.append(self.__create_table(header, header_height, chunk, column_widths))
+                chunk = []
+                space_left = page_height - header_height
+            chunk.append(row)
+            space_left -= row[1]
+
+        # Always emit at least the header row, even without data
+        tables.append(self.__create_table(header, header_height, chunk, column_widths))
+        return tables
+
+    def __wrap_row(self, texts, column_widths, bold=False):
+        """
+        Helper method for rendering - Wrap each cell's text to its column width.
+
+        Args:
+            texts (list): Cell texts in column order
+            column_widths (list): Column widths, in points
+            bold (bool): Whether the row is rendered in the bold header font
+
+        Returns:
+            tuple: (cells, height) where cells are the wrapped texts joined with newlines
+                and height is the row height in points
+        """
+        font = self.header_cell_style.fontName if bold else self.cell_style.fontName
+        size = self.cell_style.fontSize
+        padding = self.CELL_PADDING["left"] + self.CELL_PADDING["right"]
+
+        cells = []
+        lines = 1
+        for text, width in zip(texts, column_widths):
+            # Course codes, times and instructors repeat a lot, wrap each value once
+            key = (text, width, font)
+            if key not in self._wrapped:
+                wrapped = self.__split_text(text, font, size, width - padding)
+                self._wrapped[key] = ("\n".join(wrapped), len(wrapped))
+            cell, cell_lines = self._wrapped[key]
+            lines = max(lines, cell_lines)
+            cells.append(cell)
+
+        height = (
+            lines * self.cell_style.leading
+            + self.CELL_PADDING["top"]
+            + self.CELL_PADDING["bottom"]
+        )
+        return cells, height
+
+    def __split_text(self, text, font, size, width):
+        """
+        Helper method for rendering - Split text into lines that fit the given width.
+        Breaks on spaces first, then mid-word for words too long for a single line
+        (e.g. long course codes), like Word does.
+
+        Args:
+            text (str): The text to split
+            font (str): Font name
+            size (float): Font size, in points
+            width (float): Maximum line width, in points
+
+        Returns:
+            list: The text lines
+        """
+        lines = []
+        for line in simpleSplit(text, font, size, width):
+            # Greedily break lines that are still too wide, one character at a time
+            while stringWidth(line, font, size) > width and len(line) > 1:
+                end = len(line) - 1
+                while end > 1 and stringWidth(line[:end], font, size) > width:
+                    end -= 1
+                lines.append(line[:end])
+                line = line[end:]
+            lines.append(line)
+        return lines
+
+    def __create_table(self, header, header_height, rows, column_widths):
+        """
+        Helper method for rendering - Create one page of the blue-bordered attendance table.
+
+        Args:
+            header (list): Wrapped header cell texts
+            header_height (float): Header row height, in points
+            rows (list): (cells, height, invalid) tuples for the data rows
+            column_widths (list): Column widths, in points
+
+        Returns:
+            reportlab.platypus.Table: The styled table flowable
+        """
+        data = [header] + [cells for cells, _, _ in rows]
+        row_heights = [header_height] + [height for _, height, _ in rows]
+
+        commands = [
+            ("GRID", (0, 0), (-1, -1), 0.5, colors.blue),
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("FONT", (0, 0), (-1, -1), self.cell_style.fontName,
+             self.cell_style.fontSize, self.cell_style.leading),
+            ("FONT", (0, 0), (-1, 0), self.header_cell_style.fontName,
+             self.cell_style.fontSize, self.cell_style.leading),
+            ("TOPPADDING", (0, 0), (-1, -1), self.CELL_PADDING["top"]),
+            ("LEFTPADDING", (0, 0), (-1, -1), self.CELL_PADDING["left"]),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), self.CELL_PADDING["bottom"]),
+            ("RIGHTPADDING", (0, 0), (-1, -1), self.CELL_PADDING["right"]),
+        ]
+
+        # Invalid rows always come last, color them red from the first one onwards
+        for index, (_, _, invalid) in enumerate(rows, 1):
+            if invalid:
+                commands.append(("TEXTCOLOR", (0, index), (-1, -1), colors.red))
+                break
+
+        # repeatRows=1 keeps the header if a table still has to be split
+        return Table(
+            data,
+            colWidths=column_widths,
+            rowHeights=row_heights,
+            repeatRows=1,
+            style=TableStyle(commands),
+        )
+
+    def __create_error_log(self):
+        """
+        Helper method for rendering - Create the validation issues log section.
+
+        Returns:
+            list: Flowables for the log heading and one paragraph per error
+        """
+        flowables = [Paragraph("Validation Issues Log:", self.log_heading_style)]
+
+        for i, record in enumerate(self.invalid_rows, 1):
+            if record.error:
+                # Add student identifier (name or ID)
+                student_name = record.full_name or ""
+                if not student_name.strip():
+                    # Default value 'Unknown'
+                    if record.university_id:
+                        student_name = f"Student with ID: {record.university_id}"
+                    else:
+                        student_name = "Unknown Student"
+
+                # Bold number and student, gray error message
+                flowables.append(
+                    Paragraph(
+                        f"<b>{i}. {escape(student_name)} - </b>"
+                        f'<font color="#808080">{escape(record.error)}</font>',
+                        self.log_entry_style,
+                    )
+                )
+
+        return flowables
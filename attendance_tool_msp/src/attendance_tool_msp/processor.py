@@ -1,5 +1,68 @@
-import os, csv, re, validators
+import os, io, csv, re, json, time, hashlib, validators
+from functools import lru_cache
 from datetime import datetime
+from collections import deque
+from .cache import LRUCache
+from .profiling import Profile, profile_stage
+from .reader import (
+    MappedCsv,
+    MAX_CHUNK_BYTES,
+    SNIFF_BYTES,
+    sniff,
+    open_text,
+    byte_splittable,
+    newline_terminated,
+)
+from .record import AttendanceRecord, AttendanceBatch
+
+# Validator table: regular expressions and constants are compiled/built once at import time
+# instead of being re-parsed (or re-allocated) on every validated row
+NAME_PATTERN = re.compile(r"^[a-zA-Z\s'-]+$")
+COURSE_CODE_PATTERN = re.compile(r"^[A-Z]{3,}[0-9]{3,}[A-Z0-9\s\-()]*$", re.IGNORECASE)
+COURSE_TIME_PATTERN = re.compile(
+    r"^([1-9]|1[0-2])(:[0-5][0-9])?\s*(-|to)\s*([1-9]|1[0-2])(:[0-5][0-9])?$"
+)
+DR_TA_NAME_PATTERN = re.compile(r"^[a-zA-Z\s'.\-()]+$")
+
+# Common email local parts: dot-separated atoms of ASCII letters, digits, "_", "+" and "-"
+# Every match is also accepted by validators.email(), so it is checked first (see validate_email)
+EMAIL_LOCAL_PART_PATTERN = re.compile(r"[A-Za-z0-9_+-]+(?:\.[A-Za-z0-9_+-]+)*")
+
+# Default university email domains accepted by Processor.validate_email() (see Processor.email_domains)
+EMAIL_DOMAINS = ("miuegypt.edu.eg",)
+
+# Title detection (search on the lowercased name) and replacement (case-insensitive) patterns
+DOCTOR_TITLE_PATTERN = re.compile(r"\b(doctor|dr)\b")
+DOCTOR_TITLE_REPLACE_PATTERN = re.compile(r"\b(doctor|dr\.?)\b", re.IGNORECASE)
+PROFESSOR_TITLE_PATTERN = re.compile(r"\b(professor|prof)\b")
+PROFESSOR_TITLE_REPLACE_PATTERN = re.compile(r"\b(professor|prof\.?)\b", re.IGNORECASE)
+TA_TITLE_PATTERN = re.compile(r"\bta\b")
+TA_TITLE_REPLACE_PATTERN = re.compile(r"\bta\.?\b", re.IGNORECASE)
+
+# Number of rows between two progress callback invocations
+PROGRESS_INTERVAL = 500
+
+# Columns identifying one student's attendance of one session, used to detect duplicate submissions
+DEDUPE_COLUMNS = ("University ID", "Course Code", "Course Time")
+
+# Google Forms timestamp format, e.g. 3/12/2025 09:15:10
+TIMESTAMP_FORMAT = "%m/%d/%Y %H:%M:%S"
+
+# Version of the validation rules and error messages, part of the persistent result cache key
+# Bump it whenever a validator changes, so results cached by the previous rules are not reused
+VALIDATOR_VERSION = 1
+
+# Format version of process_incremental() checkpoint files, older checkpoints trigger a full pass
+CHECKPOINT_VERSION = 2
+
+# Validation engines: "scalar" validates row by row, "vectorized" column by column with NumPy,
+# "auto" picks "vectorized" when NumPy is installed
+ENGINES = ("scalar", "vectorized", "auto")
+
+# Titles that are not accepted on their own as an instructor name
+INCOMPLETE_TITLES = frozenset(
+    ["dr", "prof", "ta", "professor", "doctor", "dr.", "prof.", "ta."]
+)
 
 
 # File Name: Small Title, Class Name: Capitalized
@@ -14,23 +77,73 @@ class Processor:
         creating processor instances and are expected to be used for testing
         and reuse, outputting expected results.
 
+        Columns with few distinct values (Course Code, Course Time, Doctor/TA Name)
+        are validated through a per-instance LRU cache, so repeated values skip
+        the regex and title-normalization pipeline.
+
+        The optional "vectorized" engine validates batches of rows column by column with
+        NumPy masks and only runs the scalar validators on values that need normalization
+        or an error message. Its results are identical to the scalar engine's.
+
     Attributes:
         file_path (str): Path to the CSV file to process
+        cache_size (int): Maximum number of cached validator results (0 disables caching)
+        cache_hits (int): Number of validations answered from the cache
+        cache_misses (int): Number of validations that ran the validator
+        profile (Profile): Instrumentation collector, None when profiling is disabled
+        engine (str): Validation engine, "scalar", "vectorized" or "auto"
+        email_domains (tuple): Allowed 'University Email' domains
     """
 
-    # Constructor With a single property: file path
-    def __init__(self, file_path):
+    # Constructor with the file path and the validator cache size
+    def __init__(
+        self,
+        file_path,
+        cache_size=1024,
+        dedupe=None,
+        result_cache=None,
+        profile=None,
+        engine="scalar",
+        email_domains=None,
+    ):
         """
         Initialize the Processor with CSV file path.
 
         Args:
-            file_path (str): Path to the CSV file to process
-            
+            file_path (str): Path to the CSV file (or .xlsx workbook) to process
+            cache_size (int, optional): Maximum number of cached validator results.
+                Defaults to 1024, use 0 to disable caching
+            dedupe (str, optional): Keep only the "first" or "latest" submission of each
+                (University ID, Course Code, Course Time). Defaults to None (keep duplicates)
+            result_cache (ResultCache, optional): On-disk cache of whole-file results used by
+                process(), process_records() and process_batch(). Defaults to None (no cache)
+            profile (Profile, optional): Collects stage timings, row counters and per-validator
+                timings/failures of process(), process_records() and process_batch().
+                Defaults to None (no instrumentation overhead)
+            engine (str, optional): "scalar", "vectorized" (requires NumPy) or "auto"
+                (vectorized when NumPy is installed). Profiled runs always use the scalar
+                engine, which times every validator call. Defaults to "scalar"
+            email_domains (iterable, optional): Allowed 'University Email' domains, passed
+                explicitly to worker processes. Defaults to None (EMAIL_DOMAINS)
+
         Raises:
             FileNotFoundError: If file does not exist
-            ValueError: If file is not a CSV file
+            ModuleNotFoundError: If engine is "vectorized" and NumPy is not installed
+            ValueError: If file is not a CSV file or an .xlsx workbook, cache_size is not a
+                non-negative integer, dedupe is not None, "first" or "latest", engine is unknown,
+                or email_domains is empty or not a collection of domain names
         """
         self.file_path = file_path
+        self.dedupe = dedupe
+        self.engine = engine
+        self.email_domains = email_domains
+        self.result_cache = result_cache
+        self.profile = profile
+
+        if not isinstance(cache_size, int) or cache_size < 0:
+            raise ValueError("Cache size must be a non-negative integer")
+        self.cache_size = cache_size
+        self._cache = LRUCache(cache_size) if cache_size else None
 
     # Getter
     @property
@@ -50,23 +163,162 @@ class Processor:
         Set CSV file path with validation.
 
         Args:
-            file_path (str): Path to the CSV file to process
+            file_path (str): Path to the CSV file (or .xlsx workbook) to process
 
         Returns:
             None: This setter does not return a value
 
         Raises:
             FileNotFoundError: If file does not exist
-            ValueError: If file is not a CSV file
+            ValueError: If file is not a CSV file or an Excel workbook
         """
         # Check if file exists first
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"The file '{file_path}' does not exist.")
-        # Then check it's a csv file
-        if not file_path.endswith(".csv"):
-            raise ValueError(f"The file '{file_path}' is not a .csv file")
+        # Then check it's a csv file (or an Excel workbook, read from its first sheet)
+        if not file_path.endswith((".csv", ".xlsx")):
+            raise ValueError(f"The file '{file_path}' is not a .csv or .xlsx file")
         self._file_path = file_path
 
+    # Getter for dedupe
+    @property
+    def dedupe(self):
+        """
+        Get the duplicate submission policy.
+
+        Returns:
+            str: "first", "latest" or None when duplicates are kept
+        """
+        return self._dedupe
+
+    # Setter for dedupe
+    @dedupe.setter
+    def dedupe(self, dedupe):
+        """
+        Set the duplicate submission policy with validation.
+
+        Args:
+            dedupe (str): "first", "latest" or None to keep duplicates
+
+        Returns:
+            None: This setter does not return a value
+
+        Raises:
+            ValueError: If dedupe is not None, "first" or "latest"
+        """
+        if dedupe not in (None, "first", "latest"):
+            raise ValueError('Dedupe must be None, "first" or "latest"')
+        self._dedupe = dedupe
+
+    # Getter for engine
+    @property
+    def engine(self):
+        """
+        Get the validation engine.
+
+        Returns:
+            str: "scalar", "vectorized" or "auto"
+        """
+        return self._engine
+
+    # Setter for engine
+    @engine.setter
+    def engine(self, engine):
+        """
+        Set the validation engine with validation.
+
+        Args:
+            engine (str): "scalar", "vectorized" or "auto"
+
+        Returns:
+            None: This setter does not return a value
+
+        Raises:
+            ModuleNotFoundError: If engine is "vectorized" and NumPy is not installed
+            ValueError: If engine is not "scalar", "vectorized" or "auto"
+        """
+        if engine not in ENGINES:
+            raise ValueError('Engine must be "scalar", "vectorized" or "auto"')
+
+        # Resolved once, "auto" falls back to the scalar engine without NumPy
+        vectorize = False
+        if engine != "scalar":
+            # Imported here, NumPy is only loaded when the vectorized engine may be used
+            from . import vectorized
+
+            vectorize = vectorized.available()
+            if engine == "vectorized" and not vectorize:
+                raise ModuleNotFoundError(
+                    'The vectorized engine requires NumPy: pip install "attendance-tool-msp[fast]"'
+                )
+
+        self._engine = engine
+        self._vectorize = vectorize
+
+    # Getter for email domains
+    @property
+    def email_domains(self):
+        """
+        Get the allowed 'University Email' domains.
+
+        Returns:
+            tuple: Domain names, e.g. ("miuegypt.edu.eg",)
+        """
+        return self._email_domains
+
+    # Setter for email domains
+    @email_domains.setter
+    def email_domains(self, email_domains):
+        """
+        Set the allowed 'University Email' domains with validation.
+
+        Resolved here, in the calling process: worker processes get the tuple as an
+        argument, so a changed EMAIL_DOMAINS default also applies to process(workers=N).
+
+        Args:
+            email_domains (iterable): Domain names, None for the EMAIL_DOMAINS default
+
+        Returns:
+            None: This setter does not return a value
+
+        Raises:
+            ValueError: If email_domains is empty or not a collection of domain names
+        """
+        if email_domains is None:
+            email_domains = EMAIL_DOMAINS
+        # A single string would be split into characters
+        if isinstance(email_domains, str):
+            raise ValueError("Email domains must be a collection of domain names, not a string")
+
+        email_domains = tuple(email_domains)
+        if not email_domains or not all(
+            isinstance(domain, str) and domain.strip() for domain in email_domains
+        ):
+            raise ValueError("Email domains must be a non-empty collection of domain names")
+        self._email_domains = email_domains
+
+    # Getter for cache hits
+    @property
+    def cache_hits(self):
+        """
+        Get the number of validations answered from the cache.
+
+        Returns:
+            int: Cache hit count (0 if caching is disabled)
+        """
+        return self._cache.hits if self._cache is not None else 0
+
+    # Getter for cache misses
+    @property
+    def cache_misses(self):
+        """
+        Get the number of validations that had to run the validator.
+
+        Returns:
+            int: Cache miss count (0 if caching is disabled)
+        """
+        return self._cache.misses if self._cache is not None else 0
+
     def __str__(self):
         """
         Returns string representation of CSV data for debugging.
@@ -79,9 +331,8 @@ class Processor:
             FileNotFoundError: If CSV file cannot be opened
         """
         try:
-            with open(self.file_path) as file:
-                reader = csv.DictReader(file)
-
+            file, reader = self.__open_reader()
+            with file:
                 rows = []
                 for row in reader:
                     rows.append(str(row))
@@ -94,68 +345,626 @@ class Processor:
         except FileNotFoundError:
             raise FileNotFoundError(f"Unable to open file: {self.file_path}")
 
-    def process(self):
+    def iter_rows(self):
+        """
+        Lazily validates the CSV file, yielding one row at a time.
+        Only the current row is held in memory, so arbitrarily large exports can be
+        streamed with constant memory usage.
+
+        With dedupe set, duplicate submissions of valid rows are yielded with a
+        "Duplicate submission" error. Only an index of the duplicate keys is kept,
+        not the rows; "latest" reads the file twice to find the latest submissions.
+
+        Yields:
+            tuple: (row, error) where row is the (normalized) row dictionary and
+                error is None for valid rows or the validation error message (str)
+
+        Raises:
+            FileNotFoundError: If CSV file cannot be opened
+            ValueError: If CSV headers are invalid or missing
+        """
+        yield from self.__iter_rows(1)
+
+    def __read_rows(self):
+        """
+        Helper method for processing - Validate the CSV file serially.
+
+        Yields:
+            tuple: (row, error) in file order
+
+        Raises:
+            FileNotFoundError: If CSV file cannot be opened
+            ValueError: If CSV headers are invalid or missing
+        """
+        try:
+            file, reader = self.__open_reader()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Unable to open file: {self.file_path}")
+
+        with file:
+            # Strip whitespace from field names, to avoid headers like 'Full Name  '
+            if reader.fieldnames:
+                reader.fieldnames = [field.strip() for field in reader.fieldnames]
+
+            # Validate CSV structure first - To Avoid KeyError
+            try:
+                Processor.validate_csv_headers(reader.fieldnames)
+            except ValueError as error:
+                raise ValueError(f"CSV validation failed: {error}")
+
+            # Only validate email if the column exists in CSV headers
+            has_email = "University Email" in reader.fieldnames
+
+            yield from _validate_rows(
+                reader, has_email, self._cache, self.profile, self._vectorize, self.email_domains
+            )
+
+    def __open_reader(self):
+        """
+        Helper method for processing - Open the file as a stream of row dictionaries.
+
+        CSV files are decoded with their sniffed encoding and delimiter (byte order mark,
+        ";" separated Excel exports...). Excel workbooks are streamed from their first sheet.
+
+        Returns:
+            tuple: (file, reader) where file closes the input and reader yields row dictionaries
+
+        Raises:
+            FileNotFoundError: If the file cannot be opened
+            ValueError: If an .xlsx file is not a valid workbook
+        """
+        if self.file_path.endswith(".xlsx"):
+            # Imported here, the zip and XML parsers are only needed for Excel workbooks
+            from .xlsx_reader import XlsxReader
+
+            reader = XlsxReader(self.file_path)
+            return reader, reader
+
+        file, delimiter = open_text(self.file_path)
+        return file, csv.DictReader(file, delimiter=delimiter)
+
+    def iter_records(self):
+        """
+        Lazily validates the CSV file, yielding one compact AttendanceRecord at a time.
+
+        Yields:
+            AttendanceRecord: Record with error None for valid rows, or the validation error message
+
+        Raises:
+            FileNotFoundError: If CSV file cannot be opened
+            ValueError: If CSV headers are invalid or missing
+        """
+        for row, error in self.iter_rows():
+            yield AttendanceRecord.from_row(row, error)
+
+    def process(self, workers=1, progress=None):
         """
         Validates CSV file and returns valid and invalid data.
+        Built on top of iter_rows(), collecting the streamed rows into lists.
+
+        With workers > 1 the file is split into byte-range chunks on line boundaries
+        which are validated in a process pool. Chunks are merged back in their
+        original order, so the output is identical to the serial path.
+
+        Args:
+            workers (int, optional): Number of worker processes. Defaults to 1 (serial)
+            progress (callable, optional): Called as progress("validating", done, None)
+                every PROGRESS_INTERVAL rows and once at the end. Exceptions raised
+                by the callback propagate, which lets callers cancel processing
 
         Returns:
             tuple: (valid_rows, invalid_rows) as lists of dictionaries
 
+        Raises:
+            FileNotFoundError: If CSV file cannot be opened
+            ValueError: If CSV headers are invalid or missing, or workers is not a positive integer
+        """
+        return _partition_rows(self.__iter_validated(workers, progress))
+
+    def process_incremental(self, checkpoint_path=None):
+        """
+        Validates only the rows appended since the last call and merges them with the previous results.
+        Meant for append-only exports (e.g. a Google Forms CSV re-downloaded during a session).
+
+        A JSON Lines checkpoint beside the CSV file stores the settings the results depend on
+        (header line hash, VALIDATOR_VERSION, the current year and the email allow-list), the
+        validated rows, and after them the byte offset processed so far with the SHA-256 hash
+        of every byte before it. New rows and offsets are appended, so a call only serializes
+        the rows it validated; the stored rows are still read back, as they are returned. If the
+        checkpoint is missing, unreadable or written with other settings, or already processed
+        rows changed, the whole file is validated again and the checkpoint rewritten.
+
+        Rows are validated with the same engine and profiling as process() (the profile counts
+        the newly validated rows). The checkpoint takes the place of result_cache, which is
+        not used here. Files whose rows can't be found by byte offset (.xlsx workbooks, UTF-16
+        encoded files, bare \\r line endings) are fully validated by process() instead.
+
+        Args:
+            checkpoint_path (str, optional): Checkpoint file path. Defaults to "<file_path>.checkpoint.jsonl"
+
+        Returns:
+            tuple: (valid_rows, invalid_rows) as lists of dictionaries, same as process()
+
         Raises:
             FileNotFoundError: If CSV file cannot be opened
             ValueError: If CSV headers are invalid or missing
+            OSError: If the checkpoint file cannot be written
         """
+        if checkpoint_path is None:
+            checkpoint_path = f"{self.file_path}.checkpoint.jsonl"
+
+        # Workbooks are zip archives, appended rows can't be read from a byte offset
+        if self.file_path.endswith(".xlsx"):
+            return self.process()
+
         try:
-            with open(self.file_path) as file:
-                reader = csv.DictReader(file)
+            file = open(self.file_path, "rb")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Unable to open file: {self.file_path}")
 
-                # Strip whitespace from field names, to avoid headers like 'Full Name  '
-                if reader.fieldnames:
-                    reader.fieldnames = [field.strip() for field in reader.fieldnames]
+        with file:
+            sample = file.peek(SNIFF_BYTES)[:SNIFF_BYTES]
+            encoding, delimiter = sniff(sample)
+            if not byte_splittable(encoding) or not newline_terminated(sample):
+                # Byte offsets can't be resumed in UTF-16 files, nor lines found in
+                # files with bare \r line endings: validate everything
+                return self.process()
+
+            header_line = file.readline()
+            file.seek(0)
+            fieldnames = Processor.__read_header(file, encoding, delimiter)
+            data_start = file.tell()
+            file_size = os.path.getsize(self.file_path)
+
+            # Same inputs as the result cache key: results of other rules, years
+            # (student ID years are checked against it) or allow-lists are not reused
+            settings = {
+                "version": CHECKPOINT_VERSION,
+                "validator_version": VALIDATOR_VERSION,
+                "year": datetime.now().year,
+                "email_domains": list(self.email_domains),
+                "header_sha256": hashlib.sha256(header_line).hexdigest(),
+                "fieldnames": fieldnames,
+            }
+            checkpoint = _load_checkpoint(checkpoint_path, settings)
+            if checkpoint is not None and data_start <= checkpoint["offset"] <= file_size:
+                offset = checkpoint["offset"]
+            else:
+                offset = 0
+
+            # One running hash: first up to the checkpoint's offset, then up to the end of the file
+            digest = hashlib.sha256()
+            _update_hash(digest, file, 0, offset)
+
+            # Only resume if the already processed part of the file is unchanged
+            # Rows are stored as [values, error] pairs, the field names are only stored once
+            if offset and digest.hexdigest() == checkpoint["prefix_sha256"]:
+                stored_rows = checkpoint["rows"]
+                start = offset
+            else:
+                checkpoint = None
+                stored_rows = []
+                start = data_start
+
+            _update_hash(digest, file, offset, file_size)
+            prefix_hash = digest.hexdigest()
+
+        # Validate the new tail (or the whole file) like one parallel chunk
+        results = self.__validate_range(fieldnames, start, file_size, encoding, delimiter)
+        rows = [
+            (_row_from_values(fieldnames, values), error) for values, error in stored_rows
+        ]
+        rows.extend(results)
 
-                # Validate CSV structure first - To Avoid KeyError
-                Processor.validate_csv_headers(reader.fieldnames)
+        # Checkpoint before the results are modified ("error" keys, dedupe)
+        new_rows = [[list(row.values()), error] for row, error in results]
+        commit = {"offset": file_size, "prefix_sha256": prefix_hash}
+        if checkpoint is None:
+            _save_checkpoint(checkpoint_path, settings, new_rows, commit)
+        else:
+            _append_checkpoint(checkpoint_path, checkpoint["length"], new_rows, commit)
 
-                valid_rows = []
-                invalid_rows = []
-                for row in reader:
-                    try:
-                        # Only validate email if the column exists in CSV headers
-                        if "University Email" in reader.fieldnames:
-                            Processor.validate_email(row["University Email"])
-
-                        # Validate Required Columns
-                        row["Full Name"] = Processor.validate_name(
-                            row["Full Name"]
-                        )  # Normalize student name
-                        row["University ID"] = Processor.validate_university_id(
-                            row["University ID"]
-                        )  # Normalize and validate student ID
-                        row["Course Code"] = Processor.validate_course_code(
-                            row["Course Code"]
-                        )  # Normalize course code to uppercase
-                        row["Course Time"] = Processor.validate_course_time(
-                            row["Course Time"]
-                        )  # Normalize course time format
-                        row["Doctor/TA Name"] = Processor.validate_dr_ta_name(
-                            row["Doctor/TA Name"]
-                        )  # Normalize instructor name
-
-                        # Append valid row if all validations pass
-                        valid_rows.append(row)
-                    except (ValueError, validators.ValidationError) as error:
-                        # Capture the error message
-                        row["error"] = str(error)  # Add error message to the row
-                        invalid_rows.append(row)
-
-                # Return a tuple of dictionaries
-                return (valid_rows, invalid_rows)
+        # Dedupe runs on the merged results, a new submission may replace an older one
+        pairs = rows
+        if self.dedupe is not None:
+            pairs = _dedupe_rows(lambda: iter(rows), self.dedupe)
+        return _partition_rows(pairs)
+
+    def __validate_range(self, fieldnames, start, end, encoding, delimiter):
+        """
+        Helper method for incremental processing - Validate a byte range in this process.
+
+        Uses the worker functions of the parallel path, so the engine, the email allow-list,
+        cache counters and profiling apply exactly like in process().
 
+        Args:
+            fieldnames (list): Stripped CSV headers
+            start (int): Byte offset of the first row
+            end (int): Byte offset just after the last row
+            encoding (str): File encoding, None for the platform default
+            delimiter (str): Field delimiter
+
+        Returns:
+            list: (row, error) pairs in file order
+        """
+        profile = self.profile
+        # Pythonic Ternary Operator!
+        validate_chunk = _profile_chunk if profile is not None else _validate_chunk
+
+        def validate():
+            chunk = validate_chunk(
+                self.file_path,
+                fieldnames,
+                start,
+                end,
+                self.cache_size,
+                vectorize=self._vectorize,
+                encoding=encoding,
+                delimiter=delimiter,
+                email_domains=self.email_domains,
+            )
+            yield from self.__collect_chunk(chunk)
+
+        rows = validate()
+        if profile is not None:
+            rows = self.__iter_profiled(rows)
+        with profile_stage(profile, "processing"):
+            return list(rows)
+
+    def process_records(self, workers=1, progress=None):
+        """
+        Validates CSV file and returns valid and invalid data as AttendanceRecord objects.
+        Same as process(), but each row is kept as a compact record instead of its
+        csv.DictReader dictionary, which uses several times less memory on large sheets.
+
+        Args:
+            workers (int, optional): Number of worker processes. Defaults to 1 (serial)
+            progress (callable, optional): Same as for process()
+
+        Returns:
+            tuple: (valid_records, invalid_records) as lists of AttendanceRecord
+
+        Raises:
+            FileNotFoundError: If CSV file cannot be opened
+            ValueError: If CSV headers are invalid or missing, or workers is not a positive integer
+        """
+        valid_records = []
+        invalid_records = []
+        for row, error in self.__iter_validated(workers, progress):
+            record = AttendanceRecord.from_row(row, error)
+            # Pythonic Ternary Operator!
+            (valid_records if error is None else invalid_records).append(record)
+
+        return (valid_records, invalid_records)
+
+    def process_batch(self, workers=1, progress=None):
+        """
+        Validates CSV file and returns valid and invalid data as columnar AttendanceBatch objects.
+        Repeated values (course code, course time, doctor/TA name...) are stored once per
+        batch, and rows are kept as integer codes - suited for very large or aggregated sheets.
+
+        Args:
+            workers (int, optional): Number of worker processes. Defaults to 1 (serial)
+            progress (callable, optional): Same as for process()
+
+        Returns:
+            tuple: (valid_batch, invalid_batch) as AttendanceBatch objects
+
+        Raises:
+            FileNotFoundError: If CSV file cannot be opened
+            ValueError: If CSV headers are invalid or missing, or workers is not a positive integer
+        """
+        valid_batch = AttendanceBatch()
+        invalid_batch = AttendanceBatch()
+        for row, error in self.__iter_validated(workers, progress):
+            record = AttendanceRecord.from_row(row, error)
+            # Pythonic Ternary Operator!
+            (valid_batch if error is None else invalid_batch).append(record)
+
+        return (valid_batch, invalid_batch)
+
+    def __iter_validated(self, workers, progress):
+        """
+        Helper method for processing - Stream (row, error) pairs from the serial or parallel path.
+
+        Args:
+            workers (int): Number of worker processes, 1 validates in this process
+            progress (callable): Optional progress callback, see process()
+
+        Yields:
+            tuple: (row, error) in file order
+
+        Raises:
+            ValueError: If workers is not a positive integer
+        """
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("Workers must be a positive integer")
+
+        rows = self.__iter_rows(workers)
+        if self.result_cache is not None:
+            rows = self.__iter_cached(rows)
+
+        profile = self.profile
+        if profile is not None:
+            rows = self.__iter_profiled(rows)
+
+        count = 0
+        with profile_stage(profile, "processing"):
+            for count, item in enumerate(rows, 1):
+                yield item
+                if progress and count % PROGRESS_INTERVAL == 0:
+                    progress("validating", count, None)
+
+        if progress:
+            progress("validating", count, None)
+
+    def __iter_profiled(self, rows):
+        """
+        Helper method for profiling - Count rows and validator cache use while streaming them.
+
+        Args:
+            rows (iterator): (row, error) pairs
+
+        Yields:
+            tuple: The same (row, error) pairs
+        """
+        profile = self.profile
+        hits, misses = self.cache_hits, self.cache_misses
+
+        valid = invalid = 0
+        for row, error in rows:
+            if error is None:
+                valid += 1
+            else:
+                invalid += 1
+            yield row, error
+
+        profile.count("rows", valid + invalid)
+        profile.count("valid_rows", valid)
+        profile.count("invalid_rows", invalid)
+        if self._cache is not None:
+            profile.count("validator_cache_hits", self.cache_hits - hits)
+            profile.count("validator_cache_misses", self.cache_misses - misses)
+
+    def __iter_cached(self, rows):
+        """
+        Helper method for processing - Replay results from the persistent result cache, or store them.
+
+        The key covers the file content, VALIDATOR_VERSION, the current year (student ID
+        years are checked against it), the dedupe policy and the allowed email domains.
+        A cache hit skips reading and validating the CSV file entirely.
+
+        Args:
+            rows (iterator): (row, error) pairs, only consumed on a cache miss
+
+        Yields:
+            tuple: (row, error) in file order
+
+        Raises:
+            FileNotFoundError: If CSV file cannot be opened
+        """
+        try:
+            key = self.result_cache.file_key(
+                self.file_path,
+                VALIDATOR_VERSION,
+                datetime.now().year,
+                self.dedupe,
+                self.email_domains,
+            )
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Unable to open file: {self.file_path}")
+
+        cached = self.result_cache.get(key)
+        if self.profile is not None:
+            # Pythonic Ternary Operator!
+            self.profile.count("result_cache_hits" if cached is not None else "result_cache_misses")
+        if cached is not None:
+            fieldnames = cached["fieldnames"]
+            for values, error in cached["rows"]:
+                yield _row_from_values(fieldnames, values), error
+            return
+
+        fieldnames = None
+        stored_rows = []
+        for row, error in rows:
+            if fieldnames is None:
+                fieldnames = [field for field in row if field is not None]
+            # Copy the values before the caller adds the "error" key to the row
+            stored_rows.append([list(row.values()), error])
+            yield row, error
+
+        self.result_cache.put(key, {"fieldnames": fieldnames or [], "rows": stored_rows})
+
+    def __iter_rows(self, workers):
+        """
+        Helper method for processing - Stream (row, error) pairs, with duplicates marked if dedupe is set.
+
+        Args:
+            workers (int): Number of worker processes, 1 validates in this process
+
+        Yields:
+            tuple: (row, error) in file order
+        """
+        # Choose serial or parallel row source, as a function since "latest" reads twice
+        if workers == 1:
+            read_rows = self.__read_rows
+        else:
+            read_rows = lambda: self.__iter_rows_parallel(workers)
+
+        if self.dedupe is None:
+            yield from read_rows()
+        else:
+            yield from _dedupe_rows(read_rows, self.dedupe)
+
+    def __iter_rows_parallel(self, workers):
+        """
+        Helper method for parallel processing - Validates byte-range chunks in a process pool.
+
+        Chunk boundaries come from MappedCsv.iter_chunks(), which tracks quotes so a
+        boundary never falls inside a quoted field spanning several lines. (Splitting on
+        plain readline() boundaries, as this method first did, cut such rows in two.)
+
+        Args:
+            workers (int): Number of worker processes
+
+        Yields:
+            tuple: (row, error) pairs in the original row order, same as iter_rows()
+
+        Raises:
+            FileNotFoundError: If CSV file cannot be opened
+            ValueError: If CSV headers are invalid or missing
+        """
+        # Workbooks are zip archives, they can't be split into byte ranges
+        if self.file_path.endswith(".xlsx"):
+            yield from self.__read_rows()
+            return
+
+        try:
+            reader = MappedCsv(self.file_path)
         except FileNotFoundError:
             raise FileNotFoundError(f"Unable to open file: {self.file_path}")
+
+        # Imported here, multiprocessing is only needed for parallel processing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Profiled chunks also return the worker's timings
+        # Pythonic Ternary Operator!
+        validate_chunk = _profile_chunk if self.profile is not None else _validate_chunk
+
+        # UTF-16 rows can't be found by scanning bytes, validate them serially
+        if not reader.splittable:
+            reader.close()
+            yield from self.__read_rows()
+            return
+
+        with reader, ProcessPoolExecutor(max_workers=workers) as executor:
+            fieldnames = Processor.__parse_header(reader.header, reader.encoding, reader.delimiter)
+
+            # A few chunks per worker to balance uneven rows, capped so results stay small
+            chunk_size = min(
+                max(1, (reader.size - reader.data_start) // (workers * 4)), MAX_CHUNK_BYTES
+            )
+
+            # Submit chunks as their (quote-aware) boundaries are found, keeping a couple per
+            # worker in flight: validation starts before the whole file has been scanned,
+            # and results are collected in submission order, which keeps rows ordered
+            pending = deque()
+            for start, end in reader.iter_chunks(chunk_size):
+                pending.append(
+                    executor.submit(
+                        validate_chunk,
+                        self.file_path,
+                        fieldnames,
+                        start,
+                        end,
+                        self.cache_size,
+                        self._vectorize,
+                        reader.encoding,
+                        reader.delimiter,
+                        self.email_domains,
+                    )
+                )
+                if len(pending) > workers * 2:
+                    yield from self.__collect_chunk(pending.popleft().result())
+            while pending:
+                yield from self.__collect_chunk(pending.popleft().result())
+
+    def __collect_chunk(self, chunk):
+        """
+        Helper method for parallel processing - Merge a worker's counters and return its rows.
+
+        Args:
+            chunk (tuple): (results, hits, misses) or (results, hits, misses, profile_data)
+
+        Returns:
+            list: The chunk's (row, error) pairs in file order
+        """
+        results, hits, misses, *profile_data = chunk
+        # Each worker has its own cache, collect its counters here
+        if self._cache is not None:
+            self._cache.hits += hits
+            self._cache.misses += misses
+        if profile_data:
+            self.profile.merge(profile_data[0])
+        return results
+
+    @staticmethod
+    def __read_header(file, encoding=None, delimiter=","):
+        """
+        Helper method for byte-offset processing - Read and validate the header line of a binary file.
+
+        Args:
+            file (io.BufferedReader): CSV file opened in binary mode, positioned at the start
+            encoding (str, optional): File encoding, None for the platform default
+            delimiter (str, optional): Field delimiter. Defaults to ","
+
+        Returns:
+            list: Stripped field names, the file is left at the first data row
+
+        Raises:
+            ValueError: If CSV headers are invalid or missing
+        """
+        return Processor.__parse_header(file.readline(), encoding, delimiter)
+
+    @staticmethod
+    def __parse_header(header_line, encoding=None, delimiter=","):
+        """
+        Helper method for byte-offset processing - Parse and validate a raw header row.
+
+        Args:
+            header_line (bytes): The header row as stored in the file
+            encoding (str, optional): File encoding, None for the platform default
+            delimiter (str, optional): Field delimiter. Defaults to ","
+
+        Returns:
+            list: Stripped field names
+
+        Raises:
+            ValueError: If CSV headers are invalid or missing
+        """
+        # Parse the header line with the same decoding rules as iter_rows()
+        text = io.TextIOWrapper(io.BytesIO(header_line), encoding=encoding)
+        header = next(csv.reader(text, delimiter=delimiter), None)
+        fieldnames = [field.strip() for field in header] if header else None
+
+        try:
+            Processor.validate_csv_headers(fieldnames)
         except ValueError as error:
             raise ValueError(f"CSV validation failed: {error}")
 
+        return fieldnames
+
+    @staticmethod
+    def validate_row(row, validate_email=True, cache=None, email_domains=None):
+        """
+        Validates and normalizes a single CSV row in place.
+        Runs every column validator from the ROW_VALIDATORS table in order and
+        stops at the first failure.
+
+        Args:
+            row (dict): CSV row with the required columns as keys
+            validate_email (bool): Whether to validate the 'University Email' column
+            cache (LRUCache, optional): Cache used for the cacheable column validators
+            email_domains (tuple, optional): Allowed email domains. Defaults to None (EMAIL_DOMAINS)
+
+        Returns:
+            dict: The same row with normalized values
+
+        Raises:
+            ValueError: If any of the row's values is invalid
+        """
+        if validate_email:
+            Processor.validate_email(row["University Email"], email_domains)
+
+        # Validate and normalize required columns
+        for column, validator, cacheable in ROW_VALIDATORS:
+            if cache is not None and cacheable:
+                row[column] = cache.call(validator, row[column])
+            else:
+                row[column] = validator(row[column])
+
+        return row
+
     @staticmethod
     def validate_csv_headers(fieldnames):
         """
@@ -222,7 +1031,7 @@ class Processor:
             raise ValueError("Name must be less than 50 characters")
 
         # Check for valid characters (letters, spaces, hyphens, apostrophes)
-        if not re.match(r"^[a-zA-Z\s'-]+$", name):
+        if not NAME_PATTERN.match(name):
             raise ValueError(
                 "Name can only contain letters, spaces, hyphens, and apostrophes"
             )
@@ -238,19 +1047,21 @@ class Processor:
         return name
 
     @staticmethod
-    def validate_email(email):
+    def validate_email(email, domains=None):
         """
         Validates university email addresses.
-        Regular expressions are not used.
+        Common addresses on an allowed domain are accepted by a dedicated local-part
+        pattern, anything else goes through the general validators library.
 
         Args:
             email (str): The email address to validate
+            domains (tuple, optional): Allowed email domains. Defaults to None (EMAIL_DOMAINS)
 
         Returns:
             None: This function does not return a value, it only validates
 
         Raises:
-            ValueError: If email is invalid or not from required domain
+            ValueError: If email is invalid or not from an allowed domain
         """
         if not email or not isinstance(email, str):
             raise ValueError("Email must be a non-empty string")
@@ -258,15 +1069,27 @@ class Processor:
         # Remove extra whitespace
         email = email.strip()
 
+        # Pythonic Ternary Operator!
+        domains = EMAIL_DOMAINS if domains is None else tuple(domains)
+
+        # Fast path: check the domain first, then the local part against the common grammar
+        local_part, _, domain = email.rpartition("@")
+        if (
+            domain.lower() in _valid_email_domains(domains)
+            and len(local_part) <= 64
+            and EMAIL_LOCAL_PART_PATTERN.fullmatch(local_part)
+        ):
+            return
+
         # Check if it's an actual email using 3rd party library
         if not validators.email(email):
             raise ValueError(f"Invalid email format: {email}")
 
-        # Check if email is from the required domain
-        required_domain = "@miuegypt.edu.eg"
-        if not email.lower().endswith(required_domain):
+        # Check if email is from an allowed domain
+        required_domains = tuple(f"@{domain.lower()}" for domain in domains)
+        if not email.lower().endswith(required_domains):
             raise ValueError(
-                f"Email must be from {required_domain} domain, got: {email}"
+                f"Email must be from {' or '.join(required_domains)} domain, got: {email}"
             )
 
         # No return needed - function succeeds if no exception is raised
@@ -366,9 +1189,7 @@ class Processor:
             course_code = course_code[:3].upper() + course_code[3:].title()
 
         # Atleast 3 letters, then at least 3 digits, then optional letters/numbers/spaces/hyphens/parentheses
-        if not re.match(
-            r"^[A-Z]{3,}[0-9]{3,}[A-Z0-9\s\-()]*$", course_code, re.IGNORECASE
-        ):
+        if not COURSE_CODE_PATTERN.match(course_code):
             raise ValueError(
                 "Course code must start with at least 3 letters, "
                 "followed by at least 3 numbers, "
@@ -417,10 +1238,7 @@ class Processor:
         (-|to) -  Matches either "-" or "to"
         \\s* - Matches zero or more spaces (optional whitespace)
         """
-        match = re.match(
-            r"^([1-9]|1[0-2])(:[0-5][0-9])?\s*(-|to)\s*([1-9]|1[0-2])(:[0-5][0-9])?$",
-            course_time,
-        )
+        match = COURSE_TIME_PATTERN.match(course_time)
         if not match:
             raise ValueError("Course time has an invalid format")
 
@@ -515,23 +1333,13 @@ class Processor:
             raise ValueError("Doctor/TA name must be less than 60 characters")
 
         # Check if it's just a title without a name (incomplete)
-        incomplete_titles = [
-            "dr",
-            "prof",
-            "ta",
-            "professor",
-            "doctor",
-            "dr.",
-            "prof.",
-            "ta.",
-        ]
-        if name.lower().strip() in incomplete_titles:
+        if name.lower().strip() in INCOMPLETE_TITLES:
             raise ValueError(
                 "Doctor/TA name cannot be just a title, must include actual name"
             )
 
         # Check for valid characters (letters, spaces, hyphens, apostrophes, periods, parentheses for titles)
-        if not re.match(r"^[a-zA-Z\s'.\-()]+$", name):
+        if not DR_TA_NAME_PATTERN.match(name):
             raise ValueError(
                 "Doctor/TA name can only contain letters, spaces, hyphens, apostrophes, periods, and parentheses"
             )
@@ -583,23 +1391,523 @@ class Processor:
         # Then check what type of title exists and standardize accordingly
         # Use word boundaries (\b) to avoid false matches (e.g., "ta" in "Tamer")
 
-        if re.search(r"\b(doctor|dr)\b", name_lower):
+        if DOCTOR_TITLE_PATTERN.search(name_lower):
             # Replace any doctor/dr variations with "Dr." - avoid double periods
-            name = re.sub(r"\b(doctor|dr\.?)\b", "Dr.", name, flags=re.IGNORECASE)
+            name = DOCTOR_TITLE_REPLACE_PATTERN.sub("Dr.", name)
             # Fix any double periods that might occur
             name = name.replace("Dr..", "Dr.")
-        elif re.search(r"\b(professor|prof)\b", name_lower):
+        elif PROFESSOR_TITLE_PATTERN.search(name_lower):
             # Replace any professor/prof variations with "Prof." - avoid double periods
-            name = re.sub(
-                r"\b(professor|prof\.?)\b", "Prof.", name, flags=re.IGNORECASE
-            )
+            name = PROFESSOR_TITLE_REPLACE_PATTERN.sub("Prof.", name)
             # Fix any double periods that might occur
             name = name.replace("Prof..", "Prof.")
-        elif re.search(r"\bta\b", name_lower):
+        elif TA_TITLE_PATTERN.search(name_lower):
             # Replace any TA variations with "TA" (no dot)
-            name = re.sub(r"\bta\.?\b", "TA", name, flags=re.IGNORECASE)
+            name = TA_TITLE_REPLACE_PATTERN.sub("TA", name)
         else:
             # No title found, add "Dr." prefix (name is already capitalized)
             name = f"Dr. {name}"
 
         return name
+
+
+@lru_cache(maxsize=32)
+def _valid_email_domains(domains):
+    """
+    Get the allowed domains that validators.email() accepts, for the email fast path.
+    Checked once per allow-list, so a malformed configured domain is never fast-pathed.
+
+    Args:
+        domains (tuple): Allowed email domains
+
+    Returns:
+        frozenset: Lowercase domains usable by the fast path
+    """
+    return frozenset(
+        domain.lower() for domain in domains if validators.email(f"student@{domain}")
+    )
+
+
+def _email_row_validator(email_domains):
+    """
+    Get the validator table entry of the 'University Email' column for an allow-list.
+
+    Args:
+        email_domains (tuple): Allowed email domains, None for EMAIL_DOMAINS
+
+    Returns:
+        tuple: ("University Email", validator, cacheable) like the ROW_VALIDATORS entries
+    """
+
+    # Named like the static method, profiles report validators by name
+    def validate_email(email):
+        return Processor.validate_email(email, email_domains)
+
+    return ("University Email", validate_email, False)
+
+
+# Column validators applied by Processor.validate_row(), in validation order
+# (column, validator, cacheable) - only low-cardinality columns are worth caching
+# Defined after the class so the static methods can be referenced directly
+ROW_VALIDATORS = (
+    ("Full Name", Processor.validate_name, False),  # Normalize student name
+    ("University ID", Processor.validate_university_id, False),  # Normalize student ID
+    ("Course Code", Processor.validate_course_code, True),  # Normalize course code
+    ("Course Time", Processor.validate_course_time, True),  # Normalize course time
+    ("Doctor/TA Name", Processor.validate_dr_ta_name, True),  # Normalize instructor name
+)
+
+
+def _validate_chunk(
+    file_path,
+    fieldnames,
+    start,
+    end,
+    cache_size=0,
+    vectorize=False,
+    encoding=None,
+    delimiter=",",
+    email_domains=None,
+):
+    """
+    Worker function for Processor.process(workers=N) - Validates one byte range of a CSV file.
+    Defined at module level so it can be pickled and sent to worker processes.
+
+    Args:
+        file_path (str): Path to the CSV file
+        fieldnames (list): Stripped CSV headers
+        start (int): Byte offset of the first row in the chunk
+        end (int): Byte offset just after the last row in the chunk
+        cache_size (int, optional): Size of the worker's validator cache, 0 disables it
+        vectorize (bool, optional): Use the vectorized engine. Defaults to False
+        encoding (str, optional): File encoding, None for the platform default
+        delimiter (str, optional): Field delimiter. Defaults to ","
+        email_domains (tuple, optional): Allowed email domains. Defaults to None (EMAIL_DOMAINS)
+
+    Returns:
+        tuple: (results, hits, misses) where results is the list of (row, error) pairs
+            in file order and hits/misses are the worker's cache counters
+    """
+    return _validate_range(
+        file_path,
+        fieldnames,
+        start,
+        end,
+        cache_size,
+        vectorize=vectorize,
+        encoding=encoding,
+        delimiter=delimiter,
+        email_domains=email_domains,
+    )
+
+
+def _profile_chunk(
+    file_path,
+    fieldnames,
+    start,
+    end,
+    cache_size=0,
+    vectorize=False,
+    encoding=None,
+    delimiter=",",
+    email_domains=None,
+):
+    """
+    Worker function for profiled parallel processing - Like _validate_chunk(), with timings.
+
+    Args:
+        file_path (str): Path to the CSV file
+        fieldnames (list): Stripped CSV headers
+        start (int): Byte offset of the first row in the chunk
+        end (int): Byte offset just after the last row in the chunk
+        cache_size (int, optional): Size of the worker's validator cache, 0 disables it
+        vectorize (bool, optional): Ignored, profiled validation always uses the scalar engine
+        encoding (str, optional): File encoding, None for the platform default
+        delimiter (str, optional): Field delimiter. Defaults to ","
+        email_domains (tuple, optional): Allowed email domains. Defaults to None (EMAIL_DOMAINS)
+
+    Returns:
+        tuple: (results, hits, misses, profile_data) where profile_data is the worker's
+            Profile.to_dict(), to be merged into the caller's profile
+    """
+    profile = Profile()
+    results, hits, misses = _validate_range(
+        file_path,
+        fieldnames,
+        start,
+        end,
+        cache_size,
+        profile,
+        encoding=encoding,
+        delimiter=delimiter,
+        email_domains=email_domains,
+    )
+    return results, hits, misses, profile.to_dict()
+
+
+def _validate_range(
+    file_path,
+    fieldnames,
+    start,
+    end,
+    cache_size=0,
+    profile=None,
+    vectorize=False,
+    encoding=None,
+    delimiter=",",
+    email_domains=None,
+):
+    """
+    Validates one byte range of a CSV file, shared by the chunk worker functions.
+
+    Args:
+        file_path (str): Path to the CSV file
+        fieldnames (list): Stripped CSV headers
+        start (int): Byte offset of the first row in the range
+        end (int): Byte offset just after the last row in the range
+        cache_size (int, optional): Size of the validator cache, 0 disables it
+        profile (Profile, optional): Collects CSV parsing and validator timings
+        vectorize (bool, optional): Use the vectorized engine. Defaults to False
+        encoding (str, optional): File encoding, None for the platform default
+        delimiter (str, optional): Field delimiter. Defaults to ","
+        email_domains (tuple, optional): Allowed email domains. Defaults to None (EMAIL_DOMAINS)
+
+    Returns:
+        tuple: (results, hits, misses), see _validate_chunk()
+    """
+    with open(file_path, "rb") as file:
+        file.seek(start)
+        data = file.read(end - start)
+
+    # Decode exactly like the serial path's text stream does
+    text = io.TextIOWrapper(io.BytesIO(data), encoding=encoding)
+    reader = csv.DictReader(text, fieldnames=fieldnames, delimiter=delimiter)
+    has_email = "University Email" in fieldnames
+
+    cache = LRUCache(cache_size) if cache_size else None
+
+    results = list(_validate_rows(reader, has_email, cache, profile, vectorize, email_domains))
+    if cache is None:
+        return results, 0, 0
+    return results, cache.hits, cache.misses
+
+
+def _validate_rows(
+    reader, has_email, cache=None, profile=None, vectorize=False, email_domains=None
+):
+    """
+    Validates every row produced by a csv.DictReader, shared by the serial and parallel paths.
+
+    Args:
+        reader (csv.DictReader): Reader positioned at the first data row
+        has_email (bool): Whether the 'University Email' column should be validated
+        cache (LRUCache, optional): Cache for the cacheable column validators
+        profile (Profile, optional): Collects CSV parsing and per-validator timings
+        vectorize (bool, optional): Validate batches column by column with NumPy, without
+            the cache (ignored when profiling). Defaults to False
+        email_domains (tuple, optional): Allowed email domains. Defaults to None (EMAIL_DOMAINS)
+
+    Yields:
+        tuple: (row, error) where error is None for valid rows or the error message (str)
+    """
+    if profile is not None:
+        yield from _validate_rows_profiled(reader, has_email, cache, profile, email_domains)
+        return
+
+    if vectorize:
+        # Imported here, NumPy is only loaded when the vectorized engine is used
+        from .vectorized import validate_rows
+
+        yield from validate_rows(reader, has_email, email_domains=email_domains)
+        return
+
+    for row in reader:
+        try:
+            Processor.validate_row(row, has_email, cache, email_domains)
+        except (ValueError, validators.ValidationError) as error:
+            # Capture the error message
+            yield row, str(error)
+        else:
+            yield row, None
+
+
+def _validate_rows_profiled(reader, has_email, cache, profile, email_domains=None):
+    """
+    Instrumented _validate_rows() - Same results, timing CSV parsing and every validator call.
+
+    Kept separate so the regular path pays nothing for instrumentation.
+
+    Args:
+        reader (csv.DictReader): Reader positioned at the first data row
+        has_email (bool): Whether the 'University Email' column should be validated
+        cache (LRUCache, optional): Cache for the cacheable column validators
+        profile (Profile): Receives "csv_parsing" and "validation" times and validator timings
+        email_domains (tuple, optional): Allowed email domains. Defaults to None (EMAIL_DOMAINS)
+
+    Yields:
+        tuple: (row, error), same as _validate_rows()
+    """
+    clock = time.perf_counter
+    rows = iter(reader)
+    parse_seconds = validate_seconds = 0.0
+    count = 0
+
+    # Same validators and order as Processor.validate_row()
+    validator_table = ROW_VALIDATORS
+    if has_email:
+        validator_table = (_email_row_validator(email_domains),) + ROW_VALIDATORS
+
+    try:
+        while True:
+            start = clock()
+            row = next(rows, None)
+            parse_seconds += clock() - start
+            if row is None:
+                break
+            count += 1
+
+            error = None
+            row_start = clock()
+            for column, validator, cacheable in validator_table:
+                start = clock()
+                try:
+                    if cache is not None and cacheable:
+                        value = cache.call(validator, row[column])
+                    else:
+                        value = validator(row[column])
+                except (ValueError, validators.ValidationError) as validation_error:
+                    profile.validator(validator.__name__, clock() - start, failed=True)
+                    error = str(validation_error)
+                    break
+                profile.validator(validator.__name__, clock() - start)
+                # Email is only checked, other columns are normalized in place
+                if column != "University Email":
+                    row[column] = value
+            validate_seconds += clock() - row_start
+
+            yield row, error
+    finally:
+        profile.add("csv_parsing", parse_seconds, count)
+        profile.add("validation", validate_seconds, count)
+
+
+def _partition_rows(rows):
+    """
+    Splits (row, error) pairs into valid and invalid rows, adding the error message to invalid rows.
+
+    Args:
+        rows (iterable): (row, error) pairs
+
+    Returns:
+        tuple: (valid_rows, invalid_rows) as lists of dictionaries
+    """
+    valid_rows = []
+    invalid_rows = []
+    for row, error in rows:
+        if error is None:
+            # Append valid row if all validations pass
+            valid_rows.append(row)
+        else:
+            row["error"] = error  # Add error message to the row
+            invalid_rows.append(row)
+
+    # Return a tuple of dictionaries
+    return (valid_rows, invalid_rows)
+
+
+def _update_hash(digest, file, start, end):
+    """
+    Feeds a byte range of a file to a hash object, in blocks of 1 MiB.
+
+    Args:
+        digest (hashlib._Hash): Hash object to update
+        file (io.BufferedReader): File opened in binary mode
+        start (int): Byte offset of the range
+        end (int): Byte offset just after the range
+
+    Returns:
+        None: The hash object is updated in place
+    """
+    file.seek(start)
+    remaining = end - start
+    while remaining > 0:
+        block = file.read(min(remaining, 1 << 20))
+        if not block:
+            break
+        digest.update(block)
+        remaining -= len(block)
+
+
+def _load_checkpoint(checkpoint_path, settings):
+    """
+    Loads a process_incremental() checkpoint written with the given settings.
+
+    The first line holds the settings. Each call then appends its rows ([values, error]
+    lines) followed by an {"offset", "prefix_sha256"} line: rows after the last such
+    line come from an interrupted write and are ignored.
+
+    Args:
+        checkpoint_path (str): Checkpoint file path
+        settings (dict): Expected first line (format and validator versions, year, header...)
+
+    Returns:
+        dict: "offset", "prefix_sha256", "rows" and "length" (bytes up to the last complete
+            call), or None if it is missing, unreadable or written with other settings
+    """
+    try:
+        with open(checkpoint_path, "rb") as file:
+            lines = file.read().split(b"\n")
+        if json.loads(lines[0]) != settings:
+            return None
+
+        commit = None
+        committed_rows = 0
+        row_lines = []
+        position = length = len(lines[0]) + 1
+        # The last piece is empty, or an unterminated line of an interrupted write
+        for line in lines[1:-1]:
+            position += len(line) + 1
+            if line.startswith(b"{"):
+                commit = json.loads(line)
+                committed_rows = len(row_lines)
+                length = position
+            else:
+                row_lines.append(line)
+
+        # Parsed as one array, json.loads() per row is several times slower
+        rows = json.loads(b"[" + b",".join(row_lines[:committed_rows]) + b"]")
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(commit, dict) or not all(
+        key in commit for key in ("offset", "prefix_sha256")
+    ):
+        return None
+    return {**commit, "rows": rows, "length": length}
+
+
+def _row_from_values(fieldnames, values):
+    """
+    Rebuilds a csv.DictReader row from its values, as stored in a checkpoint.
+
+    Args:
+        fieldnames (list): Stripped CSV headers
+        values (list): Row values in field order, followed by the list of extra values
+            for rows with more fields than headers
+
+    Returns:
+        dict: The row, with extra values under the None key like csv.DictReader
+    """
+    row = dict(zip(fieldnames, values))
+    if len(values) > len(fieldnames):
+        row[None] = values[-1]
+    return row
+
+
+def _save_checkpoint(checkpoint_path, settings, rows, commit):
+    """
+    Writes a new process_incremental() checkpoint atomically, so an interrupted write never leaves a broken file.
+
+    Args:
+        checkpoint_path (str): Checkpoint file path
+        settings (dict): Settings line, see _load_checkpoint()
+        rows (list): [values, error] pairs
+        commit (dict): Processed "offset" and "prefix_sha256"
+
+    Returns:
+        None: The checkpoint is written to checkpoint_path
+    """
+    temporary_path = f"{checkpoint_path}.tmp"
+    with open(temporary_path, "w", encoding="utf-8") as file:
+        file.write(json.dumps(settings) + "\n")
+        file.write(_checkpoint_lines(rows, commit))
+    os.replace(temporary_path, checkpoint_path)
+
+
+def _append_checkpoint(checkpoint_path, length, rows, commit):
+    """
+    Appends one call's rows and processed offset to a process_incremental() checkpoint.
+
+    Args:
+        checkpoint_path (str): Checkpoint file path
+        length (int): Bytes up to the last complete call, anything after it is discarded
+        rows (list): New [values, error] pairs
+        commit (dict): Processed "offset" and "prefix_sha256"
+
+    Returns:
+        None: The checkpoint is extended in place
+    """
+    with open(checkpoint_path, "r+b") as file:
+        file.truncate(length)
+        file.seek(length)
+        file.write(_checkpoint_lines(rows, commit).encode("utf-8"))
+
+
+def _checkpoint_lines(rows, commit):
+    """
+    Serializes rows and the processed offset as checkpoint lines.
+
+    Args:
+        rows (list): [values, error] pairs
+        commit (dict): Processed "offset" and "prefix_sha256"
+
+    Returns:
+        str: One JSON line per row, then the commit line (JSON escapes newlines in values)
+    """
+    # json.dumps() uses the C encoder, json.dump() streams through the pure Python one
+    lines = [json.dumps(row) for row in rows]
+    lines.append(json.dumps(commit))
+    return "\n".join(lines) + "\n"
+
+
+def _dedupe_rows(read_rows, keep):
+    """
+    Marks duplicate submissions of valid rows, keeping one row per DEDUPE_COLUMNS key.
+    Runs in O(n) with a hash index holding only the keys, never whole rows.
+
+    Args:
+        read_rows (callable): Returns a fresh (row, error) iterator over the file
+        keep (str): "first" keeps the earliest row of each key in file order,
+            "latest" keeps the row with the latest Timestamp (the later row on ties)
+
+    Yields:
+        tuple: (row, error) in file order, dropped duplicates get a "Duplicate submission" error
+    """
+    if keep == "latest":
+        # First pass: key -> (timestamp, index) of the latest valid submission
+        kept = {}
+        for index, (row, error) in enumerate(read_rows()):
+            if error is None:
+                key = tuple(row[column] for column in DEDUPE_COLUMNS)
+                latest = (_parse_timestamp(row.get("Timestamp")), index)
+                if key not in kept or latest >= kept[key]:
+                    kept[key] = latest
+        kept = {key: index for key, (_, index) in kept.items()}
+    else:
+        kept = {}
+
+    for index, (row, error) in enumerate(read_rows()):
+        if error is None:
+            key = tuple(row[column] for column in DEDUPE_COLUMNS)
+            # "first": the first valid row of a key claims it - setdefault does both in one lookup
+            kept_index = kept.setdefault(key, index)
+            if kept_index != index:
+                error = f"Duplicate submission (kept the {keep} one, row {kept_index + 1})"
+        yield row, error
+
+
+def _parse_timestamp(value):
+    """
+    Parses a Google Forms timestamp for ordering submissions.
+
+    Args:
+        value (str): Timestamp such as "3/12/2025 09:15:10", or None
+
+    Returns:
+        datetime: The parsed timestamp, datetime.min if missing or unparsable
+            (so such rows fall back to file order)
+    """
+    try:
+        return datetime.strptime(value.strip(), TIMESTAMP_FORMAT)
+    except (AttributeError, ValueError):
+        return datetime.min
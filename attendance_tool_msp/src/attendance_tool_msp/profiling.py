@@ -0,0 +1,241 @@
+import json, time
+from contextlib import contextmanager, nullcontext
+
+
+class Profile:
+    """
+    Opt-in timing and counter collector for Processor and Exporter.
+
+    Design Note:
+        Pass one Profile to a Processor and/or an Exporter (profile=...) to find where a
+        slow report spends its time. Stages nest: a stage started inside another one is
+        recorded as its child, and fine-grained timings added with add() (CSV parsing
+        between validated rows, for example) belong to the innermost running stage.
+        With parallel processing, worker stages and validator timings are summed over
+        all workers, so they can add up to more than the wall-clock time of their parent.
+
+    Attributes:
+        stages (dict): Stage name -> {"seconds", "calls", "parent"}, in first-start order
+        counters (dict): Counter name -> value (rows, valid_rows, cache hits, ...)
+        validators (dict): Validator name -> {"calls", "seconds", "failures"}
+        listener (callable): Optional callback, called as listener(event, stage, seconds)
+            with event "start" (seconds is None) or "end"
+    """
+
+    def __init__(self, listener=None):
+        """
+        Initialize an empty profile.
+
+        Args:
+            listener (callable, optional): Called as listener("start", stage, None) and
+                listener("end", stage, seconds) around every stage. Defaults to None
+        """
+        self.stages = {}
+        self.counters = {}
+        self.validators = {}
+        self.listener = listener
+        self._running = []
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Time a stage, as a child of the currently running stage.
+
+        Args:
+            name (str): Stage name, e.g. "docx_save"
+
+        Yields:
+            None
+        """
+        if self.listener:
+            self.listener("start", name, None)
+        self.__entry(name)
+        self._running.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            self._running.pop()
+            self.add(name, seconds)
+            if self.listener:
+                self.listener("end", name, seconds)
+
+    def add(self, name, seconds, calls=1):
+        """
+        Add time to a stage, as a child of the currently running stage if it is new.
+
+        Args:
+            name (str): Stage name
+            seconds (float): Time to add
+            calls (int, optional): Number of calls the time covers. Defaults to 1
+
+        Returns:
+            None
+        """
+        entry = self.__entry(name)
+        entry["seconds"] += seconds
+        entry["calls"] += calls
+
+    def count(self, name, amount=1):
+        """
+        Increment a counter.
+
+        Args:
+            name (str): Counter name, e.g. "rows"
+            amount (int, optional): Amount to add. Defaults to 1
+
+        Returns:
+            None
+        """
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def validator(self, name, seconds, failed=False):
+        """
+        Record one validator call.
+
+        Args:
+            name (str): Validator name, e.g. "validate_email"
+            seconds (float): Time spent in the call
+            failed (bool, optional): Whether the value was rejected. Defaults to False
+
+        Returns:
+            None
+        """
+        entry = self.validators.get(name)
+        if entry is None:
+            entry = self.validators[name] = {"calls": 0, "seconds": 0.0, "failures": 0}
+        entry["calls"] += 1
+        entry["seconds"] += seconds
+        if failed:
+            entry["failures"] += 1
+
+    def merge(self, data):
+        """
+        Add the timings and counters of another profile (e.g. from a worker process).
+
+        Args:
+            data (dict): Output of another profile's to_dict()
+
+        Returns:
+            None
+        """
+        for name, stage in data["stages"].items():
+            self.add(name, stage["seconds"], stage["calls"])
+        for name, value in data["counters"].items():
+            self.count(name, value)
+        for name, validator in data["validators"].items():
+            entry = self.validators.setdefault(
+                name, {"calls": 0, "seconds": 0.0, "failures": 0}
+            )
+            for key in entry:
+                entry[key] += validator[key]
+
+    def to_dict(self):
+        """
+        Get the collected data in a JSON-serializable form.
+
+        Returns:
+            dict: {"stages": ..., "counters": ..., "validators": ...}
+        """
+        return {
+            "stages": {name: dict(stage) for name, stage in self.stages.items()},
+            "counters": dict(self.counters),
+            "validators": {name: dict(entry) for name, entry in self.validators.items()},
+        }
+
+    def to_json(self):
+        """
+        Serialize the collected data as JSON.
+
+        Returns:
+            str: Indented JSON of to_dict()
+        """
+        return json.dumps(self.to_dict(), indent=2)
+
+    def format(self):
+        """
+        Format the collected data as plain-text tables.
+
+        Returns:
+            str: Stage tree with times, validator table and counters
+        """
+        lines = [f"{'Stage':<28}  {'Calls':>8}  {'Seconds':>9}"]
+        for name, depth in self.__stage_tree():
+            stage = self.stages[name]
+            label = "  " * depth + name
+            lines.append(f"{label:<28}  {stage['calls']:>8}  {stage['seconds']:>9.4f}")
+
+        if self.validators:
+            lines.append("")
+            lines.append(
+                f"{'Validator':<28}  {'Calls':>8}  {'Seconds':>9}  {'Failures':>8}  {'us/call':>8}"
+            )
+            for name, entry in self.validators.items():
+                per_call = entry["seconds"] / entry["calls"] * 1_000_000
+                lines.append(
+                    f"{name:<28}  {entry['calls']:>8}  {entry['seconds']:>9.4f}  "
+                    f"{entry['failures']:>8}  {per_call:>8.2f}"
+                )
+
+        if self.counters:
+            lines.append("")
+            lines.append(f"{'Counter':<28}  {'Value':>8}")
+            for name, value in self.counters.items():
+                lines.append(f"{name:<28}  {value:>8}")
+
+        return "\n".join(lines)
+
+    def __entry(self, name):
+        """
+        Helper method for profiling - Get a stage entry, creating it under the running stage.
+
+        Args:
+            name (str): Stage name
+
+        Returns:
+            dict: The stage entry
+        """
+        entry = self.stages.get(name)
+        if entry is None:
+            # Pythonic Ternary Operator!
+            parent = self._running[-1] if self._running else None
+            entry = self.stages[name] = {"seconds": 0.0, "calls": 0, "parent": parent}
+        return entry
+
+    def __stage_tree(self):
+        """
+        Helper method for formatting - Order stages depth-first, children after their parent.
+
+        Returns:
+            list: (stage name, depth) pairs
+        """
+        children = {}
+        for name, stage in self.stages.items():
+            parent = stage["parent"] if stage["parent"] in self.stages else None
+            children.setdefault(parent, []).append(name)
+
+        ordered = []
+
+        def visit(parent, depth):
+            for name in children.get(parent, []):
+                ordered.append((name, depth))
+                visit(name, depth + 1)
+
+        visit(None, 0)
+        return ordered
+
+
+def profile_stage(profile, name):
+    """
+    Time a stage if profiling is enabled.
+
+    Args:
+        profile (Profile): The profile, or None when profiling is disabled
+        name (str): Stage name
+
+    Returns:
+        contextmanager: profile.stage(name), or a no-op context manager without a profile
+    """
+    # Pythonic Ternary Operator!
+    return profile.stage(name) if profile is not None else nullcontext()
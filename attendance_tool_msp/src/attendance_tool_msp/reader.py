@@ -0,0 +1,399 @@
+import io, os, csv, mmap, codecs, locale
+from array import array
+
+# Largest byte range handed to one validation worker, keeps per-chunk results small
+MAX_CHUNK_BYTES = 8 * 1024 * 1024
+
+# Bytes read once from the start of a file to detect its encoding and delimiter
+SNIFF_BYTES = 4096
+
+# Bytes of the mapping scanned at a time when counting quotes, mmap has no count()
+SCAN_BYTES = 64 * 1024
+
+# Byte order marks written by Excel and Notepad, and the codec that removes them
+BYTE_ORDER_MARKS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+# Candidate delimiters, the first one wins a tie: regional Excel settings save with ";"
+DELIMITERS = (",", ";", "\t", "|")
+
+
+def sniff(sample):
+    """
+    Detect the encoding and delimiter of a CSV file from its first bytes.
+
+    A byte order mark selects its encoding (UTF-8 or UTF-16). Without one, a sample that
+    is valid UTF-8, plain ASCII included, is read as UTF-8: an ASCII header says nothing
+    about the names further down, and those are far more likely UTF-8 than the locale's
+    code page (cp1252 on Windows). Only samples that aren't UTF-8 (e.g. Excel's "CSV"
+    export on Windows) keep the platform default encoding like open() does.
+    The delimiter is the candidate splitting the header row into the most columns.
+
+    Args:
+        sample (bytes): The start of the file, e.g. its first SNIFF_BYTES bytes
+
+    Returns:
+        tuple: (encoding, delimiter) where encoding is None for the platform default
+    """
+    encoding = None
+    for mark, codec in BYTE_ORDER_MARKS:
+        if sample.startswith(mark):
+            encoding = codec
+            break
+    else:
+        try:
+            # Incremental decoder, the sample may end in the middle of a character
+            codecs.getincrementaldecoder("utf-8")().decode(sample)
+        except UnicodeDecodeError:
+            pass
+        else:
+            encoding = "utf-8"
+
+    # Decode like the file will be read (the sample's last character may be cut)
+    text = sample.decode(encoding or _default_encoding(), errors="replace")
+    if encoding == "utf-8-sig" or encoding == "utf-16":
+        text = text.lstrip("\ufeff")
+    header = text.splitlines()[0] if text else ""
+
+    delimiter = DELIMITERS[0]
+    columns = len(next(csv.reader([header]), []))
+    for candidate in DELIMITERS[1:]:
+        candidate_columns = len(next(csv.reader([header], delimiter=candidate), []))
+        if candidate_columns > columns:
+            delimiter, columns = candidate, candidate_columns
+
+    return encoding, delimiter
+
+
+def open_text(file_path):
+    """
+    Open a CSV file for reading with its detected encoding and delimiter.
+
+    The file is opened once: the sniffed bytes are peeked from the read buffer, and the
+    text stream then reads the whole file from the start with the detected settings.
+
+    Args:
+        file_path (str): Path to the CSV file
+
+    Returns:
+        tuple: (file, delimiter) where file is a text stream, to be closed by the caller
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    file = open(file_path, "rb", buffering=max(SNIFF_BYTES, io.DEFAULT_BUFFER_SIZE))
+    encoding, delimiter = sniff(file.peek(SNIFF_BYTES)[:SNIFF_BYTES])
+    return io.TextIOWrapper(file, encoding=encoding), delimiter
+
+
+def byte_splittable(encoding):
+    """
+    Check whether rows of a file in this encoding can be found by scanning its bytes.
+
+    Args:
+        encoding (str): Encoding name, None for the platform default
+
+    Returns:
+        bool: True if newlines and quotes are single ASCII bytes (UTF-8, cp1252...), False for UTF-16
+    """
+    encoder = codecs.getincrementalencoder(encoding or _default_encoding())()
+    # The first call may write a byte order mark, only the following bytes matter
+    encoder.encode("a")
+    return encoder.encode('"\n') == b'"\n'
+
+
+def newline_terminated(sample):
+    """
+    Check whether a file's rows end with \\n (or \\r\\n), judging by its first line.
+
+    Args:
+        sample (bytes): The start of the file, e.g. its first SNIFF_BYTES bytes
+
+    Returns:
+        bool: False for bare \\r line endings (classic Mac OS), which byte scanning can't split
+    """
+    line_feed = sample.find(b"\n")
+    if line_feed == -1:
+        # A single line, unless it is made of \r terminated lines
+        return b"\r" not in sample
+    # Only the \r of a CRLF line ending may come before the first \n
+    return sample.find(b"\r", 0, line_feed - 1) == -1
+
+
+def _default_encoding():
+    """
+    Get the encoding open() uses when none is given.
+
+    Returns:
+        str: The platform default encoding (UTF-8 in Python's UTF-8 mode)
+    """
+    encoding = io.text_encoding(None)
+    # Pythonic Ternary Operator!
+    return locale.getpreferredencoding(False) if encoding == "locale" else encoding
+
+
+class MappedCsv:
+    """
+    Memory-mapped CSV file with quote-aware row boundaries.
+
+    Design Note:
+        The file is mapped read-only, so only the pages that are actually touched are
+        read from disk. Quotes are counted through one reused SCAN_BYTES buffer, so
+        scanning never copies more than that, however large the chunks are. Chunks are
+        handed over as (start, end) byte offsets: validation workers re-open the file
+        and read their own range, nothing is pickled but the offsets.
+        Row boundaries are newlines outside quoted fields: a newline belongs to a
+        quoted field when an odd number of quote characters precede it in its row,
+        which covers RFC 4180 quoting ("" escapes count twice). Rows end with \\n
+        or \\r\\n. The encoding and delimiter are sniffed from the first SNIFF_BYTES
+        bytes. Files in encodings where newlines are not single bytes (UTF-16) and files
+        with bare \\r line endings cannot be split: splittable is False, and chunks,
+        row offsets and the header are not available.
+
+    Attributes:
+        file_path (str): Path to the CSV file
+        size (int): File size in bytes
+        encoding (str): Detected encoding, None for the platform default
+        delimiter (str): Detected delimiter
+        splittable (bool): Whether rows can be found by scanning bytes
+        data_start (int): Byte offset of the first data row (just after the header row)
+    """
+
+    def __init__(self, file_path):
+        """
+        Open and map the CSV file.
+
+        Args:
+            file_path (str): Path to the CSV file
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        self.file_path = file_path
+        self._file = open(file_path, "rb")
+        self.size = os.fstat(self._file.fileno()).st_size
+
+        # Empty files cannot be mapped, bytes offer the same find() and slicing
+        if self.size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._map = b""
+
+        sample = self._map[:SNIFF_BYTES]
+        self.encoding, self.delimiter = sniff(sample)
+        self.splittable = byte_splittable(self.encoding) and newline_terminated(sample)
+
+        self._scan_buffer = bytearray(SCAN_BYTES)
+        # Pythonic Ternary Operator!
+        self.data_start = self.__row_end(0) if self.splittable else 0
+        self._row_starts = None
+
+    def __enter__(self):
+        """Use the reader as a context manager, closing the mapping on exit."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the mapping and the file."""
+        self.close()
+
+    def close(self):
+        """
+        Release the mapping and the file.
+
+        Returns:
+            None
+        """
+        if isinstance(self._map, mmap.mmap) and not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    @property
+    def header(self):
+        """
+        Get the raw header row.
+
+        Returns:
+            bytes: The header row, including its line ending
+        """
+        return self._map[: self.data_start]
+
+    @property
+    def fieldnames(self):
+        """
+        Get the header row's column names, decoded like a file opened in text mode.
+
+        Returns:
+            list: Column names (not stripped), None for an empty (or unsplittable) file
+        """
+        text = io.TextIOWrapper(io.BytesIO(self.header), encoding=self.encoding)
+        return next(csv.reader(text, delimiter=self.delimiter), None)
+
+    def iter_chunks(self, chunk_size=MAX_CHUNK_BYTES):
+        """
+        Split the data rows into byte ranges of about chunk_size bytes, on row boundaries.
+
+        Boundaries are found lazily, one chunk at a time, so the first chunks can be
+        validated while the rest of the file has not been read yet.
+
+        Args:
+            chunk_size (int, optional): Target chunk size in bytes. Defaults to MAX_CHUNK_BYTES
+
+        Yields:
+            tuple: (start, end) byte offsets, covering every data row exactly once
+
+        Raises:
+            ValueError: If chunk_size is not a positive integer, or the file is not splittable
+        """
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError("Chunk size must be a positive integer")
+        self.__check_splittable()
+
+        start = self.data_start
+        while start < self.size:
+            target = start + chunk_size
+            if target >= self.size:
+                yield start, self.size
+                return
+
+            # A chunk always starts outside quotes: the quote parity up to the target
+            # tells whether the target falls inside a quoted field
+            in_quotes = False
+            if self._map.find(b'"', start, target) != -1:
+                in_quotes = self.__count_quotes(start, target) % 2 == 1
+
+            end = self.__row_end(target, in_quotes)
+            yield start, end
+            start = end
+
+    def row_offsets(self):
+        """
+        Get the start offset of every data row, built once on first use.
+        Blank lines are skipped like csv.DictReader does, so index N is the Nth row
+        yielded by Processor.iter_rows().
+
+        Returns:
+            array.array: Row start offsets (unsigned 64-bit)
+
+        Raises:
+            ValueError: If the file is not splittable
+        """
+        self.__check_splittable()
+        if self._row_starts is None:
+            starts = array("Q")
+            position = self.data_start
+            while position < self.size:
+                end = self.__row_end(position)
+                if self._map[position:end] not in (b"\n", b"\r\n"):
+                    starts.append(position)
+                position = end
+            self._row_starts = starts
+        return self._row_starts
+
+    def row_count(self):
+        """
+        Get the number of data rows.
+
+        Returns:
+            int: Number of non-blank data rows
+
+        Raises:
+            ValueError: If the file is not splittable
+        """
+        return len(self.row_offsets())
+
+    def row(self, index):
+        """
+        Read a single data row without parsing the rows before it (after the offset index is built).
+
+        Args:
+            index (int): Data row index, 0-based (negative indices count from the end)
+
+        Returns:
+            dict: Raw (unvalidated) row keyed by the header's column names (stripped)
+
+        Raises:
+            IndexError: If index is out of range
+            ValueError: If the file is not splittable
+        """
+        start = self.row_offsets()[index]
+        data = self._map[start : self.__row_end(start)]
+        fieldnames = [field.strip() for field in self.fieldnames]
+        reader = csv.DictReader(
+            io.TextIOWrapper(io.BytesIO(data), encoding=self.encoding),
+            fieldnames=fieldnames,
+            delimiter=self.delimiter,
+        )
+        return next(reader)
+
+    def __check_splittable(self):
+        """
+        Helper method for scanning - Reject byte scanning of multi-byte encodings and bare \\r line endings.
+
+        Raises:
+            ValueError: If the file is not splittable
+        """
+        if not self.splittable:
+            # Pythonic Ternary Operator!
+            reason = (
+                "has bare \\r line endings"
+                if byte_splittable(self.encoding)
+                else f"is {self.encoding} encoded"
+            )
+            raise ValueError(
+                f"The file '{self.file_path}' {reason} and cannot be split into rows by bytes"
+            )
+
+    def __row_end(self, position, in_quotes=False):
+        """
+        Helper method for scanning - Find the end of the row containing position.
+
+        Args:
+            position (int): Offset to scan from
+            in_quotes (bool, optional): Whether position is inside a quoted field
+
+        Returns:
+            int: Offset just after the row's newline (the file size for the last row)
+        """
+        data = self._map
+        while True:
+            newline = data.find(b"\n", position)
+            if newline == -1:
+                return self.size
+
+            # Only count quotes on lines that have any
+            if data.find(b'"', position, newline) != -1:
+                in_quotes ^= self.__count_quotes(position, newline) % 2 == 1
+            if not in_quotes:
+                return newline + 1
+            position = newline + 1
+
+    def __count_quotes(self, start, end):
+        """
+        Helper method for scanning - Count the quote characters in a byte range.
+
+        Args:
+            start (int): First byte offset
+            end (int): Offset just after the last byte
+
+        Returns:
+            int: Number of '"' bytes in the range
+        """
+        # Rows are short, a bounded slice is cheaper than the buffer
+        if end - start <= SCAN_BYTES:
+            return self._map[start:end].count(b'"')
+
+        view = memoryview(self._map)
+        buffer = self._scan_buffer
+        count = 0
+        try:
+            for position in range(start, end, SCAN_BYTES):
+                size = min(SCAN_BYTES, end - position)
+                buffer[:size] = view[position : position + size]
+                count += buffer.count(b'"', 0, size)
+        finally:
+            # The mapping can't be closed while a view of it exists
+            view.release()
+        return count
@@ -0,0 +1,315 @@
+from array import array
+
+
+class AttendanceRecord:
+    """
+    Compact attendance record holding only the fields used by the reports.
+
+    Uses __slots__ instead of a per-row dictionary: a record has no hash table and
+    drops every CSV column that is not exported (Timestamp, extra form columns...).
+    Field values are the same string objects read from the CSV file.
+
+    Attributes:
+        full_name (str): Student's full name
+        university_email (str): Student's university email (None if the sheet has no email column)
+        university_id (str): Student's university ID
+        course_code (str): Course code
+        course_time (str): Course time
+        doctor_ta_name (str): Doctor/TA name
+        error (str): Validation error message (None for valid records)
+    """
+
+    # CSV column name -> record attribute, in CSV column order
+    COLUMNS = {
+        "Full Name": "full_name",
+        "University Email": "university_email",
+        "University ID": "university_id",
+        "Course Code": "course_code",
+        "Course Time": "course_time",
+        "Doctor/TA Name": "doctor_ta_name",
+    }
+
+    __slots__ = tuple(COLUMNS.values()) + ("error",)
+
+    def __init__(
+        self,
+        full_name,
+        university_email,
+        university_id,
+        course_code,
+        course_time,
+        doctor_ta_name,
+        error=None,
+    ):
+        """
+        Initialize an attendance record.
+
+        Args:
+            full_name (str): Student's full name
+            university_email (str): Student's university email, None if not collected
+            university_id (str): Student's university ID
+            course_code (str): Course code
+            course_time (str): Course time
+            doctor_ta_name (str): Doctor/TA name
+            error (str, optional): Validation error message. Defaults to None (valid record)
+        """
+        self.full_name = full_name
+        self.university_email = university_email
+        self.university_id = university_id
+        self.course_code = course_code
+        self.course_time = course_time
+        self.doctor_ta_name = doctor_ta_name
+        self.error = error
+
+    @classmethod
+    def from_row(cls, row, error=None):
+        """
+        Adapter for dictionary rows (csv.DictReader rows, or the output of Processor.process()).
+
+        Args:
+            row (dict): Row keyed by CSV column names, extra columns are ignored
+            error (str, optional): Validation error message. Defaults to the row's "error" key
+
+        Returns:
+            AttendanceRecord: The record holding the row's report fields
+        """
+        return cls(
+            row.get("Full Name"),
+            row.get("University Email"),
+            row.get("University ID"),
+            row.get("Course Code"),
+            row.get("Course Time"),
+            row.get("Doctor/TA Name"),
+            error if error is not None else row.get("error"),
+        )
+
+    def to_dict(self):
+        """
+        Convert the record back to a row dictionary keyed by CSV column names.
+
+        Returns:
+            dict: Row dictionary, with an "error" key for invalid records
+                (the email column is omitted when it was not collected)
+        """
+        row = {}
+        for column, attribute in self.COLUMNS.items():
+            value = getattr(self, attribute)
+            if value is not None or column != "University Email":
+                row[column] = value
+        if self.error is not None:
+            row["error"] = self.error
+        return row
+
+    def table_cells(self):
+        """
+        Get the values shown in the attendance table, in column order.
+
+        Returns:
+            tuple: (full_name, university_id, course_code, course_time, doctor_ta_name)
+        """
+        return (
+            self.full_name,
+            self.university_id,
+            self.course_code,
+            self.course_time,
+            self.doctor_ta_name,
+        )
+
+    def __eq__(self, other):
+        """Records are equal when all their fields are equal."""
+        if not isinstance(other, AttendanceRecord):
+            return NotImplemented
+        return all(
+            getattr(self, attribute) == getattr(other, attribute)
+            for attribute in self.__slots__
+        )
+
+    def __repr__(self):
+        """Debug representation with the identifying fields."""
+        return (
+            f"AttendanceRecord(full_name={self.full_name!r}, "
+            f"university_id={self.university_id!r}, error={self.error!r})"
+        )
+
+
+class AttendanceBatch:
+    """
+    Columnar, dictionary-encoded collection of attendance records.
+
+    Design Note:
+        Every field is stored as an array of integer codes into a per-field dictionary
+        of distinct values. Values that repeat on nearly every row of a session sheet
+        (course code, course time, doctor/TA name) are stored once, and each row only
+        costs 4 bytes per field. Grouping and duplicate detection compare the integer
+        codes instead of the strings.
+
+    Attributes:
+        FIELDS (tuple): AttendanceRecord attributes stored by the batch, in column order
+    """
+
+    FIELDS = AttendanceRecord.__slots__
+
+    # Fields identifying one student's attendance of one session
+    DEDUPE_FIELDS = ("university_id", "course_code", "course_time")
+
+    def __init__(self, records=()):
+        """
+        Initialize the batch, optionally with records.
+
+        Args:
+            records (iterable, optional): AttendanceRecord objects to append. Defaults to empty
+        """
+        # Per field: row codes, distinct values (code -> value) and their codes (value -> code)
+        self._codes = {field: array("I") for field in self.FIELDS}
+        self._values = {field: [] for field in self.FIELDS}
+        self._lookup = {field: {} for field in self.FIELDS}
+
+        for record in records:
+            self.append(record)
+
+    def append(self, record):
+        """
+        Append a record, encoding each field against the batch's dictionaries.
+
+        Args:
+            record (AttendanceRecord): The record to append
+
+        Returns:
+            None: This method modifies the batch in place
+        """
+        for field in self.FIELDS:
+            value = getattr(record, field)
+            lookup = self._lookup[field]
+            code = lookup.get(value)
+            if code is None:
+                # First occurrence - add the value to the field's dictionary
+                code = len(self._values[field])
+                lookup[value] = code
+                self._values[field].append(value)
+            self._codes[field].append(code)
+
+    def codes(self, field):
+        """
+        Get the integer codes of a field, one per row.
+
+        Args:
+            field (str): One of FIELDS, e.g. "course_code"
+
+        Returns:
+            array.array: Codes indexing into values(field)
+        """
+        return self._codes[field]
+
+    def values(self, field):
+        """
+        Get the distinct values of a field, indexed by code.
+
+        Args:
+            field (str): One of FIELDS, e.g. "course_code"
+
+        Returns:
+            list: Distinct values, in order of first occurrence
+        """
+        return self._values[field]
+
+    def group_by(self, *fields):
+        """
+        Group row indices by the values of one or more fields, comparing codes only.
+
+        Args:
+            *fields (str): Fields to group by. Defaults to "course_code"
+
+        Returns:
+            dict: Field value (or tuple of values for several fields) -> list of row indices,
+                in order of first occurrence
+        """
+        fields = fields or ("course_code",)
+        groups = {}
+        for index, key in enumerate(zip(*(self._codes[field] for field in fields))):
+            groups.setdefault(key, []).append(index)
+
+        # Decode each group's key once
+        result = {}
+        for key, indices in groups.items():
+            values = tuple(self._values[field][code] for field, code in zip(fields, key))
+            result[values if len(fields) > 1 else values[0]] = indices
+        return result
+
+    def duplicate_indices(self, fields=DEDUPE_FIELDS):
+        """
+        Find rows repeating an earlier row's values for the given fields.
+
+        Args:
+            fields (tuple, optional): Fields identifying a duplicate. Defaults to DEDUPE_FIELDS
+
+        Returns:
+            list: Indices of every row except the first one of each key
+        """
+        seen = set()
+        duplicates = []
+        for index, key in enumerate(zip(*(self._codes[field] for field in fields))):
+            if key in seen:
+                duplicates.append(index)
+            else:
+                seen.add(key)
+        return duplicates
+
+    def dedupe(self, fields=DEDUPE_FIELDS):
+        """
+        Get a new batch keeping only the first row of each key.
+
+        Args:
+            fields (tuple, optional): Fields identifying a duplicate. Defaults to DEDUPE_FIELDS
+
+        Returns:
+            AttendanceBatch: Batch without the duplicate rows
+        """
+        duplicates = set(self.duplicate_indices(fields))
+        return self.take(index for index in range(len(self)) if index not in duplicates)
+
+    def take(self, indices):
+        """
+        Get a new batch with the given rows, in the given order.
+        The new batch shares no state with this one, its dictionaries are copies
+        (values only used by rows that were not taken are kept).
+
+        Args:
+            indices (iterable): Row indices to take
+
+        Returns:
+            AttendanceBatch: The selected rows
+        """
+        indices = list(indices)
+        batch = AttendanceBatch()
+        for field in self.FIELDS:
+            codes = self._codes[field]
+            batch._codes[field] = array("I", [codes[index] for index in indices])
+            batch._values[field] = list(self._values[field])
+            batch._lookup[field] = dict(self._lookup[field])
+        return batch
+
+    def __len__(self):
+        """Number of rows in the batch."""
+        return len(self._codes[self.FIELDS[0]])
+
+    def __getitem__(self, index):
+        """
+        Decode one row.
+
+        Args:
+            index (int): Row index (negative indices count from the end)
+
+        Returns:
+            AttendanceRecord: A new record holding the row's values
+        """
+        return AttendanceRecord(
+            *(self._values[field][self._codes[field][index]] for field in self.FIELDS)
+        )
+
+    def __iter__(self):
+        """Decode the rows one at a time, in order."""
+        columns = [
+            (self._values[field], self._codes[field]) for field in self.FIELDS
+        ]
+        for index in range(len(self)):
+            yield AttendanceRecord(*(values[codes[index]] for values, codes in columns))
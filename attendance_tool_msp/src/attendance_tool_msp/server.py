@@ -0,0 +1,609 @@
+"""
+Local HTTP service exporting attendance reports from uploaded CSV files.
+
+Run with:
+    python -m attendance_tool_msp.server --port 8080
+
+Endpoints:
+    POST /export?format=docx|pdf&title=...&dedupe=first|latest
+        Request body: the CSV file (raw bytes, e.g. curl --data-binary @data.csv)
+        Response: the Word or PDF report
+    GET /metrics
+        Response: JSON request counters and export latency statistics
+    GET /health
+        Response: "ok"
+
+Reports are built in a pool of worker processes started (and warmed up) with the
+server, so requests don't pay for interpreter startup or python-docx/ReportLab imports.
+Only the standard library is used; the server binds to localhost by default.
+"""
+
+import os, io, re, json, time, asyncio, argparse, tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlsplit, parse_qs, quote
+
+from .processor import Processor
+
+# Report format -> (file extension, Content-Type)
+REPORT_FORMATS = {
+    "docx": (
+        ".docx",
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ),
+    "pdf": (".pdf", "application/pdf"),
+}
+
+# Reason phrases of the status codes sent by the server
+STATUS_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    408: "Request Timeout",
+    411: "Length Required",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+# Largest accepted CSV upload, in bytes
+MAX_UPLOAD_BYTES = 32 * 1024 * 1024
+
+# Seconds a client has to send its whole request
+REQUEST_TIMEOUT = 30
+
+# Number of recent export latencies kept for the percentiles in /metrics
+LATENCY_WINDOW = 1024
+
+
+def _warm_worker():
+    """
+    Worker process initializer - Import and exercise the document stack once.
+
+    Building an empty report loads python-docx (and its default template),
+    ReportLab and the fonts, so the first real request doesn't pay for them.
+
+    Returns:
+        None
+    """
+    from .exporter import Exporter
+
+    exporter = Exporter([], [], "Warm Up")
+    exporter.export_word(stream=io.BytesIO())
+    exporter.export_pdf(stream=io.BytesIO())
+
+
+def _ping():
+    """
+    No-op task used to start the worker processes with the server.
+
+    Returns:
+        int: The worker's process ID
+    """
+    return os.getpid()
+
+
+def render_report(csv_data, report_format, title, dedupe=None):
+    """
+    Validate an uploaded CSV file and build its report. Runs inside a worker process.
+
+    Args:
+        csv_data (bytes): Content of the CSV file
+        report_format (str): "docx" or "pdf"
+        title (str): Report title
+        dedupe (str, optional): Duplicate submission policy ("first" or "latest")
+
+    Returns:
+        tuple: (report bytes, number of valid rows, number of invalid rows)
+
+    Raises:
+        ValueError: If the CSV file or the arguments are invalid
+    """
+    from .exporter import Exporter
+
+    # Processor reads files, the upload only lives for the duration of the request
+    with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as file:
+        file.write(csv_data)
+    try:
+        valid_rows, invalid_rows = Processor(file.name, dedupe=dedupe).process_records()
+    finally:
+        os.remove(file.name)
+
+    exporter = Exporter(valid_rows, invalid_rows, title)
+    stream = io.BytesIO()
+    if report_format == "docx":
+        exporter.export_word(stream=stream)
+    else:
+        exporter.export_pdf(stream=stream)
+    return stream.getvalue(), len(valid_rows), len(invalid_rows)
+
+
+class HTTPError(Exception):
+    """
+    Error answered to the client with a status code and a plain-text message.
+
+    Attributes:
+        status (int): HTTP status code
+    """
+
+    def __init__(self, status, message):
+        """
+        Initialize the error.
+
+        Args:
+            status (int): HTTP status code
+            message (str): Message sent as the response body
+        """
+        super().__init__(message)
+        self.status = status
+
+
+class ReportServer:
+    """
+    Asyncio HTTP server exporting attendance reports through a warm process pool.
+
+    Design Note:
+        The event loop only parses requests and streams responses; validation and
+        document building run in the worker processes. A semaphore bounds the number
+        of exports in progress, further requests wait for a free slot instead of
+        piling up in the pool's queue, and their waiting time counts in the latency.
+
+    Attributes:
+        host (str): Interface the server listens on
+        port (int): Port the server listens on (the assigned port once started with port 0)
+        workers (int): Number of worker processes
+        max_concurrency (int): Maximum number of exports in progress
+        max_upload_bytes (int): Largest accepted CSV upload, in bytes
+    """
+
+    def __init__(
+        self,
+        host="127.0.0.1",
+        port=8080,
+        workers=None,
+        max_concurrency=None,
+        max_upload_bytes=MAX_UPLOAD_BYTES,
+    ):
+        """
+        Initialize the server, nothing is started until start() is awaited.
+
+        Args:
+            host (str, optional): Interface to listen on. Defaults to "127.0.0.1" (localhost only)
+            port (int, optional): Port to listen on, 0 picks a free port. Defaults to 8080
+            workers (int, optional): Number of worker processes. Defaults to the CPU count
+            max_concurrency (int, optional): Maximum number of exports in progress.
+                Defaults to the number of workers
+            max_upload_bytes (int, optional): Largest accepted CSV upload. Defaults to 32 MiB
+
+        Raises:
+            ValueError: If workers, max_concurrency or max_upload_bytes is not a positive integer
+        """
+        workers = workers if workers is not None else os.cpu_count() or 1
+        # Pythonic Ternary Operator!
+        max_concurrency = max_concurrency if max_concurrency is not None else workers
+        for name, value in (
+            ("Workers", workers),
+            ("Max concurrency", max_concurrency),
+            ("Max upload bytes", max_upload_bytes),
+        ):
+            if not isinstance(value, int) or value < 1:
+                raise ValueError(f"{name} must be a positive integer")
+
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.max_concurrency = max_concurrency
+        self.max_upload_bytes = max_upload_bytes
+
+        self._server = None
+        self._executor = None
+        self._semaphore = None
+
+        # Metrics
+        self._started = None
+        self._requests = 0
+        self._responses = {}
+        self._in_flight = 0
+        self._waiting = 0
+        self._exported_rows = 0
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+        self._latency_count = 0
+        self._latency_total = 0.0
+
+    async def start(self):
+        """
+        Start the worker processes and wait until they are warm, then start listening.
+
+        Returns:
+            None
+        """
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_warm_worker
+        )
+        loop = asyncio.get_running_loop()
+
+        # One task per worker, so every process is started and warmed up now
+        await asyncio.gather(
+            *(loop.run_in_executor(self._executor, _ping) for _ in range(self.workers))
+        )
+
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._server = await asyncio.start_server(
+            self.__handle_connection, self.host, self.port
+        )
+        # Port 0 means any free port: read back the one that was assigned
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._started = time.monotonic()
+
+    async def close(self):
+        """
+        Stop listening and shut the worker processes down.
+
+        Returns:
+            None
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def serve_forever(self, ready=None):
+        """
+        Start the server and serve requests until cancelled.
+
+        Args:
+            ready (callable, optional): Called without arguments once the server is
+                listening, e.g. to print the port picked for port 0. Defaults to None
+
+        Returns:
+            None
+        """
+        await self.start()
+        if ready is not None:
+            ready()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    def metrics(self):
+        """
+        Get request counters and export latency statistics.
+
+        Returns:
+            dict: Counters, in-flight/waiting exports and latency percentiles in milliseconds
+                (over the last LATENCY_WINDOW exports)
+        """
+        latencies = sorted(self._latencies)
+
+        def percentile(fraction):
+            """Nearest-rank percentile of the recent latencies, in milliseconds."""
+            if not latencies:
+                return 0.0
+            index = min(len(latencies) - 1, int(fraction * len(latencies)))
+            return round(latencies[index] * 1000, 3)
+
+        # Pythonic Ternary Operator!
+        uptime = time.monotonic() - self._started if self._started is not None else 0.0
+        return {
+            "uptime_seconds": round(uptime, 3),
+            "workers": self.workers,
+            "max_concurrency": self.max_concurrency,
+            "requests": self._requests,
+            "responses": {str(status): count for status, count in sorted(self._responses.items())},
+            "exports_in_flight": self._in_flight,
+            "exports_waiting": self._waiting,
+            "exported_rows": self._exported_rows,
+            "export_latency_ms": {
+                "count": self._latency_count,
+                "mean": round(self._latency_total / self._latency_count * 1000, 3)
+                if self._latency_count
+                else 0.0,
+                "p50": percentile(0.50),
+                "p95": percentile(0.95),
+                "p99": percentile(0.99),
+                "max": percentile(1.0),
+            },
+        }
+
+    async def __handle_connection(self, reader, writer):
+        """
+        Helper method for serving - Answer a single request, then close the connection.
+
+        Args:
+            reader (asyncio.StreamReader): Client request stream
+            writer (asyncio.StreamWriter): Client response stream
+
+        Returns:
+            None
+        """
+        self._requests += 1
+        try:
+            try:
+                method, target, headers, body = await asyncio.wait_for(
+                    self.__read_request(reader), REQUEST_TIMEOUT
+                )
+                status, content_type, payload, extra_headers = await self.__route(
+                    method, target, headers, body
+                )
+                # Formatted here, so a response that can't be serialized is answered with a 500
+                response = self.__format_response(status, content_type, payload, extra_headers)
+            except HTTPError as error:
+                status = error.status
+                response = self.__format_error(status, str(error))
+            except asyncio.TimeoutError:
+                status = 408
+                response = self.__format_error(status, "Request timed out")
+            except (ConnectionError, asyncio.IncompleteReadError):
+                raise
+            except Exception as error:
+                # Unexpected failures still answer the client, and count as 500 in the metrics
+                status = 500
+                response = self.__format_error(status, f"Internal server error: {type(error).__name__}")
+
+            self._responses[status] = self._responses.get(status, 0) + 1
+            writer.write(response)
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass  # Client went away, nothing to answer
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def __read_request(self, reader):
+        """
+        Helper method for serving - Parse the request line, headers and body.
+
+        Args:
+            reader (asyncio.StreamReader): Client request stream
+
+        Returns:
+            tuple: (method, target, headers with lowercase names, body bytes)
+
+        Raises:
+            HTTPError: If the request is malformed or the body is too large
+        """
+        request_line = (await self.__read_line(reader)).strip()
+        parts = request_line.split()
+        if len(parts) != 3 or not parts[2].startswith("HTTP/"):
+            raise HTTPError(400, "Malformed request line")
+        method, target, _ = parts
+
+        headers = {}
+        while True:
+            line = await self.__read_line(reader)
+            if line in ("\r\n", "\n", ""):
+                break
+            name, separator, value = line.partition(":")
+            if not separator:
+                raise HTTPError(400, "Malformed header line")
+            headers[name.strip().lower()] = value.strip()
+
+        body = b""
+        if method == "POST":
+            if "content-length" not in headers:
+                raise HTTPError(411, "Content-Length header is required")
+            try:
+                length = int(headers["content-length"])
+            except ValueError:
+                raise HTTPError(400, "Invalid Content-Length header")
+            if length < 0:
+                raise HTTPError(400, "Invalid Content-Length header")
+            if length > self.max_upload_bytes:
+                raise HTTPError(413, f"CSV upload exceeds {self.max_upload_bytes} bytes")
+            body = await reader.readexactly(length)
+
+        return method, target, headers, body
+
+    @staticmethod
+    async def __read_line(reader):
+        """
+        Helper method for serving - Read one line of the request head.
+
+        Args:
+            reader (asyncio.StreamReader): Client request stream
+
+        Returns:
+            str: The line, including its line ending ("" at the end of the stream)
+
+        Raises:
+            HTTPError: If the line is longer than the stream's buffer limit (64 KiB)
+        """
+        try:
+            line = await reader.readline()
+        except ValueError:
+            # readline() reports a LimitOverrunError as a ValueError
+            raise HTTPError(400, "Request line or header too long")
+        return line.decode("latin-1")
+
+    async def __route(self, method, target, headers, body):
+        """
+        Helper method for serving - Dispatch a request to its endpoint.
+
+        Args:
+            method (str): Request method
+            target (str): Request target (path and query string)
+            headers (dict): Request headers
+            body (bytes): Request body
+
+        Returns:
+            tuple: (status, content type, payload bytes, extra headers)
+
+        Raises:
+            HTTPError: If the endpoint or method is unknown, or the export fails
+        """
+        url = urlsplit(target)
+
+        if url.path == "/health":
+            if method != "GET":
+                raise HTTPError(405, "Use GET /health")
+            return 200, "text/plain; charset=utf-8", b"ok", {}
+
+        if url.path == "/metrics":
+            if method != "GET":
+                raise HTTPError(405, "Use GET /metrics")
+            payload = json.dumps(self.metrics(), indent=2).encode()
+            return 200, "application/json", payload, {}
+
+        if url.path == "/export":
+            if method != "POST":
+                raise HTTPError(405, "Use POST /export with the CSV file as the request body")
+            return await self.__export(parse_qs(url.query), body)
+
+        raise HTTPError(404, f"Unknown endpoint: {url.path}")
+
+    async def __export(self, query, body):
+        """
+        Helper method for serving - Build a report in a worker process.
+
+        Args:
+            query (dict): Parsed query string (format, title and dedupe)
+            body (bytes): The uploaded CSV file
+
+        Returns:
+            tuple: (status, content type, report bytes, extra headers)
+
+        Raises:
+            HTTPError: If the arguments or the CSV file are invalid, or the export fails
+        """
+        report_format = query.get("format", ["pdf"])[0]
+        title = query.get("title", ["Attendance Report"])[0]
+        dedupe = query.get("dedupe", [None])[0]
+
+        if report_format not in REPORT_FORMATS:
+            raise HTTPError(400, f"Unknown export format: {report_format}")
+        if dedupe not in (None, "first", "latest"):
+            raise HTTPError(400, 'Dedupe must be "first" or "latest"')
+        if not body:
+            raise HTTPError(400, "The request body must contain the CSV file")
+
+        start = time.perf_counter()
+        loop = asyncio.get_running_loop()
+
+        # Wait for a free slot, then hand the export to a warm worker
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+
+        self._in_flight += 1
+        try:
+            report, valid, invalid = await loop.run_in_executor(
+                self._executor, render_report, body, report_format, title, dedupe
+            )
+        except (ValueError, FileNotFoundError) as error:
+            raise HTTPError(400, str(error))
+        except Exception as error:
+            raise HTTPError(500, f"Export failed: {type(error).__name__}: {error}")
+        finally:
+            self._in_flight -= 1
+            self._semaphore.release()
+
+        latency = time.perf_counter() - start
+        self._latencies.append(latency)
+        self._latency_count += 1
+        self._latency_total += latency
+        self._exported_rows += valid + invalid
+
+        extension, content_type = REPORT_FORMATS[report_format]
+        # Same safe characters as the exported file names (Unicode letters kept), and an
+        # ASCII fallback since header values are Latin-1: filename* (RFC 5987) carries the UTF-8 name
+        filename = re.sub(r"\W", "_", title.replace(" ", "_")).strip("_") or "report"
+        ascii_filename = re.sub(r"[^A-Za-z0-9_-]", "_", filename).strip("_") or "report"
+        return (
+            200,
+            content_type,
+            report,
+            {
+                "Content-Disposition": (
+                    f'attachment; filename="{ascii_filename}{extension}"; '
+                    f"filename*=UTF-8''{quote(filename + extension, safe='')}"
+                ),
+                "X-Valid-Rows": str(valid),
+                "X-Invalid-Rows": str(invalid),
+            },
+        )
+
+    @staticmethod
+    def __format_error(status, message):
+        """
+        Helper method for serving - Serialize a plain-text error response.
+
+        Args:
+            status (int): HTTP status code
+            message (str): Error message sent as the response body
+
+        Returns:
+            bytes: The full HTTP/1.1 response
+        """
+        return ReportServer.__format_response(
+            status, "text/plain; charset=utf-8", message.encode(), {}
+        )
+
+    @staticmethod
+    def __format_response(status, content_type, payload, extra_headers):
+        """
+        Helper method for serving - Serialize a response.
+
+        Args:
+            status (int): HTTP status code
+            content_type (str): Content-Type header value
+            payload (bytes): Response body
+            extra_headers (dict): Additional headers
+
+        Returns:
+            bytes: The full HTTP/1.1 response
+        """
+        lines = [
+            f"HTTP/1.1 {status} {STATUS_REASONS.get(status, 'Unknown')}",
+            f"Content-Type: {content_type}",
+            f"Content-Length: {len(payload)}",
+            "Connection: close",
+        ]
+        lines.extend(f"{name}: {value}" for name, value in extra_headers.items())
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + payload
+
+
+def main(argv=None):
+    """
+    Command line entry point: serve reports until interrupted.
+
+    Args:
+        argv (list, optional): Command line arguments. Defaults to sys.argv[1:]
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(
+        description="Serve attendance reports for uploaded CSV files over HTTP"
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on (default: localhost)")
+    parser.add_argument("--port", type=int, default=8080, help="Port to listen on (default: 8080)")
+    parser.add_argument("--workers", type=int, help="Number of worker processes (default: CPU count)")
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        help="Maximum number of exports in progress (default: number of workers)",
+    )
+    args = parser.parse_args(argv)
+
+    server = ReportServer(args.host, args.port, args.workers, args.max_concurrency)
+    # Printed once listening, so --port 0 shows the port that was actually picked
+    def ready():
+        print(f"Serving attendance reports on http://{args.host}:{server.port} (Ctrl+C to stop)")
+
+    try:
+        asyncio.run(server.serve_forever(ready))
+    except KeyboardInterrupt:
+        print("Server stopped.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+Optional NumPy-backed column-wise validation engine.
+
+Rows are validated in batches: each column of a batch is loaded into a NumPy array and
+boolean masks select the values that are already valid and normalized (a canonical
+"YYYY/XXXXX" ID, a title-cased ASCII name, a plain university email...). Those values
+need no work at all. Only the remaining values go through the scalar validators of
+Processor, once per distinct value in the batch, so normalization and error messages
+are exactly the ones of the scalar path.
+
+Install NumPy to enable it: pip install "attendance-tool-msp[fast]"
+"""
+
+import validators
+from datetime import datetime
+from itertools import islice
+from . import processor
+from .processor import ROW_VALIDATORS, _email_row_validator
+
+try:
+    import numpy
+except ImportError:  # Optional dependency, the scalar engine is used without it
+    numpy = None
+
+# Rows validated together, large enough to amortize the per-column NumPy calls
+BATCH_SIZE = 4096
+
+# Translation tables deleting the characters a fast-path value may contain:
+# a value is made of allowed characters only if nothing is left after translation
+NAME_CHARACTERS = str.maketrans(
+    "", "", "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ '-"
+)
+EMAIL_LOCAL_CHARACTERS = str.maketrans(
+    "", "", "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._-"
+)
+
+
+def available():
+    """
+    Check whether the vectorized engine can be used.
+
+    Returns:
+        bool: True if NumPy is installed
+    """
+    return numpy is not None
+
+
+def validate_rows(reader, has_email, batch_size=BATCH_SIZE, email_domains=None):
+    """
+    Validate rows batch by batch, with the same results as the scalar _validate_rows().
+
+    Args:
+        reader (iterable): Row dictionaries (e.g. a csv.DictReader)
+        has_email (bool): Whether the 'University Email' column should be validated
+        batch_size (int, optional): Rows per batch. Defaults to BATCH_SIZE
+        email_domains (tuple, optional): Allowed email domains. Defaults to None (EMAIL_DOMAINS)
+
+    Yields:
+        tuple: (row, error) where error is None for valid rows or the error message (str)
+    """
+    # Pythonic Ternary Operator!
+    email_domains = processor.EMAIL_DOMAINS if email_domains is None else tuple(email_domains)
+    columns = list(ROW_VALIDATORS)
+    if has_email:
+        columns.insert(0, _email_row_validator(email_domains))
+
+    rows = iter(reader)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            return
+        errors = _validate_batch(batch, columns, email_domains)
+        yield from zip(batch, errors)
+
+
+def _validate_batch(rows, columns, email_domains):
+    """
+    Validate one batch column by column, in the scalar validation order.
+
+    A row's columns are only validated until its first error, and the columns before
+    the failing one are normalized in place, exactly like Processor.validate_row().
+
+    Args:
+        rows (list): Row dictionaries, normalized in place
+        columns (list): (column, validator, cacheable) in validation order
+        email_domains (tuple): Allowed email domains, the same as the email validator's
+
+    Returns:
+        list: Error message (or None) per row
+    """
+    count = len(rows)
+    errors = [None] * count
+    # Rows without an error so far: only these are validated further
+    pending = numpy.ones(count, dtype=bool)
+    current_year = datetime.now().year
+
+    for column, validator, _ in columns:
+        values = [row[column] for row in rows]
+        fast = _fast_mask(column, values, current_year, email_domains)
+        slow = numpy.flatnonzero(pending & ~fast)
+        if not len(slow):
+            continue
+
+        # Distinct slow values are validated once, their result (or error) is shared
+        results = {}
+        for index in slow.tolist():
+            value = values[index]
+            try:
+                result = results[value]
+            except KeyError:
+                try:
+                    result = (validator(value), None)
+                except (ValueError, validators.ValidationError) as error:
+                    result = (None, str(error))
+                results[value] = result
+
+            normalized, error = result
+            if error is not None:
+                errors[index] = error
+                pending[index] = False
+            elif column != "University Email":
+                # Email is only checked, other columns are normalized in place
+                rows[index][column] = normalized
+
+    return errors
+
+
+def _fast_mask(column, values, current_year, email_domains):
+    """
+    Select the values that are valid and already normalized for a column.
+
+    The masks are conservative: any value they reject still goes through the scalar
+    validator, so a rejected valid value only costs time, never a different result.
+
+    Args:
+        column (str): Column name
+        values (list): The column's values (None for missing cells)
+        current_year (int): Upper bound of the student ID year
+        email_domains (tuple): Allowed email domains
+
+    Returns:
+        numpy.ndarray: Boolean mask, True where the scalar validator would return the value unchanged
+    """
+    count = len(values)
+    fast = _FAST_CHECKS.get(column)
+    if fast is None or None in values:
+        return numpy.zeros(count, dtype=bool)
+
+    array = numpy.array(values, dtype=str)
+    # Fixed-width NumPy strings drop trailing NUL characters: only keep exact copies
+    lengths = numpy.fromiter(map(len, values), dtype=numpy.int64, count=count)
+    exact = numpy.char.str_len(array) == lengths
+
+    return exact & fast(array, lengths, current_year, email_domains)
+
+
+def _fast_email(array, lengths, current_year, email_domains):
+    """Plain university emails: ASCII dot-atom local part and a lowercase allowed domain."""
+    parts = numpy.char.rpartition(array, "@")
+    local, separator, domain = parts[:, 0], parts[:, 1], parts[:, 2]
+    local_lengths = numpy.char.str_len(local)
+
+    return (
+        (separator == "@")
+        & numpy.isin(domain, list(processor._valid_email_domains(email_domains)))
+        & (local_lengths >= 1)
+        & (local_lengths <= 64)
+        & (numpy.char.translate(local, EMAIL_LOCAL_CHARACTERS) == "")
+        & ~numpy.char.startswith(local, ".")
+        & ~numpy.char.endswith(local, ".")
+        & (numpy.char.find(local, "..") == -1)
+    )
+
+
+def _fast_name(array, lengths, current_year, email_domains):
+    """Title-cased ASCII names of 3-50 characters and 1-5 single-space separated words."""
+    return (
+        (lengths >= 3)
+        & (lengths <= 50)
+        & (numpy.char.translate(array, NAME_CHARACTERS) == "")
+        & (numpy.char.strip(array) == array)
+        & (numpy.char.find(array, "  ") == -1)
+        & (numpy.char.count(array, " ") <= 4)
+        & (numpy.char.title(array) == array)
+    )
+
+
+def _fast_university_id(array, lengths, current_year, email_domains):
+    """Canonical YYYY/XXXXX IDs with ASCII digits and a year between 2010 and the current year."""
+    fast = lengths == 10
+    if not fast.any():
+        return fast
+
+    # One row of 10 Unicode code points per ID
+    codes = numpy.zeros((len(array), 10), dtype=numpy.uint32)
+    codes[fast] = array[fast].astype("U10").view(numpy.uint32).reshape(-1, 10)
+
+    digit_columns = [0, 1, 2, 3, 5, 6, 7, 8, 9]
+    digits = codes[:, digit_columns].astype(numpy.int64) - ord("0")
+    year = digits[:, 0] * 1000 + digits[:, 1] * 100 + digits[:, 2] * 10 + digits[:, 3]
+
+    return (
+        fast
+        & (codes[:, 4] == ord("/"))
+        & ((digits >= 0) & (digits <= 9)).all(axis=1)
+        & (year >= 2010)
+        & (year <= current_year)
+    )
+
+
+# Columns with a fast path. Course Code, Course Time and Doctor/TA Name repeat a handful of
+# values per sheet: their distinct values are simply validated once per batch
+_FAST_CHECKS = {
+    "University Email": _fast_email,
+    "Full Name": _fast_name,
+    "University ID": _fast_university_id,
+}
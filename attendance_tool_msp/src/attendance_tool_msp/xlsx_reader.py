@@ -0,0 +1,587 @@
+import zipfile, posixpath, tempfile
+from array import array
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from xml.etree.ElementTree import XMLParser, iterparse, ParseError
+
+# Relationship types (suffixes) of the workbook parts that are read
+OFFICE_DOCUMENT_REL = "/officeDocument"
+SHARED_STRINGS_REL = "/sharedStrings"
+STYLES_REL = "/styles"
+
+# Built-in number formats that display a date, and those that also display a time
+DATE_FORMAT_IDS = frozenset(range(14, 23)) | frozenset((45, 46, 47))
+TIME_FORMAT_IDS = frozenset(range(18, 23)) | frozenset((45, 46, 47))
+
+# Day 0 of the two Excel date systems (1900, with its fictitious 29/02/1900, and 1904)
+EPOCH_1900 = datetime(1899, 12, 30)
+EPOCH_1904 = datetime(1904, 1, 1)
+
+# Bytes of XML fed to the parser at a time while streaming a part
+FEED_BYTES = 64 * 1024
+
+# Shared strings parts larger than this (uncompressed) are spilled to a temporary file
+SHARED_STRINGS_MEMORY_BYTES = 8 * 1024 * 1024
+
+# Spilled shared strings kept in memory, most recently used first
+SHARED_STRINGS_CACHE = 4096
+
+
+class XlsxReader:
+    """
+    Streaming reader for the first (or a named) worksheet of an .xlsx workbook.
+
+    Design Note:
+        An .xlsx file is a zip archive of XML parts. The worksheet part is decompressed
+        and parsed in FEED_BYTES blocks by an expat parser whose callbacks collect cell
+        values directly, without building an element tree, so memory stays flat however
+        many rows the sheet has. The shared strings table (the sheet's distinct cell
+        texts) and the date styles are read up front. A small table is kept as a list;
+        beyond SHARED_STRINGS_MEMORY_BYTES of XML the texts are written to a temporary
+        file and read back by index when a cell refers to them (see _SpilledStrings),
+        so only an 8 byte offset per string and the most recently used texts stay in
+        memory. Sheets with many distinct names then don't hold them all at once.
+
+        Rows are produced like csv.DictReader produces them: the first non-empty row is
+        the header (fieldnames, which may be reassigned before reading), the following
+        rows are dictionaries keyed by it, cells beyond the header are stored in a list
+        under the None key, and empty rows are skipped. Cells are read as the text a CSV
+        export would contain: numbers without a trailing ".0", dates and times in the
+        Google Forms timestamp format (e.g. 3/12/2025 09:15:10), and empty cells as "".
+
+    Attributes:
+        file_path (str): Path to the .xlsx file
+        sheet_name (str): Name of the worksheet being read
+    """
+
+    def __init__(self, file_path, sheet=None):
+        """
+        Open the workbook and load its shared strings and date styles.
+
+        Args:
+            file_path (str): Path to the .xlsx file
+            sheet (str, optional): Worksheet name. Defaults to None (the first worksheet)
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            ValueError: If the file is not a valid .xlsx workbook or the sheet does not exist
+        """
+        self.file_path = file_path
+        try:
+            self._zip = zipfile.ZipFile(file_path)
+        except zipfile.BadZipFile:
+            raise ValueError(f"The file '{file_path}' is not a valid .xlsx workbook")
+
+        self._shared_strings = []
+        try:
+            workbook_path = [
+                target
+                for _, kind, target in self.__relationships("")
+                if kind.endswith(OFFICE_DOCUMENT_REL)
+            ][0]
+            sheets, date1904 = self.__read_workbook(workbook_path)
+            parts = self.__relationships(workbook_path)
+
+            if sheet is None:
+                self.sheet_name, sheet_id = sheets[0]
+            else:
+                sheet_id = dict(sheets).get(sheet)
+                if sheet_id is None:
+                    raise ValueError(f"The workbook '{file_path}' has no sheet named '{sheet}'")
+                self.sheet_name = sheet
+            self._sheet_path = {key: target for key, _, target in parts}[sheet_id]
+
+            date_styles = {}
+            for _, kind, target in parts:
+                if kind.endswith(SHARED_STRINGS_REL):
+                    if self._zip.getinfo(target).file_size > SHARED_STRINGS_MEMORY_BYTES:
+                        self._shared_strings = _SpilledStrings()
+                    self.__parse(target, _SharedStrings(self._shared_strings))
+                elif kind.endswith(STYLES_REL):
+                    date_styles = self.__read_date_styles(target)
+        except (KeyError, IndexError, ParseError):
+            self.__close_parts()
+            raise ValueError(f"The file '{file_path}' is not a valid .xlsx workbook")
+        except ValueError:
+            self.__close_parts()
+            raise
+
+        # Pythonic Ternary Operator!
+        epoch = EPOCH_1904 if date1904 else EPOCH_1900
+        self._cells = _SheetRows(self._shared_strings, date_styles, epoch)
+        self._rows = self.__iter_values()
+        self._fieldnames = None
+
+    def __enter__(self):
+        """Use the reader as a context manager, closing the workbook on exit."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the workbook."""
+        self.close()
+
+    def close(self):
+        """
+        Close the workbook, rows can't be read afterwards.
+
+        Returns:
+            None
+        """
+        self._rows.close()
+        self.__close_parts()
+
+    # Getter
+    @property
+    def fieldnames(self):
+        """
+        Get the header row, read on first access like csv.DictReader.
+
+        Returns:
+            list: Column names, None for an empty sheet
+        """
+        if self._fieldnames is None:
+            self._fieldnames = next(self._rows, None)
+        return self._fieldnames
+
+    # Setter
+    @fieldnames.setter
+    def fieldnames(self, fieldnames):
+        """
+        Set the column names used as row keys (e.g. stripped headers).
+
+        Args:
+            fieldnames (list): Column names
+
+        Returns:
+            None: This setter does not return a value
+        """
+        self._fieldnames = fieldnames
+
+    def __iter__(self):
+        """
+        Iterate over the data rows.
+
+        Yields:
+            dict: Row keyed by fieldnames, extra cells under the None key
+        """
+        fieldnames = self.fieldnames
+        if fieldnames is None:
+            return
+
+        width = len(fieldnames)
+        for values in self._rows:
+            row = dict(zip(fieldnames, values))
+            if len(values) < width:
+                for name in fieldnames[len(values) :]:
+                    row[name] = ""
+            elif len(values) > width:
+                row[None] = values[width:]
+            yield row
+
+    def __iter_values(self):
+        """
+        Helper method for streaming - Parse the worksheet block by block.
+
+        Yields:
+            list: Non-empty rows as lists of cell texts, gaps filled with "" and trailing empty cells removed
+
+        Raises:
+            ValueError: If the worksheet XML is malformed
+        """
+        cells = self._cells
+        parser = XMLParser(target=cells)
+        with self._zip.open(self._sheet_path) as part:
+            try:
+                for block in iter(lambda: part.read(FEED_BYTES), b""):
+                    parser.feed(block)
+                    # Only the rows completed by this block are held in memory
+                    yield from cells.rows
+                    cells.rows.clear()
+                parser.close()
+            except ParseError:
+                raise ValueError(f"The file '{self.file_path}' is not a valid .xlsx workbook")
+        yield from cells.rows
+
+    def __close_parts(self):
+        """
+        Helper method for closing - Close the archive and the spilled shared strings, if any.
+
+        Returns:
+            None
+        """
+        self._zip.close()
+        if isinstance(self._shared_strings, _SpilledStrings):
+            self._shared_strings.close()
+
+    def __parse(self, path, target):
+        """
+        Helper method for opening - Stream a whole part through a parser target.
+
+        Args:
+            path (str): Part path inside the archive
+            target (object): Parser target (start, end and data callbacks)
+
+        Returns:
+            object: The target, holding the parsed data
+        """
+        parser = XMLParser(target=target)
+        with self._zip.open(path) as part:
+            for block in iter(lambda: part.read(FEED_BYTES), b""):
+                parser.feed(block)
+        parser.close()
+        return target
+
+    def __relationships(self, part_path):
+        """
+        Helper method for opening - Read the relationships of a package part.
+
+        Args:
+            part_path (str): Part path inside the archive, "" for the package itself
+
+        Returns:
+            list: (id, type, target path) tuples, target paths relative to the archive root
+        """
+        directory, name = posixpath.split(part_path)
+        rels_path = posixpath.join(directory, "_rels", f"{name}.rels")
+
+        relationships = []
+        with self._zip.open(rels_path) as part:
+            for _, element in iterparse(part):
+                if not element.tag.endswith("}Relationship"):
+                    continue
+                target = element.get("Target", "")
+                if target.startswith("/"):
+                    target = target[1:]
+                else:
+                    target = posixpath.normpath(posixpath.join(directory, target))
+
+                relationships.append((element.get("Id"), element.get("Type", ""), target))
+        return relationships
+
+    def __read_workbook(self, workbook_path):
+        """
+        Helper method for opening - Read the worksheet list and the date system.
+
+        Args:
+            workbook_path (str): Workbook part path
+
+        Returns:
+            tuple: ([(sheet name, relationship id), ...] in workbook order, uses the 1904 date system)
+        """
+        sheets = []
+        date1904 = False
+        with self._zip.open(workbook_path) as part:
+            for _, element in iterparse(part):
+                if element.tag.endswith("}sheet"):
+                    relationship = next(
+                        value for key, value in element.attrib.items() if key.endswith("}id")
+                    )
+                    sheets.append((element.get("name"), relationship))
+                elif element.tag.endswith("}workbookPr"):
+                    date1904 = element.get("date1904", "0") in ("1", "true")
+        return sheets, date1904
+
+    def __read_date_styles(self, path):
+        """
+        Helper method for opening - Find the cell styles that display dates or times.
+
+        Args:
+            path (str): Styles part path
+
+        Returns:
+            dict: Date cell style index (the cells' "s" attribute) -> whether it displays a time
+        """
+        custom_formats = {}
+        date_styles = {}
+        with self._zip.open(path) as part:
+            in_cell_formats = False
+            index = 0
+            for event, element in iterparse(part, events=("start", "end")):
+                tag = element.tag.rpartition("}")[2]
+                if tag == "cellXfs":
+                    in_cell_formats = event == "start"
+                elif event == "end" and tag == "numFmt":
+                    tokens = _format_tokens(element.get("formatCode", ""))
+                    custom_formats[int(element.get("numFmtId"))] = tokens
+                elif event == "end" and tag == "xf" and in_cell_formats:
+                    format_id = int(element.get("numFmtId", 0))
+                    tokens = custom_formats.get(format_id, "")
+                    if format_id in DATE_FORMAT_IDS:
+                        date_styles[index] = format_id in TIME_FORMAT_IDS
+                    elif any(token in tokens for token in "dmy"):
+                        date_styles[index] = "h" in tokens or "s" in tokens
+                    index += 1
+        return date_styles
+
+
+class _SharedStrings:
+    """
+    Parser target for the shared strings part.
+
+    Attributes:
+        strings (list or _SpilledStrings): String texts, indexed by the "s" cells' values
+    """
+
+    def __init__(self, strings):
+        self.strings = strings
+        self._texts = None
+        self._text = None
+        self._phonetic = False
+
+    def start(self, tag, attrib):
+        """Start an <si> item, or collect a <t> text outside phonetic hints (<rPh>)."""
+        name = tag[tag.rfind("}") + 1 :]
+        if name == "si":
+            self._texts = []
+        elif name == "t" and not self._phonetic:
+            self._text = []
+        elif name == "rPh":
+            self._phonetic = True
+
+    def end(self, tag):
+        """Join an item's plain text or rich text runs."""
+        name = tag[tag.rfind("}") + 1 :]
+        if name == "t" and self._text is not None:
+            self._texts.append("".join(self._text))
+            self._text = None
+        elif name == "si":
+            self.strings.append("".join(self._texts))
+        elif name == "rPh":
+            self._phonetic = False
+
+    def data(self, text):
+        """Collect text inside <t>."""
+        if self._text is not None:
+            self._text.append(text)
+
+    def close(self):
+        """Nothing to return, the strings are read from the target."""
+        return None
+
+
+class _SpilledStrings:
+    """
+    Shared strings stored in a temporary file, read back by index.
+
+    Only the offset of every string and a bounded cache of recently used texts are
+    kept in memory. Course codes, times and instructors repeat on most rows, so they
+    stay cached, while each student's name is usually read once.
+
+    Attributes:
+        cache_size (int): Maximum number of cached texts
+    """
+
+    def __init__(self, cache_size=None):
+        # Pythonic Ternary Operator!
+        self.cache_size = SHARED_STRINGS_CACHE if cache_size is None else cache_size
+        self._file = tempfile.TemporaryFile()
+        # Start of every string in the file, followed by the end of the last one
+        self._offsets = array("Q", [0])
+        self._cache = OrderedDict()
+
+    def __len__(self):
+        """Returns the number of strings."""
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        """
+        Get a string by index, from the cache or the temporary file.
+
+        Args:
+            index (int): String index, as stored in the "s" cells
+
+        Returns:
+            str: The string's text
+
+        Raises:
+            IndexError: If there is no string with that index
+        """
+        text = self._cache.get(index)
+        if text is not None:
+            # Mark as most recently used
+            self._cache.move_to_end(index)
+            return text
+
+        if not 0 <= index < len(self):
+            raise IndexError("Shared string index out of range")
+        start = self._offsets[index]
+        self._file.seek(start)
+        text = self._file.read(self._offsets[index + 1] - start).decode("utf-8")
+
+        self._cache[index] = text
+        # Evict the least recently used text once the cache is full
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return text
+
+    def append(self, text):
+        """Write a string to the end of the file (while the part is parsed)."""
+        data = text.encode("utf-8")
+        self._file.write(data)
+        self._offsets.append(self._offsets[-1] + len(data))
+
+    def close(self):
+        """Delete the temporary file."""
+        self._file.close()
+
+
+class _SheetRows:
+    """
+    Parser target converting worksheet rows to lists of cell texts.
+
+    Attributes:
+        rows (list): Completed non-empty rows, emptied by the reader after every block
+    """
+
+    def __init__(self, shared_strings, date_styles, epoch):
+        self.rows = []
+        self._shared_strings = shared_strings
+        self._date_styles = date_styles
+        self._epoch = epoch
+        self._names = {}
+        self._columns = {}
+        self._values = None
+        self._cell = None
+        self._text = None
+        self._texts = []
+
+    def start(self, tag, attrib):
+        """Start a row, a cell (padding skipped columns with ""), or a value text."""
+        name = self._names.get(tag)
+        if name is None:
+            name = self._names[tag] = tag[tag.rfind("}") + 1 :]
+
+        if name == "c":
+            reference = attrib.get("r")
+            if reference:
+                letters = reference.rstrip("0123456789")
+                column = self._columns.get(letters)
+                if column is None:
+                    column = self._columns[letters] = _column_index(letters)
+                if column > len(self._values):
+                    self._values.extend([""] * (column - len(self._values)))
+            self._cell = (attrib.get("t", "n"), attrib.get("s"))
+            self._texts = []
+        elif name == "v" or name == "t":
+            self._text = []
+        elif name == "row":
+            self._values = []
+
+    def end(self, tag):
+        """Finish a value text, a cell or a row."""
+        name = self._names[tag]
+        if name == "v" or name == "t":
+            self._texts.append("".join(self._text))
+            self._text = None
+        elif name == "c":
+            self._values.append(self.__cell_text(*self._cell, "".join(self._texts)))
+            self._cell = None
+        elif name == "row":
+            values = self._values
+            while values and values[-1] == "":
+                values.pop()
+            if values:
+                self.rows.append(values)
+            self._values = None
+
+    def data(self, text):
+        """Collect text inside <v> or <t>."""
+        if self._text is not None:
+            self._text.append(text)
+
+    def close(self):
+        """Nothing to return, rows are read from the target."""
+        return None
+
+    def __cell_text(self, cell_type, style, value):
+        """
+        Helper method for streaming - Get the text a CSV export would contain for a cell.
+
+        Args:
+            cell_type (str): The cell's "t" attribute, "n" (number) by default
+            style (str): The cell's "s" attribute (style index), or None
+            value (str): Text of the cell's <v> (or inline string <t>) elements
+
+        Returns:
+            str: Cell text, "" for an empty cell
+        """
+        if cell_type == "s":
+            # Pythonic Ternary Operator!
+            return self._shared_strings[int(value)] if value else ""
+        if cell_type == "b":
+            # Pythonic Ternary Operator!
+            return "TRUE" if value == "1" else "FALSE"
+        if cell_type != "n" or not value:
+            # Inline and formula strings, errors ("e") and ISO dates ("d") are kept as stored
+            return value
+
+        number = float(value)
+        if style is not None and int(style) in self._date_styles:
+            return self.__format_date(number, self._date_styles[int(style)])
+        # Up to 15 significant digits like Excel displays, integers without ".0"
+        return format(number, ".15g")
+
+    def __format_date(self, serial, with_time):
+        """
+        Helper method for streaming - Format a date serial number like a Google Forms timestamp.
+
+        Args:
+            serial (float): Days since the workbook's epoch, the fraction being the time of day
+            with_time (bool): Whether the cell's format displays a time
+
+        Returns:
+            str: e.g. "3/12/2025 09:15:10", or "3/12/2025" for a date format
+        """
+        moment = self._epoch + timedelta(seconds=round(serial * 86400))
+        date = f"{moment.month}/{moment.day}/{moment.year}"
+        if not with_time:
+            return date
+        return f"{date} {moment:%H:%M:%S}"
+
+
+def _column_index(reference):
+    """
+    Convert a cell reference's column letters to a 0-based index.
+
+    Args:
+        reference (str): Cell reference, e.g. "C12"
+
+    Returns:
+        int: Column index, e.g. 2
+    """
+    index = 0
+    for character in reference:
+        if not character.isalpha():
+            break
+        index = index * 26 + ord(character.upper()) - ord("A") + 1
+    return index - 1
+
+
+def _format_tokens(format_code):
+    """
+    Get the characters of a custom number format that can be date or time tokens.
+
+    Args:
+        format_code (str): Excel format code, e.g. "m/d/yyyy h:mm:ss"
+
+    Returns:
+        str: Lowercased format code without quoted text, escaped characters and [...] sections
+    """
+    code = []
+    in_quotes = in_brackets = escaped = False
+    for character in format_code:
+        if escaped:
+            escaped = False
+        elif character == "\\":
+            escaped = True
+        elif character == '"':
+            in_quotes = not in_quotes
+        elif in_quotes:
+            continue
+        elif character == "[":
+            in_brackets = True
+        elif character == "]":
+            in_brackets = False
+        elif not in_brackets:
+            code.append(character.lower())
+    return "".join(code)
@@ -0,0 +1,9 @@
+"""
+Benchmarks Package for Attendance Tool
+
+Performance benchmarks for the attendance automation system.
+Run each benchmark as a module from the repository root, e.g.:
+
+    python -m benchmarks.bench_validators
+    python -m benchmarks.bench_pipeline --sizes 1000 10000
+"""
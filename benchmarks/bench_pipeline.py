@@ -0,0 +1,196 @@
+"""
+End-to-end pipeline benchmark on generated sheets of increasing size.
+
+Times each stage of a report separately, on sheets from the seeded generator:
+    validation    Processor.process_records() (CSV reading and per-row validation)
+    docx_build    Word document construction (Exporter.export_word() until it starts saving)
+    docx_save     Word document serialization (into memory, so disk speed doesn't count)
+    pdf_render    Native PDF rendering (Exporter.export_pdf(), into memory)
+
+Results are written as JSON (with the git commit and environment), so runs can be
+compared across commits with --compare.
+
+Usage:
+    python -m benchmarks.bench_pipeline [--sizes 1000 10000 ...] [--output results.json]
+    python -m benchmarks.bench_pipeline --compare baseline.json
+"""
+
+import argparse, io, json, os, platform, subprocess, sys, tempfile, time
+from datetime import datetime, timezone
+
+from attendance_tool_msp.src.attendance_tool_msp import Processor, Exporter
+from benchmarks.generator import write_csv
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+STAGES = ["validation", "docx_build", "docx_save", "pdf_render"]
+
+SCHEMA_VERSION = 1
+
+
+def git_commit():
+    """Return the current git commit hash, or None outside a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def time_word_export(exporter):
+    """
+    Time Word document construction and serialization separately.
+
+    The export progress callback reports "saving" right before the document is
+    serialized, which splits one export into its two stages.
+
+    Returns:
+        tuple: (build seconds, save seconds, document size in bytes)
+    """
+    marks = {}
+
+    def progress(stage, done, total):
+        if stage == "saving":
+            marks["saving"] = time.perf_counter()
+
+    stream = io.BytesIO()
+    start = time.perf_counter()
+    exporter.export_word(progress, stream=stream)
+    end = time.perf_counter()
+    return marks["saving"] - start, end - marks["saving"], len(stream.getvalue())
+
+
+def time_pdf_export(exporter):
+    """
+    Time native PDF rendering.
+
+    Returns:
+        tuple: (render seconds, document size in bytes)
+    """
+    stream = io.BytesIO()
+    start = time.perf_counter()
+    exporter.export_pdf(stream=stream)
+    return time.perf_counter() - start, len(stream.getvalue())
+
+
+def bench_size(rows, stages, repeat, directory, options):
+    """
+    Benchmark every requested stage on one generated sheet, keeping the best time.
+
+    Args:
+        rows (int): Number of rows of the sheet
+        stages (list): Stages to time (see STAGES)
+        repeat (int): Runs per stage
+        directory (str): Directory for the generated CSV file
+        options (dict): Generator settings
+
+    Returns:
+        dict: Result entry with the row counts, best seconds per stage and output sizes
+    """
+    csv_file = write_csv(os.path.join(directory, f"bench_{rows}.csv"), rows, **options)
+    result = {"rows": rows, "csv_bytes": os.path.getsize(csv_file), "seconds": {}}
+
+    # Validation always runs once: the exports need its records
+    timings = []
+    for _ in range(repeat if "validation" in stages else 1):
+        start = time.perf_counter()
+        valid_rows, invalid_rows = Processor(csv_file).process_records()
+        timings.append(time.perf_counter() - start)
+    if "validation" in stages:
+        result["seconds"]["validation"] = min(timings)
+    result["valid"] = len(valid_rows)
+    result["invalid"] = len(invalid_rows)
+
+    exporter = Exporter(valid_rows, invalid_rows, f"Benchmark {rows} rows")
+
+    if "docx_build" in stages or "docx_save" in stages:
+        runs = [time_word_export(exporter) for _ in range(repeat)]
+        if "docx_build" in stages:
+            result["seconds"]["docx_build"] = min(run[0] for run in runs)
+        if "docx_save" in stages:
+            result["seconds"]["docx_save"] = min(run[1] for run in runs)
+        result["docx_bytes"] = runs[0][2]
+
+    if "pdf_render" in stages:
+        runs = [time_pdf_export(exporter) for _ in range(repeat)]
+        result["seconds"]["pdf_render"] = min(run[0] for run in runs)
+        result["pdf_bytes"] = runs[0][1]
+
+    os.remove(csv_file)
+    return result
+
+
+def compare(baseline, results):
+    """
+    Format the per-stage time ratios of results against a baseline run.
+
+    Args:
+        baseline (dict): Earlier benchmark JSON
+        results (dict): Current benchmark JSON
+
+    Returns:
+        str: One line per size and stage present in both runs (ratio < 1 is faster)
+    """
+    before = {entry["rows"]: entry["seconds"] for entry in baseline["results"]}
+    lines = [
+        f"Baseline {str(baseline.get('commit'))[:12]} -> current {str(results.get('commit'))[:12]}",
+        f"{'Rows':>9}  {'Stage':<11}  {'Before (s)':>10}  {'After (s)':>10}  {'Ratio':>6}",
+    ]
+    for entry in results["results"]:
+        for stage, seconds in entry["seconds"].items():
+            old = before.get(entry["rows"], {}).get(stage)
+            if old:
+                lines.append(
+                    f"{entry['rows']:>9}  {stage:<11}  {old:>10.4f}  {seconds:>10.4f}  "
+                    f"{seconds / old:>6.2f}"
+                )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pipeline benchmark on generated sheets")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="Row counts")
+    parser.add_argument(
+        "--stages", nargs="+", choices=STAGES, default=STAGES, help="Stages to time"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per stage (best is kept)")
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed")
+    parser.add_argument("--invalid-ratio", type=float, default=0.1, help="Fraction of invalid rows")
+    parser.add_argument("--output", help="Write the JSON results to this file")
+    parser.add_argument("--compare", metavar="BASELINE", help="Compare against an earlier JSON run")
+    args = parser.parse_args()
+
+    options = {"seed": args.seed, "invalid_ratio": args.invalid_ratio}
+    results = {
+        "schema": SCHEMA_VERSION,
+        "commit": git_commit(),
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "generator": options,
+        "repeat": args.repeat,
+        "results": [],
+    }
+
+    with tempfile.TemporaryDirectory() as directory:
+        for rows in args.sizes:
+            entry = bench_size(rows, args.stages, args.repeat, directory, options)
+            results["results"].append(entry)
+            timings = ", ".join(f"{stage} {seconds:.3f}s" for stage, seconds in entry["seconds"].items())
+            print(f"{rows:>9} rows: {timings}", file=sys.stderr)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare) as file:
+            print(compare(json.load(file), results), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Seeded generator for realistic synthetic attendance sheets.
+
+Sheets have the same columns and value shapes as the Google Forms exports in datasets/:
+a few instructors and courses repeat on every row, student names are drawn from a
+configurable pool, and a chosen fraction of rows breaks exactly one validation rule.
+The same seed and settings always produce the same file.
+
+Usage:
+    python -m benchmarks.generator output.csv [--rows N] [--seed N] [--invalid-ratio R]
+"""
+
+import argparse, csv, random
+from datetime import datetime, timedelta
+
+from attendance_tool_msp.src.attendance_tool_msp import AttendanceRecord
+
+FIRST_NAMES = [
+    "Ahmed", "Sara", "Omar", "Mona", "Youssef", "Nour", "Karim", "Laila", "Hassan", "Mariam",
+    "Mostafa", "Salma", "Khaled", "Farida", "Tarek", "Hana", "Amr", "Yasmin", "Ali", "Dina",
+    "Mahmoud", "Reem", "Ziad", "Habiba", "Adam", "Jana", "Seif", "Malak", "Hamza", "Rana",
+]
+
+LAST_NAMES = [
+    "Hassan", "Ali", "Nabil", "Adel", "Mostafa", "Ibrahim", "Saleh", "Fathy", "Kamal", "Ashraf",
+    "Mahmoud", "Samir", "Gamal", "Fouad", "Hamdy", "Sherif", "Wahba", "Ezzat", "Lotfy", "Badr",
+]
+
+INSTRUCTOR_TITLES = ["Dr.", "Dr.", "TA", "Prof."]
+
+COURSE_PREFIXES = ["SWE", "CSC", "BAS", "CSE", "MTH", "PHY", "ENG", "BUS"]
+
+COURSE_SUFFIXES = ["", " Lecture", " Tutorial", " Lab"]
+
+COURSE_TIMES = ["8:30 - 10:00", "10:00 - 11:30", "11:30 - 1:00", "1:00 - 2:30", "2:30 - 4:00"]
+
+# Accented and non-Latin names as typed into the form (the ASCII-only name validator rejects them)
+UNICODE_NAMES = ["José Hassan", "Zoë Ali", "Müller Kamal", "أحمد حسن", "Renée Fathy", "Łukasz Badr"]
+
+# One broken column per invalid row: column -> values failing its validator
+INVALID_VALUES = {
+    "Full Name": ["Mo", "Ahmed123 Hassan", ""],
+    "University Email": ["someone@gmail.com", "not-an-email", ""],
+    "University ID": ["2023/1234", "12345", "1999/00001"],
+    "Course Code": ["SW21", "12345678", ""],
+    "Course Time": ["13:00 - 2:00", "morning", "1:75 - 2:00"],
+    "Doctor/TA Name": ["Dr", "TA", "Dr. Ahmed 2"],
+}
+
+
+def generate_rows(
+    count,
+    seed=0,
+    invalid_ratio=0.1,
+    names=2000,
+    instructors=20,
+    courses=40,
+    unicode_ratio=0.01,
+):
+    """
+    Generate attendance rows as dictionaries keyed by the CSV column names.
+
+    Args:
+        count (int): Number of rows
+        seed (int, optional): Random seed, the same seed gives the same rows. Defaults to 0
+        invalid_ratio (float, optional): Fraction of rows with one invalid column. Defaults to 0.1
+        names (int, optional): Number of distinct students (name, email and ID). Defaults to 2000
+        instructors (int, optional): Number of distinct Doctor/TA names. Defaults to 20
+        courses (int, optional): Number of distinct course codes. Defaults to 40
+        unicode_ratio (float, optional): Fraction of rows whose student name has non-ASCII
+            characters (these rows are invalid too, on top of invalid_ratio). Defaults to 0.01
+
+    Yields:
+        dict: One row per submission, in Timestamp order
+
+    Raises:
+        ValueError: If a ratio is outside 0-1 or a cardinality is not positive
+    """
+    if not 0 <= invalid_ratio <= 1 or not 0 <= unicode_ratio <= 1:
+        raise ValueError("Ratios must be between 0 and 1")
+    if min(names, instructors, courses) < 1:
+        raise ValueError("Cardinalities must be positive integers")
+
+    rng = random.Random(seed)
+    current_year = datetime.now().year
+
+    # Pools are drawn from the seed first, so the cardinalities don't shift the rows
+    student_pool = [
+        (rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES), rng.randint(2015, current_year))
+        for _ in range(names)
+    ]
+    instructor_pool = [
+        f"{rng.choice(INSTRUCTOR_TITLES)} {rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        for _ in range(instructors)
+    ]
+    course_pool = [
+        f"{rng.choice(COURSE_PREFIXES)}{rng.randint(100, 39999)}{rng.choice(COURSE_SUFFIXES)}"
+        for _ in range(courses)
+    ]
+
+    timestamp = datetime(current_year, 3, 12, 9, 0, 0)
+    for _ in range(count):
+        student = rng.randrange(names)
+        first_name, last_name, year = student_pool[student]
+        timestamp += timedelta(seconds=rng.randint(1, 30))
+
+        row = {
+            "Timestamp": f"{timestamp.month}/{timestamp.day}/{timestamp.year} "
+            f"{timestamp:%H:%M:%S}",
+            "Full Name": f"{first_name} {last_name}",
+            "University Email": f"{first_name.lower()}.{last_name.lower()}{student}@miuegypt.edu.eg",
+            "University ID": f"{year}/{student % 100000:05d}",
+            "Course Code": rng.choice(course_pool),
+            "Course Time": rng.choice(COURSE_TIMES),
+            "Doctor/TA Name": rng.choice(instructor_pool),
+        }
+
+        if rng.random() < unicode_ratio:
+            row["Full Name"] = rng.choice(UNICODE_NAMES)
+        elif rng.random() < invalid_ratio:
+            column = rng.choice(list(INVALID_VALUES))
+            row[column] = rng.choice(INVALID_VALUES[column])
+
+        yield row
+
+
+def write_csv(file_path, count, **options):
+    """
+    Write a generated sheet to a CSV file.
+
+    Args:
+        file_path (str): Destination .csv file
+        count (int): Number of rows
+        **options: generate_rows() settings (seed, invalid_ratio, names, ...)
+
+    Returns:
+        str: file_path
+    """
+    fieldnames = ["Timestamp"] + list(AttendanceRecord.COLUMNS)
+    with open(file_path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.DictWriter(file, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(generate_rows(count, **options))
+    return file_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic attendance sheet")
+    parser.add_argument("output", help="Destination CSV file")
+    parser.add_argument("--rows", type=int, default=1000, help="Number of rows")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--invalid-ratio", type=float, default=0.1, help="Fraction of invalid rows")
+    parser.add_argument("--names", type=int, default=2000, help="Distinct students")
+    parser.add_argument("--instructors", type=int, default=20, help="Distinct Doctor/TA names")
+    parser.add_argument("--courses", type=int, default=40, help="Distinct course codes")
+    parser.add_argument(
+        "--unicode-ratio", type=float, default=0.01, help="Fraction of non-ASCII student names"
+    )
+    args = parser.parse_args()
+
+    write_csv(
+        args.output,
+        args.rows,
+        seed=args.seed,
+        invalid_ratio=args.invalid_ratio,
+        names=args.names,
+        instructors=args.instructors,
+        courses=args.courses,
+        unicode_ratio=args.unicode_ratio,
+    )
+    print(f"Wrote {args.rows} rows to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
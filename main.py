@@ -7,13 +7,21 @@
 
 # Previously (Before UV Restructuring): from attendance_tool_msp import (...)
 # Our Own Package: Exposed functions and classes through __init__.py
+# launch_gui is imported in GUI mode only, so exports don't load the GUI stack
 from attendance_tool_msp.src.attendance_tool_msp import (
     Processor,
     Exporter,
     initialize_parser,
     validate_arguments,
-    launch_gui,
 )
+from attendance_tool_msp.src.attendance_tool_msp.cache import open_result_cache
+from attendance_tool_msp.src.attendance_tool_msp.profiling import Profile
+from attendance_tool_msp.src.attendance_tool_msp.batch import (
+    collect_csv_files,
+    run_batch,
+    format_summary,
+)
+import time
 
 
 def main():
@@ -29,31 +37,56 @@ def main():
     # GUI Mode:
     if mode == "gui":
         print("Launching GUI...")
+        from attendance_tool_msp.src.attendance_tool_msp import launch_gui
+
         launch_gui()
         return
 
+    # Batch Mode:
+    if mode == "batch":
+        run_batch_mode(args)
+        return
+
     # Export Mode:
+    # Pythonic Ternary Operator!
+    profile = Profile() if args.profile or args.profile_json else None
     try:
         # Create processor with the provided CSV file
-        processor = Processor(args.csv_file)
-        valid_rows, invalid_rows = processor.process()
+        # Reuse the validation results of an unchanged file (e.g. Word, then PDF)
+        processor = Processor(
+            args.csv_file,
+            dedupe=args.dedupe,
+            result_cache=open_result_cache(not args.no_cache),
+            profile=profile,
+        )
+        valid_rows, invalid_rows = processor.process_records()
 
         # Print the file being processed on console
         print(f"Processing file: {processor.file_path}")
 
         # Initialize the exporter with title from command line arguments
-        exporter = Exporter(valid_rows, invalid_rows, args.title)
+        exporter = Exporter(valid_rows, invalid_rows, args.title, profile=profile)
 
-        # Handle Arguments
+        # Handle Arguments: --word and --pdf together export both documents in one pass
+        formats = []
         if args.word:
             print("Exporting to Word document...")
-            filename = exporter.export_word()
-            print("File Name:", filename)
-        elif args.pdf:
+            formats.append("docx")
+        if args.pdf:
             print("Exporting to PDF document...")
-            filename = exporter.export_pdf()
+            formats.append("pdf")
+        for filename in exporter.export(formats).values():
             print("File Name:", filename)
 
+        # Print and/or save where the time went
+        if args.profile:
+            print()
+            print(profile.format())
+        if args.profile_json:
+            with open(args.profile_json, "w") as file:
+                file.write(profile.to_json() + "\n")
+            print("Profile saved to:", args.profile_json)
+
     except FileNotFoundError as error:
         print(f"FileNotFoundError: {error}")
     except ValueError as error:
@@ -66,5 +99,30 @@ def main():
         print(f"Unexpected error: {error}")
 
 
+def run_batch_mode(args):
+    """Export one report per CSV file in parallel and print a summary table."""
+    try:
+        csv_files = collect_csv_files(args.batch)
+        # Pythonic Ternary Operator!
+        file_format = "both" if args.word and args.pdf else "word" if args.word else "pdf"
+        print(f"Exporting {len(csv_files)} files to {file_format.upper()}...")
+
+        start = time.perf_counter()
+        results = run_batch(
+            csv_files,
+            file_format,
+            args.title,
+            args.jobs,
+            args.dedupe,
+            not args.no_cache,
+        )
+        print(format_summary(results, time.perf_counter() - start))
+
+    except FileNotFoundError as error:
+        print(f"FileNotFoundError: {error}")
+    except ValueError as error:
+        print(f"ValueError: {error}")
+
+
 if __name__ == "__main__":
     main()
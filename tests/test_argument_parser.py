@@ -12,7 +12,7 @@ def test_initialize_parser():
     assert isinstance(parser, argparse.ArgumentParser)
     
     # Test usage string is set correctly
-    expected_usage = 'python main.py [file.csv (--word | --pdf) --title "Title"]'
+    expected_usage = 'python main.py [file.csv [--word] [--pdf] --title "Title"]'
     assert parser.usage == expected_usage
     
     # Test that allow_abbrev (--wor or --p) is disabled (more strict parsing)
@@ -95,14 +95,15 @@ def test_export_mode_validation_invalid():
         validate_arguments(parser, args)
 
 
-def test_mutually_exclusive_export_formats():
-    """Test that --word and --pdf are mutually exclusive."""
+def test_combined_export_formats():
+    """Test that --word and --pdf can be combined to export both documents."""
     
     parser = initialize_parser()
     
-    # Should raise SystemExit when both --word and --pdf are provided
-    with raises(SystemExit):
-        parser.parse_args(["test.csv", "--word", "--pdf", "--title", "Test"])
+    args = parser.parse_args(["test.csv", "--word", "--pdf", "--title", "Test"])
+    assert args.word is True
+    assert args.pdf is True
+    assert validate_arguments(parser, args) == "export"
 
 
 def test_argument_parsing_details():
@@ -159,3 +160,109 @@ def test_help_messages():
     assert "Process CSV data and export attendance report as Word" in help_text
     assert "Process CSV data and export attendance report as PDF" in help_text
     assert "Title for the Word/PDF document" in help_text
+
+
+def test_batch_mode_validation():
+    """Test validation logic for batch mode (--batch with --jobs)."""
+
+    parser = initialize_parser()
+
+    # Valid batch mode - directory or several CSV files, title is optional
+    args = parser.parse_args(["--batch", "datasets", "--word"])
+    assert validate_arguments(parser, args) == "batch"
+    assert args.batch == ["datasets"]
+    assert args.jobs is None
+
+    args = parser.parse_args(["--batch", "a.csv", "b.csv", "--pdf", "--jobs", "4", "--title", "Week 1"])
+    assert validate_arguments(parser, args) == "batch"
+    assert args.batch == ["a.csv", "b.csv"]
+    assert args.jobs == 4
+
+    # Invalid: no export format
+    with raises(SystemExit):
+        args = parser.parse_args(["--batch", "datasets"])
+        validate_arguments(parser, args)
+
+    # Invalid: positional CSV file combined with --batch
+    with raises(SystemExit):
+        args = parser.parse_args(["test.csv", "--batch", "datasets", "--word"])
+        validate_arguments(parser, args)
+
+    # Invalid: non-positive jobs, or --jobs without --batch
+    with raises(SystemExit):
+        args = parser.parse_args(["--batch", "datasets", "--word", "--jobs", "0"])
+        validate_arguments(parser, args)
+
+    with raises(SystemExit):
+        args = parser.parse_args(["test.csv", "--word", "--title", "Test", "--jobs", "2"])
+        validate_arguments(parser, args)
+
+
+def test_dedupe_argument():
+    """Test the --dedupe option for export and batch modes."""
+
+    parser = initialize_parser()
+
+    args = parser.parse_args(["test.csv", "--word", "--title", "Test", "--dedupe", "latest"])
+    assert validate_arguments(parser, args) == "export"
+    assert args.dedupe == "latest"
+
+    args = parser.parse_args(["--batch", "datasets", "--pdf", "--dedupe", "first"])
+    assert validate_arguments(parser, args) == "batch"
+    assert args.dedupe == "first"
+
+    args = parser.parse_args(["test.csv", "--word", "--title", "Test"])
+    assert args.dedupe is None
+
+    # Invalid: unknown policy
+    with raises(SystemExit):
+        parser.parse_args(["test.csv", "--word", "--title", "Test", "--dedupe", "last"])
+
+    # Invalid: --dedupe without a CSV file
+    with raises(SystemExit):
+        args = parser.parse_args(["--dedupe", "first"])
+        validate_arguments(parser, args)
+
+
+def test_no_cache_argument():
+    """Test the --no-cache flag for export and batch modes."""
+
+    parser = initialize_parser()
+
+    args = parser.parse_args(["test.csv", "--pdf", "--title", "Test"])
+    assert args.no_cache is False
+
+    args = parser.parse_args(["test.csv", "--pdf", "--title", "Test", "--no-cache"])
+    assert validate_arguments(parser, args) == "export"
+    assert args.no_cache is True
+
+    args = parser.parse_args(["--batch", "datasets", "--word", "--no-cache"])
+    assert validate_arguments(parser, args) == "batch"
+
+    # Invalid: --no-cache without a CSV file
+    with raises(SystemExit):
+        args = parser.parse_args(["--no-cache"])
+        validate_arguments(parser, args)
+
+
+def test_profile_arguments():
+    """Test the --profile and --profile-json options are only accepted in export mode."""
+
+    parser = initialize_parser()
+
+    args = parser.parse_args(["test.csv", "--word", "--title", "Test"])
+    assert args.profile is False
+    assert args.profile_json is None
+
+    args = parser.parse_args(
+        ["test.csv", "--word", "--title", "Test", "--profile", "--profile-json", "profile.json"]
+    )
+    assert validate_arguments(parser, args) == "export"
+    assert args.profile is True
+    assert args.profile_json == "profile.json"
+
+    # Invalid: without a CSV file, or in batch mode
+    for arguments in (["--profile"], ["--batch", "datasets", "--word", "--profile-json", "p.json"]):
+        with raises(SystemExit):
+            args = parser.parse_args(arguments)
+            validate_arguments(parser, args)
@@ -0,0 +1,78 @@
+from attendance_tool_msp.src.attendance_tool_msp.batch import (
+    collect_csv_files,
+    batch_titles,
+    run_batch,
+    format_summary,
+)
+from pytest import raises
+import os
+
+datasets_dir = os.path.abspath("datasets")
+
+
+def test_collect_csv_files():
+    """Test directories are expanded to their CSV files in name order."""
+
+    csv_files = collect_csv_files([datasets_dir])
+    assert len(csv_files) > 0
+    assert all(csv_file.endswith(".csv") for csv_file in csv_files)
+    assert csv_files == sorted(csv_files)
+
+    # Files and directories can be mixed
+    small_data = os.path.join(datasets_dir, "small_data.csv")
+    assert collect_csv_files([small_data, datasets_dir])[0] == small_data
+
+    with raises(FileNotFoundError):
+        collect_csv_files(["datasets/not_exist"])
+
+    with raises(ValueError):
+        collect_csv_files([os.path.abspath("tests")])  # No CSV files
+
+
+def test_batch_titles():
+    """Test every report gets a unique title based on its file name."""
+
+    assert batch_titles(["a/week_1.csv", "b/week_2.csv"]) == ["week_1", "week_2"]
+    assert batch_titles(["a/week_1.csv"], "Monday") == ["Monday week_1"]
+    assert batch_titles(["a/week_1.csv", "b/week_1.csv"]) == ["week_1", "week_1 (2)"]
+
+
+def test_run_batch(tmp_path, monkeypatch):
+    """Test a parallel batch writes one report per file and reports failures."""
+
+    # Reports are written to the current working directory
+    monkeypatch.chdir(tmp_path)
+    # Keep the persistent result cache out of the user's cache directory
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+    bad_file = tmp_path / "bad_headers.csv"
+    bad_file.write_text("Full Name\nJohn Doe\n")
+    csv_files = [
+        os.path.join(datasets_dir, "small_data.csv"),
+        os.path.join(datasets_dir, "mixed_data.csv"),
+        str(bad_file),
+    ]
+
+    results = run_batch(csv_files, "word", jobs=2)
+    assert [result["file"] for result in results] == csv_files
+
+    small, mixed, bad = results
+    assert small["error"] is None and os.path.exists(small["report"])
+    assert mixed["invalid"] > 0 and os.path.exists(mixed["report"])
+    assert bad["report"] is None and "ValueError" in bad["error"]
+
+    summary = format_summary(results, 1.5)
+    assert "3 files" in summary
+    assert "1 failed" in summary
+
+    with raises(ValueError):
+        run_batch(csv_files, "excel")
+
+    with raises(ValueError):
+        run_batch(csv_files, "word", jobs=0)
+
+    # Both formats are exported from the same processing pass
+    (both,) = run_batch(csv_files[:1], "both")
+    word_report, pdf_report = both["report"].split(", ")
+    assert word_report.endswith(".docx") and os.path.exists(word_report)
+    assert pdf_report.endswith(".pdf") and os.path.exists(pdf_report)
@@ -0,0 +1,164 @@
+from attendance_tool_msp.src.attendance_tool_msp import Processor
+from attendance_tool_msp.src.attendance_tool_msp.cache import LRUCache, ResultCache
+from pytest import raises
+import os, time
+
+
+def test_init():
+    """Test LRUCache initialization and size validation."""
+
+    cache = LRUCache(2)
+    assert cache.max_size == 2
+    assert cache.hits == 0
+    assert cache.misses == 0
+    assert len(cache) == 0
+
+    with raises(ValueError):
+        LRUCache(0)
+
+    with raises(ValueError):
+        LRUCache("10")
+
+
+def test_call_hits_and_misses():
+    """Test repeated values are answered from the cache."""
+
+    cache = LRUCache()
+
+    assert cache.call(Processor.validate_course_code, "swe11004") == "SWE11004"
+    assert cache.call(Processor.validate_course_code, "swe11004") == "SWE11004"
+    assert cache.call(Processor.validate_course_time, "1 to 2:30") == "1:00 - 2:30"
+
+    assert cache.hits == 1
+    assert cache.misses == 2
+    assert len(cache) == 2
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hits == 0
+    assert cache.misses == 0
+
+
+def test_cached_failures_replay_message():
+    """Test cached failures raise a ValueError with the original message."""
+
+    cache = LRUCache()
+
+    with raises(ValueError) as first:
+        cache.call(Processor.validate_dr_ta_name, "Dr.")
+    with raises(ValueError) as second:
+        cache.call(Processor.validate_dr_ta_name, "Dr.")
+
+    assert str(first.value) == str(second.value)
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_eviction():
+    """Test the least recently used entry is evicted once the cache is full."""
+
+    cache = LRUCache(2)
+
+    cache.call(str.upper, "a")
+    cache.call(str.upper, "b")
+    cache.call(str.upper, "a")  # "b" is now the least recently used entry
+    cache.call(str.upper, "c")  # Evicts "b"
+    assert len(cache) == 2
+
+    cache.call(str.upper, "a")
+    assert cache.hits == 2
+    cache.call(str.upper, "b")
+    assert cache.misses == 4
+
+
+def test_result_cache(tmp_path):
+    """Test on-disk entries are keyed by file content and extra key parts."""
+
+    csv_file = tmp_path / "data.csv"
+    csv_file.write_text("a,b\n1,2\n")
+    cache = ResultCache(str(tmp_path / "cache"))
+
+    key = cache.file_key(str(csv_file), 1, 2025, None)
+    assert key == cache.file_key(str(csv_file), 1, 2025, None)
+    assert key != cache.file_key(str(csv_file), 1, 2026, None)
+    assert key != cache.file_key(str(csv_file), 2, 2025, None)
+
+    assert cache.get(key) is None
+    cache.put(key, {"rows": [[["1", "2"], None]]})
+    assert cache.get(key) == {"rows": [[["1", "2"], None]]}
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Appending a row changes the key
+    csv_file.write_text("a,b\n1,2\n3,4\n")
+    assert cache.file_key(str(csv_file), 1, 2025, None) != key
+
+    cache.clear()
+    assert cache.get(key) is None
+
+    with raises(ValueError):
+        ResultCache(str(tmp_path / "cache"), max_bytes=0)
+
+
+def test_result_cache_eviction(tmp_path):
+    """Test least recently used entries are evicted once the cache exceeds its size."""
+
+    cache = ResultCache(str(tmp_path), max_bytes=250)
+    data = ["x" * 90]  # About 100 bytes per entry
+
+    for key in ["first", "second"]:
+        cache.put(key, data)
+        time.sleep(0.01)  # Distinct modification times
+
+    # Reading "first" makes "second" the least recently used entry
+    assert cache.get("first") == data
+    time.sleep(0.01)
+    cache.put("third", data)
+
+    assert cache.get("second") is None
+    assert cache.get("first") == data
+    assert cache.get("third") == data
+
+    # Entries larger than the whole cache are not stored
+    cache.put("huge", ["x" * 1000])
+    assert cache.get("huge") is None
+    assert sorted(os.listdir(tmp_path)) == ["first.json", "third.json"]
+
+
+def test_processor_result_cache(tmp_path):
+    """Test repeated processing of an unchanged file is answered from the result cache."""
+
+    cache = ResultCache(str(tmp_path))
+    expected = Processor("datasets/mixed_data.csv").process()
+
+    # Word, then PDF export of the same sheet: validated once
+    assert Processor("datasets/mixed_data.csv", result_cache=cache).process() == expected
+    processor = Processor("datasets/mixed_data.csv", result_cache=cache)
+    assert processor.process() == expected
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert processor.cache_misses == 0  # No validator was run
+
+    # Records are rebuilt from the same cached entry
+    assert processor.process_records() == Processor("datasets/mixed_data.csv").process_records()
+
+    # The dedupe policy is part of the key
+    deduped = Processor("datasets/mixed_data.csv", dedupe="first", result_cache=cache)
+    deduped.process()
+    assert cache.misses == 2
+
+
+def test_unwritable_result_cache(tmp_path):
+    """Test a cache directory that can't be written only skips caching instead of failing."""
+
+    directory = tmp_path / "cache"
+    cache = ResultCache(str(directory))
+    expected = Processor("datasets/mixed_data.csv").process()
+
+    # A file where the directory was (also unwritable when running as root, unlike chmod)
+    os.rmdir(directory)
+    directory.write_text("")
+    assert cache.put("key", ["x"]) is False
+
+    processor = Processor("datasets/mixed_data.csv", result_cache=cache)
+    assert processor.process() == expected
+    assert processor.process() == expected
+    assert cache.hits == 0
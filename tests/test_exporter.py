@@ -1,6 +1,6 @@
-from attendance_tool_msp.src.attendance_tool_msp import Processor, Exporter
-from pytest import raises
-import os
+from attendance_tool_msp.src.attendance_tool_msp import Processor, Exporter, AttendanceRecord
+from pytest import raises, mark
+import os, io, sys, docx
 
 # Get real data from processor
 processor = Processor("datasets/mixed_data.csv")
@@ -51,6 +51,12 @@ def test_valid_rows_property():
     # Valid assignments
     exporter.valid_rows = valid_rows
     assert len(exporter.valid_rows) > 0
+
+    # Dictionaries are adapted to records, records are used as they are
+    assert exporter.valid_rows == [AttendanceRecord.from_row(row) for row in valid_rows]
+    records = Processor("datasets/mixed_data.csv").process_records()[0]
+    exporter.valid_rows = records
+    assert exporter.valid_rows is records
     
     exporter.valid_rows = []  # Empty list allowed
     assert len(exporter.valid_rows) == 0
@@ -148,18 +154,184 @@ def test_export_word():
     os.remove(filename)
 
 
+def test_export_word_content():
+    """Test the exported table and error log contain every row, in order."""
+
+    exporter = Exporter(valid_rows, invalid_rows, "Word Content Test")
+
+    filename = exporter.export_word()
+    document = docx.Document(filename)
+    os.remove(filename)
+
+    # Header row + one row per valid and invalid record, valid rows first
+    table = document.tables[0]
+    assert len(table.rows) == 1 + len(valid_rows) + len(invalid_rows)
+    for table_row, row in zip(table.rows[1:], valid_rows + invalid_rows):
+        assert [cell.text for cell in table_row.cells] == [
+            row["Full Name"],
+            row["University ID"],
+            row["Course Code"],
+            row["Course Time"],
+            row["Doctor/TA Name"],
+        ]
+
+    # Cells are formatted through named styles, invalid rows use the red style
+    first_valid_paragraph = table.rows[1].cells[0].paragraphs[0]
+    last_invalid_paragraph = table.rows[-1].cells[0].paragraphs[0]
+    assert first_valid_paragraph.style.name == "AttendanceCell"
+    assert last_invalid_paragraph.style.name == "AttendanceInvalidCell"
+    assert first_valid_paragraph.style.font.name == "Roboto"
+    assert last_invalid_paragraph.style.font.color.rgb == docx.shared.RGBColor(255, 0, 0)
+
+    # No per-run formatting in data cells
+    assert first_valid_paragraph.runs[0].font.name is None
+
+    # One error log paragraph per invalid row, at the end of the document
+    log_paragraphs = document.paragraphs[-len(invalid_rows):]
+    for i, (paragraph, row) in enumerate(zip(log_paragraphs, invalid_rows), 1):
+        assert paragraph.text.startswith(f"{i}. ")
+        assert paragraph.text.endswith(row["error"])
+
+
 def test_export_pdf():
+    """Test PDF document export with the native (ReportLab) backend."""
+
+    exporter = Exporter(valid_rows, invalid_rows, "PDF Test")
+
+    filename = exporter.export_pdf()
+    assert filename.endswith(".pdf")
+    assert os.path.exists(filename)
+    assert os.path.getsize(filename) > 0
+
+    # Check it's an actual PDF file
+    with open(filename, "rb") as file:
+        assert file.read(5) == b"%PDF-"
+    os.remove(filename)
+
+    # Unknown backends are rejected
+    with raises(ValueError):
+        exporter.export_pdf(backend="unknown")
+
+
+def test_export_progress():
+    """Test export progress callbacks and cancelling an export from the callback."""
+
+    exporter = Exporter(valid_rows, invalid_rows, "Progress Test")
+    total = len(valid_rows) + len(invalid_rows)
+
+    calls = []
+    filename = exporter.export_word(lambda *args: calls.append(args))
+    os.remove(filename)
+    assert ("writing", total, total) in calls
+    assert calls[-1] == ("saving", total, total)
+
+    calls = []
+    filename = exporter.export_pdf(progress=lambda *args: calls.append(args))
+    os.remove(filename)
+    assert calls == [("rendering", 0, total)]
+
+    # Exceptions raised by the callback abort the export before anything is saved
+    def cancel(stage, done, total):
+        raise RuntimeError("cancelled")
+
+    files_before = set(os.listdir())
+    with raises(RuntimeError):
+        exporter.export_word(cancel)
+    with raises(RuntimeError):
+        exporter.export_pdf(progress=cancel)
+    assert set(os.listdir()) == files_before
+
+
+def test_export_to_stream():
+    """Test exporting into caller-supplied binary streams without writing files."""
+
+    exporter = Exporter(valid_rows, invalid_rows, "Stream Test")
+    files_before = set(os.listdir())
+
+    stream = io.BytesIO()
+    assert exporter.export_word(stream=stream) is stream
+    document = docx.Document(io.BytesIO(stream.getvalue()))
+    assert len(document.tables[0].rows) == 1 + len(valid_rows) + len(invalid_rows)
+
+    stream = io.BytesIO()
+    assert exporter.export_pdf(stream=stream) is stream
+    assert stream.getvalue().startswith(b"%PDF-")
+
+    # Nothing was written to the current directory
+    assert set(os.listdir()) == files_before
+
+    # Paths, text streams and the Microsoft Word backend are rejected
+    with raises(ValueError):
+        exporter.export_word(stream="report.docx")
+    with raises(ValueError):
+        exporter.export_word(stream=io.StringIO())
+    with raises(ValueError):
+        exporter.export_pdf(backend="word", stream=io.BytesIO())
+
+def test_export_pdf_non_latin1_names(monkeypatch):
+    """Test non-Latin-1 names embed a Unicode font in the native PDF, Latin-1 reports keep Helvetica."""
+
+    from attendance_tool_msp.src.attendance_tool_msp.pdf_renderer import PdfRenderer
+
+    rows = [dict(valid_rows[0], **{"Full Name": "أحمد حسن"})] + valid_rows[1:]
+
+    def render(rows):
+        return Exporter(rows, invalid_rows, "Unicode Test").export_pdf(stream=io.BytesIO()).getvalue()
+
+    # Embedded TrueType fonts are stored as /FontFile2 streams, standard fonts aren't embedded
+    assert b"/FontFile2" not in render(valid_rows)
+
+    if any(os.path.isfile(regular) for regular, _ in PdfRenderer.UNICODE_FONTS):
+        pdf = render(rows)
+        assert b"/FontFile2" in pdf
+        assert b"/Helvetica-Bold" not in pdf
+
+    # Without any Unicode font on the system, Helvetica is still used instead of failing
+    monkeypatch.setattr(PdfRenderer, "UNICODE_FONTS", [("/nonexistent/font.ttf", None)])
+    assert b"/FontFile2" not in render(rows)
+
+
+def test_export_multiple_formats():
+    """Test exporting Word and PDF documents together from the same records."""
+
+    exporter = Exporter(valid_rows, invalid_rows, "Multiple Formats Test")
+
+    files = exporter.export(("docx", "pdf"))
+    assert list(files) == ["docx", "pdf"]
+
+    # Both documents are kept and share the same base filename
+    assert files["docx"].endswith(".docx") and files["pdf"].endswith(".pdf")
+    assert files["docx"][: -len(".docx")] == files["pdf"][: -len(".pdf")]
+    for filename in files.values():
+        assert os.path.getsize(filename) > 0
+        os.remove(filename)
+
+    # Requested order is kept
+    files = exporter.export(["pdf", "docx"])
+    assert list(files) == ["pdf", "docx"]
+    for filename in files.values():
+        os.remove(filename)
+
+    # Empty, unknown or repeated formats and unknown backends are rejected
+    for formats in ((), ("xlsx",), ("pdf", "pdf")):
+        with raises(ValueError):
+            exporter.export(formats)
+    with raises(ValueError):
+        exporter.export(pdf_backend="unknown")
+
+@mark.skipif(sys.platform not in ("win32", "darwin"), reason="Requires Microsoft Word")
+def test_export_pdf_word_backend():
     """
-    Test PDF document export.
-    
+    Test PDF document export through Microsoft Word (docx2pdf).
+
     Note: PDF conversion may display Windows COM error messages (0x800706be/0x800706ba)
     due to Microsoft Word interface issues, but the PDF is still created successfully
     and the test will pass.
     """
-    
+
     exporter = Exporter(valid_rows, invalid_rows, "PDF Test")
 
-    filename = exporter.export_pdf()
+    filename = exporter.export_pdf(backend="word")
     assert filename.endswith(".pdf")
     assert os.path.exists(filename)
     assert os.path.getsize(filename) > 0
@@ -0,0 +1,60 @@
+import subprocess, sys
+
+# Startup budget for the validation-only import path, in microseconds (0.5 seconds)
+IMPORT_BUDGET_US = 500_000
+
+# Heavy dependencies that validation-only use of the package must not import
+HEAVY_MODULES = ["docx", "docx2pdf", "reportlab", "customtkinter", "tkinter", "PIL"]
+
+
+def import_times(statement):
+    """
+    Run a statement in a fresh interpreter with -X importtime.
+
+    Args:
+        statement (str): Python code to run
+
+    Returns:
+        dict: Module name -> cumulative import time in microseconds
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Lines look like: "import time:  self [us] | cumulative | imported package"
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_processor_import_is_lightweight():
+    """Test importing Processor doesn't load the GUI or document export stack."""
+
+    times = import_times("from attendance_tool_msp.src.attendance_tool_msp import Processor")
+
+    for module in HEAVY_MODULES:
+        assert module not in times, f"'{module}' imported on the validation-only path"
+
+    # Whole package import must stay within the startup budget
+    package_time = times["attendance_tool_msp.src.attendance_tool_msp"]
+    assert package_time < IMPORT_BUDGET_US, f"Package import took {package_time} us"
+
+
+def test_lazy_attributes():
+    """Test Exporter and launch_gui are still importable from the package on demand."""
+
+    times = import_times(
+        "from attendance_tool_msp.src.attendance_tool_msp import Exporter"
+    )
+    assert "attendance_tool_msp.src.attendance_tool_msp.exporter" in times
+
+    # python-docx is only loaded once a document is exported
+    assert "docx" not in times
+    assert "customtkinter" not in times
@@ -139,6 +139,71 @@ def test_validate_email():
         Processor.validate_email("john.doe@@miuegypt.edu.eg")
 
 
+def test_validate_email_domains():
+    """Test the fast path and the general validator fallback give the same results."""
+
+    # Uncommon but valid local parts go through the general validator
+    assert Processor.validate_email("o'brien!@miuegypt.edu.eg") is None
+    assert Processor.validate_email('"john..doe"@miuegypt.edu.eg') is None
+
+    # Error messages are unchanged, whichever path rejects the address
+    with raises(ValueError, match="Invalid email format: .john@miuegypt.edu.eg"):
+        Processor.validate_email(".john@miuegypt.edu.eg")
+    with raises(ValueError, match="Invalid email format"):
+        Processor.validate_email("a" * 65 + "@miuegypt.edu.eg")
+    with raises(ValueError, match="Email must be from @miuegypt.edu.eg domain, got: a@gmail.com"):
+        Processor.validate_email(" a@gmail.com ")
+
+    # Configurable domain allow-list
+    domains = ("miuegypt.edu.eg", "Alumni.miuegypt.edu.eg")
+    assert Processor.validate_email("john@alumni.miuegypt.edu.eg", domains) is None
+    assert Processor.validate_email("john@miuegypt.edu.eg", domains) is None
+    with raises(ValueError, match="@miuegypt.edu.eg or @alumni.miuegypt.edu.eg domain"):
+        Processor.validate_email("john@gmail.com", domains)
+    with raises(ValueError):
+        Processor.validate_email("john@miuegypt.edu.eg", ["gmail.com"])
+
+    # A malformed allowed domain is never accepted by the fast path
+    with raises(ValueError, match="Invalid email format"):
+        Processor.validate_email("john@miu_egypt", ["miu_egypt"])
+
+
+def test_email_domains_option(tmp_path):
+    """Test a non-default email allow-list reaches the parallel workers and the result cache key."""
+    from attendance_tool_msp.src.attendance_tool_msp.cache import ResultCache
+
+    with open(valid_csv_file) as file:
+        data = file.read()
+    csv_file = tmp_path / "other_domain.csv"
+    csv_file.write_text(data.replace("@miuegypt.edu.eg", "@other.edu"))
+
+    expected_valid = len(Processor(valid_csv_file).process()[0])
+    processor = Processor(str(csv_file), email_domains=["other.edu"])
+    assert processor.email_domains == ("other.edu",)
+
+    # Workers get the allow-list as an argument, not from a module global (spawn start method)
+    valid_rows, invalid_rows = processor.process()
+    assert len(valid_rows) == expected_valid
+    assert processor.process(workers=2) == (valid_rows, invalid_rows)
+    assert Processor(str(csv_file), engine="auto", email_domains=["other.edu"]).process() == (
+        valid_rows,
+        invalid_rows,
+    )
+
+    # Results of the default allow-list are cached under another key
+    cache = ResultCache(str(tmp_path / "cache"))
+    assert len(Processor(str(csv_file), result_cache=cache).process()[0]) < expected_valid
+    assert Processor(str(csv_file), result_cache=cache, email_domains=["other.edu"]).process() == (
+        valid_rows,
+        invalid_rows,
+    )
+
+    with raises(ValueError):
+        Processor(str(csv_file), email_domains="other.edu")
+    with raises(ValueError):
+        Processor(str(csv_file), email_domains=[])
+
+
 def test_validate_university_id():
     """Test university ID validation for MIU format YYYY/XXXXX."""
     # Valid IDs - should return normalized format
@@ -356,3 +421,256 @@ def test_processor_integration():
             assert (
                 field in first_invalid
             ), f"Required field '{field}' should be preserved in invalid rows"
+
+
+def test_iter_rows():
+    """Test streaming row iterator yields the same results as process()."""
+
+    processor = Processor(valid_csv_file)
+
+    # iter_rows is a lazy generator
+    rows = processor.iter_rows()
+    assert iter(rows) is rows
+
+    streamed = list(processor.iter_rows())
+    valid_rows, invalid_rows = processor.process()
+
+    # Every row is yielded once, split the same way as process()
+    assert len(streamed) == len(valid_rows) + len(invalid_rows)
+    assert [row for row, error in streamed if error is None] == valid_rows
+
+    streamed_invalid = [(row, error) for row, error in streamed if error is not None]
+    assert len(streamed_invalid) == len(invalid_rows)
+    for (row, error), invalid_row in zip(streamed_invalid, invalid_rows):
+        assert error == invalid_row["error"]
+        assert row["Full Name"] == invalid_row["Full Name"]
+
+
+def test_iter_rows_invalid_headers(tmp_path):
+    """Test header errors are raised as soon as iteration starts."""
+
+    csv_file = tmp_path / "bad_headers.csv"
+    csv_file.write_text("Full Name,University ID\nJohn Doe,2023/00001\n")
+
+    rows = Processor(str(csv_file)).iter_rows()
+    with raises(ValueError):
+        next(rows)
+
+
+def test_validate_row():
+    """Test single-row validation normalizes every column in place."""
+
+    row = {
+        "Full Name": "john doe",
+        "University Email": "john.doe@miuegypt.edu.eg",
+        "University ID": "202300001",
+        "Course Code": "swe11004",
+        "Course Time": "1 to 2:30",
+        "Doctor/TA Name": "john smith",
+    }
+    assert Processor.validate_row(row) is row
+    assert row["Full Name"] == "John Doe"
+    assert row["University ID"] == "2023/00001"
+    assert row["Course Code"] == "SWE11004"
+    assert row["Course Time"] == "1:00 - 2:30"
+    assert row["Doctor/TA Name"] == "Dr. John Smith"
+
+    # Email is skipped when the column is not validated
+    row["University Email"] = "john.doe@gmail.com"
+    Processor.validate_row(row, validate_email=False)
+    with raises(ValueError):
+        Processor.validate_row(row)
+
+
+def test_process_parallel():
+    """Test parallel validation returns exactly the same output as the serial path."""
+
+    for csv_file in [valid_csv_file, "datasets/large_data.csv", "datasets/invalid_data.csv"]:
+        processor = Processor(csv_file)
+        assert processor.process(workers=3) == processor.process()
+
+    # Workers must be a positive integer
+    with raises(ValueError):
+        Processor(valid_csv_file).process(workers=0)
+
+    with raises(ValueError):
+        Processor(valid_csv_file).process(workers="2")
+
+
+def test_validation_cache():
+    """Test the per-processor validator cache counters and disabled caching."""
+
+    processor = Processor("datasets/large_data.csv")
+    valid_rows, invalid_rows = processor.process()
+
+    # Course codes, times and instructor names repeat across rows
+    assert processor.cache_hits > 0
+    assert processor.cache_hits + processor.cache_misses > 0
+
+    # Caching never changes the results
+    uncached = Processor("datasets/large_data.csv", cache_size=0)
+    assert uncached.process() == (valid_rows, invalid_rows)
+    assert uncached.cache_hits == 0
+    assert uncached.cache_misses == 0
+
+    # Worker caches are reported on the processor too
+    parallel = Processor("datasets/large_data.csv")
+    assert parallel.process(workers=2) == (valid_rows, invalid_rows)
+    assert parallel.cache_hits > 0
+
+    with raises(ValueError):
+        Processor(valid_csv_file, cache_size=-1)
+
+
+def test_process_progress():
+    """Test the progress callback reports validated rows and can stop processing."""
+
+    processor = Processor("datasets/large_data.csv")
+    valid_rows, invalid_rows = processor.process()
+
+    calls = []
+    assert processor.process(progress=lambda *args: calls.append(args)) == (valid_rows, invalid_rows)
+    # Final call reports every row of the file
+    assert calls[-1] == ("validating", len(valid_rows) + len(invalid_rows), None)
+
+    # Exceptions raised by the callback propagate to the caller (e.g. cancelling)
+    def cancel(stage, done, total):
+        raise RuntimeError("cancelled")
+
+    with raises(RuntimeError):
+        processor.process(progress=cancel)
+
+
+def test_dedupe():
+    """Test duplicate submissions are dropped into invalid rows, keeping the first or latest one."""
+
+    duplicates_csv_file = "datasets/duplicate_submissions.csv"
+
+    # Without dedupe every submission is kept
+    valid_rows, invalid_rows = Processor(duplicates_csv_file).process()
+    assert len(valid_rows) == 7
+    assert len(invalid_rows) == 1
+
+    # First: earliest row in file order (normalized ID, course code and time are compared)
+    valid_rows, invalid_rows = Processor(duplicates_csv_file, dedupe="first").process()
+    assert [row["Timestamp"] for row in valid_rows] == [
+        "3/12/2025 09:15:10",
+        "3/12/2025 09:20:42",
+        "3/12/2025 09:33:01",
+        "3/12/2025 09:50:00",
+    ]
+    assert invalid_rows[0]["error"] == "Duplicate submission (kept the first one, row 1)"
+    assert invalid_rows[1]["error"] == "Duplicate submission (kept the first one, row 2)"
+
+    # Latest: by Timestamp, not file order (row 6 was submitted before row 2)
+    processor = Processor(duplicates_csv_file, dedupe="latest")
+    valid_rows, invalid_rows = processor.process()
+    assert [row["Timestamp"] for row in valid_rows] == [
+        "3/12/2025 09:20:42",
+        "3/12/2025 09:33:01",
+        "3/12/2025 09:50:00",
+        "3/12/2025 10:05:00",
+    ]
+    assert [row["error"] for row in invalid_rows if "Duplicate" in row["error"]] == [
+        "Duplicate submission (kept the latest one, row 8)",
+        "Duplicate submission (kept the latest one, row 8)",
+        "Duplicate submission (kept the latest one, row 2)",
+    ]
+
+    # Streaming and parallel paths mark the same rows
+    assert [error for _, error in processor.iter_rows() if error] == [
+        row["error"] for row in invalid_rows
+    ]
+    assert processor.process(workers=2) == (valid_rows, invalid_rows)
+
+    with raises(ValueError):
+        Processor(duplicates_csv_file, dedupe="last")
+
+
+def test_process_incremental(tmp_path, monkeypatch):
+    """Test only appended rows are validated, and a changed file falls back to a full pass."""
+
+    from attendance_tool_msp.src.attendance_tool_msp import processor as processor_module
+    from attendance_tool_msp.src.attendance_tool_msp import Profile
+
+    with open("datasets/mixed_data.csv", newline="") as file:
+        lines = file.read().splitlines(keepends=True)
+    csv_file = tmp_path / "session.csv"
+    checkpoint_file = tmp_path / "session.csv.checkpoint.jsonl"
+
+    # Record the byte ranges that get validated
+    validated_ranges = []
+    validate_chunk = processor_module._validate_chunk
+
+    def recording_validate_chunk(file_path, fieldnames, start, end, cache_size=0, **options):
+        validated_ranges.append((start, end))
+        return validate_chunk(file_path, fieldnames, start, end, cache_size, **options)
+
+    monkeypatch.setattr(processor_module, "_validate_chunk", recording_validate_chunk)
+
+    # First download: header and 5 rows, validated in full and checkpointed
+    csv_file.write_text("".join(lines[:6]))
+    processor = Processor(str(csv_file))
+    assert processor.process_incremental() == processor.process()
+    assert checkpoint_file.exists()
+    first_size = csv_file.stat().st_size
+
+    # Re-download with appended rows: only the tail is validated, and appended to the checkpoint
+    first_checkpoint = checkpoint_file.read_bytes()
+    csv_file.write_text("".join(lines))
+    validated_ranges.clear()
+    assert processor.process_incremental() == processor.process()
+    assert validated_ranges == [(first_size, csv_file.stat().st_size)]
+    assert checkpoint_file.read_bytes().startswith(first_checkpoint)
+
+    # Nothing new: nothing validated, same results
+    validated_ranges.clear()
+    assert processor.process_incremental() == processor.process()
+    assert validated_ranges == [(csv_file.stat().st_size, csv_file.stat().st_size)]
+
+    # An already processed row changed: full pass
+    csv_file.write_text("".join(lines).replace("Ahmed Hassan", "Ahmed Hasan", 1))
+    validated_ranges.clear()
+    assert processor.process_incremental() == processor.process()
+    assert validated_ranges[0][0] == len(lines[0].encode())
+
+    # Corrupt checkpoint: full pass, dedupe applies to the merged results
+    checkpoint_file.write_text("{not json")
+    processor.dedupe = "first"
+    assert processor.process_incremental() == processor.process()
+
+    # Checkpoints of other validator rules (or years, or email domains) are not replayed
+    monkeypatch.setattr(processor_module, "VALIDATOR_VERSION", processor_module.VALIDATOR_VERSION + 1)
+    validated_ranges.clear()
+    assert processor.process_incremental() == processor.process()
+    assert validated_ranges[0][0] == len(lines[0].encode())
+    processor.email_domains = ["other.edu"]
+    validated_ranges.clear()
+    assert processor.process_incremental() == processor.process()
+    assert validated_ranges[0][0] == len(lines[0].encode())
+
+    # An interrupted append (rows without their offset line) is discarded
+    with open(checkpoint_file, "a") as file:
+        file.write('[["partial"], null]\n[["cut')
+    validated_ranges.clear()
+    assert processor.process_incremental() == processor.process()
+    assert validated_ranges == [(csv_file.stat().st_size, csv_file.stat().st_size)]
+
+    # Same engine and profiling as process(), counting the newly validated rows
+    profile = Profile()
+    processor = Processor(str(csv_file), engine="auto", profile=profile)
+    csv_file.write_text("".join(lines[:6]))
+    processor.process_incremental()
+    csv_file.write_text("".join(lines))
+    valid_rows, invalid_rows = processor.process_incremental()
+    assert (valid_rows, invalid_rows) == processor.process()
+    assert profile.counters["rows"] == 5 + (len(lines) - 6) + len(valid_rows) + len(invalid_rows)
+    assert profile.validators["validate_email"]["calls"] > 0
+
+    # Bare \r line endings can't be resumed by byte offset: full pass, no checkpoint
+    cr_file = tmp_path / "classic_mac.csv"
+    cr_file.write_bytes("".join(lines).replace("\r\n", "\n").replace("\n", "\r").encode())
+    processor = Processor(str(cr_file))
+    assert processor.process_incremental() == processor.process()
+    assert len(processor.process_incremental()[0]) == len(valid_rows)
+    assert not (tmp_path / "classic_mac.csv.checkpoint.jsonl").exists()
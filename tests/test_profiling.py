@@ -0,0 +1,88 @@
+from attendance_tool_msp.src.attendance_tool_msp import Processor, Exporter, Profile
+import io, json
+
+mixed_data = "datasets/mixed_data.csv"
+
+
+def test_profile_stages_and_counters():
+    """Test nested stages, counters, validator timings, merging and listener events."""
+
+    events = []
+    profile = Profile(listener=lambda event, stage, seconds: events.append((event, stage)))
+
+    with profile.stage("outer"):
+        with profile.stage("inner"):
+            pass
+        profile.add("parsing", 0.5, calls=10)
+    with profile.stage("outer"):
+        pass
+    profile.count("rows", 3)
+    profile.validator("validate_email", 0.25, failed=True)
+    profile.validator("validate_email", 0.25)
+
+    assert list(profile.stages) == ["outer", "inner", "parsing"]
+    assert profile.stages["outer"]["calls"] == 2
+    assert profile.stages["inner"]["parent"] == "outer"
+    assert profile.stages["parsing"] == {"seconds": 0.5, "calls": 10, "parent": "outer"}
+    assert profile.validators["validate_email"] == {"calls": 2, "seconds": 0.5, "failures": 1}
+    assert events == [
+        ("start", "outer"),
+        ("start", "inner"),
+        ("end", "inner"),
+        ("end", "outer"),
+        ("start", "outer"),
+        ("end", "outer"),
+    ]
+
+    # Worker profiles add up
+    profile.merge(Profile().to_dict() | {"counters": {"rows": 2}})
+    profile.merge(profile.to_dict())
+    assert profile.counters["rows"] == 10
+    assert profile.validators["validate_email"]["calls"] == 4
+
+    # JSON round trip, and children are indented under their parent in the text output
+    assert json.loads(profile.to_json()) == profile.to_dict()
+    assert "\n  inner " in profile.format()
+
+
+def test_processor_profile():
+    """Test profiled processing returns the same rows, for the serial and parallel paths."""
+
+    expected = Processor(mixed_data).process()
+
+    for workers in (1, 2):
+        profile = Profile()
+        assert Processor(mixed_data, profile=profile).process(workers=workers) == expected
+
+        valid_rows, invalid_rows = expected
+        rows = len(valid_rows) + len(invalid_rows)
+        assert profile.counters["rows"] == rows
+        assert profile.counters["valid_rows"] == len(valid_rows)
+        assert profile.counters["invalid_rows"] == len(invalid_rows)
+        assert profile.stages["csv_parsing"]["parent"] == "processing"
+        assert profile.stages["validation"]["calls"] == rows
+
+        # Every row starts with the email check, each invalid row fails exactly one validator
+        validators = profile.validators
+        assert validators["validate_email"]["calls"] == rows
+        assert sum(entry["failures"] for entry in validators.values()) == len(invalid_rows)
+
+
+def test_exporter_profile():
+    """Test the export stages are timed, Word construction nested under the export."""
+
+    valid_rows, invalid_rows = Processor(mixed_data).process_records()
+    profile = Profile()
+    exporter = Exporter(valid_rows, invalid_rows, "Profile Test", profile=profile)
+
+    exporter.export_word(stream=io.BytesIO())
+    exporter.export_pdf(stream=io.BytesIO())
+
+    stages = profile.stages
+    assert stages["export"]["calls"] == 2
+    assert stages["docx_build"]["parent"] == "export"
+    assert stages["docx_table_rows"]["parent"] == "docx_build"
+    assert stages["docx_error_log"]["parent"] == "docx_build"
+    assert stages["docx_save"]["parent"] == "export"
+    assert stages["pdf_render"]["parent"] == "export"
+    assert profile.counters["docx_table_rows"] == len(valid_rows) + len(invalid_rows)
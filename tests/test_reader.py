@@ -0,0 +1,219 @@
+from attendance_tool_msp.src.attendance_tool_msp import Processor
+from attendance_tool_msp.src.attendance_tool_msp.reader import MappedCsv, SCAN_BYTES, SNIFF_BYTES, sniff
+from pytest import raises
+import csv
+
+HEADER = [
+    "Timestamp",
+    "Full Name",
+    "University Email",
+    "University ID",
+    "Course Code",
+    "Course Time",
+    "Doctor/TA Name",
+]
+
+
+def write_quoted_sheet(path, rows=60, line_ending="\n"):
+    """Write a sheet whose quoted fields contain newlines and escaped quotes."""
+
+    with open(path, "w", newline="") as file:
+        writer = csv.writer(file, lineterminator=line_ending)
+        writer.writerow(HEADER)
+        for i in range(rows):
+            doctor = ["Dr. Ahmed\nSmith", 'Dr. "Quoted" Ali', "Dr. Ahmed Smith"][i % 3]
+            writer.writerow(
+                [
+                    "3/12/2025 09:15:10",
+                    "Student Name",
+                    f"s{i}@miuegypt.edu.eg",
+                    f"2023/{i:05d}",
+                    "SWE21201",
+                    "1:00 - 2:30",
+                    doctor,
+                ]
+            )
+    return str(path)
+
+
+def test_chunks_follow_quoted_row_boundaries(tmp_path):
+    """Test every chunk size splits the data on row starts, never inside quoted fields."""
+
+    for line_ending in ("\n", "\r\n"):
+        csv_file = write_quoted_sheet(tmp_path / "quoted.csv", line_ending=line_ending)
+
+        with MappedCsv(csv_file) as reader:
+            assert reader.fieldnames == HEADER
+            row_starts = set(reader.row_offsets())
+            assert reader.row_count() == 60
+
+            for chunk_size in (1, 7, 64, 1000, reader.size):
+                chunks = list(reader.iter_chunks(chunk_size))
+                # Contiguous, covering every data row exactly once
+                assert chunks[0][0] == reader.data_start
+                assert chunks[-1][1] == reader.size
+                assert all(end == start for (_, end), (start, _) in zip(chunks, chunks[1:]))
+                assert {start for start, _ in chunks} <= row_starts
+
+            with raises(ValueError):
+                next(reader.iter_chunks(0))
+
+    # Chunks larger than the quote counting buffer are scanned window by window
+    csv_file = write_quoted_sheet(tmp_path / "large.csv", rows=3000)
+    with MappedCsv(csv_file) as reader:
+        row_starts = set(reader.row_offsets())
+        for chunk_size in (SCAN_BYTES - 1, SCAN_BYTES + 1, 3 * SCAN_BYTES):
+            assert {start for start, _ in reader.iter_chunks(chunk_size)} <= row_starts
+
+
+def test_random_row_access(tmp_path):
+    """Test rows are read by index, matching csv.DictReader and skipping blank lines."""
+
+    csv_file = write_quoted_sheet(tmp_path / "quoted.csv", rows=10)
+    with open(csv_file, "a") as file:
+        file.write("\n\n3/12/2025 10:00:00,Last Row,,2023/99999,SWE21201,1:00 - 2:30,Dr. Ali\n")
+
+    with open(csv_file, newline="") as file:
+        expected = list(csv.DictReader(file))
+
+    with MappedCsv(csv_file) as reader:
+        assert reader.row_count() == len(expected) == 11
+        assert reader.row(0) == expected[0]
+        assert reader.row(3)["Doctor/TA Name"] == "Dr. Ahmed\nSmith"
+        assert reader.row(-1)["Full Name"] == "Last Row"
+        with raises(IndexError):
+            reader.row(11)
+
+    # Empty and header-only files have no rows
+    empty_file = tmp_path / "empty.csv"
+    empty_file.write_text("")
+    with MappedCsv(str(empty_file)) as reader:
+        assert reader.fieldnames is None
+        assert list(reader.iter_chunks()) == []
+
+    header_file = tmp_path / "header.csv"
+    header_file.write_text(",".join(HEADER))
+    with MappedCsv(str(header_file)) as reader:
+        assert reader.row_count() == 0
+        assert list(reader.iter_chunks()) == []
+
+
+def test_parallel_process_with_quoted_newlines(tmp_path):
+    """Test parallel processing matches the serial path when fields contain newlines."""
+
+    csv_file = write_quoted_sheet(tmp_path / "quoted.csv", rows=200)
+    processor = Processor(csv_file)
+
+    assert processor.process(workers=4) == processor.process()
+
+
+def test_bare_carriage_return_line_endings(tmp_path):
+    """Test files with bare \\r line endings fall back to the serial path instead of losing rows."""
+
+    with open("datasets/mixed_data.csv", "rb") as file:
+        data = file.read().replace(b"\r\n", b"\n")
+    csv_file = tmp_path / "classic_mac.csv"
+    csv_file.write_bytes(data.replace(b"\n", b"\r"))
+
+    expected = Processor("datasets/mixed_data.csv").process()
+    processor = Processor(str(csv_file))
+    assert processor.process() == expected
+    assert processor.process(workers=2) == expected
+
+    with MappedCsv(str(csv_file)) as reader:
+        assert not reader.splittable
+        with raises(ValueError, match="bare"):
+            reader.row_count()
+
+    # CRLF files, and \r inside quoted fields after the header, are still split
+    csv_file.write_bytes(data.replace(b"\n", b"\r\n"))
+    with MappedCsv(str(csv_file)) as reader:
+        assert reader.splittable
+    csv_file.write_bytes(data.replace(b"Ahmed Hassan", b'"Ahmed\rHassan"', 1))
+    with MappedCsv(str(csv_file)) as reader:
+        assert reader.splittable
+
+
+def test_sniffed_encodings_and_delimiters(tmp_path):
+    """Test Excel-style UTF-8 BOM, UTF-16 and semicolon/tab separated files give the same results."""
+
+    with open("datasets/mixed_data.csv", newline="") as file:
+        rows = list(csv.reader(file))
+    expected = Processor("datasets/mixed_data.csv").process()
+
+    # (written encoding, delimiter, detected encoding): ASCII is read as UTF-8
+    for encoding, delimiter, detected in [
+        ("utf-8-sig", ",", "utf-8-sig"),
+        ("utf-8-sig", ";", "utf-8-sig"),
+        ("utf-16", "\t", "utf-16"),
+        ("ascii", "|", "utf-8"),
+    ]:
+        csv_file = tmp_path / f"export-{encoding}-{ord(delimiter)}.csv"
+        with open(csv_file, "w", newline="", encoding=encoding) as file:
+            csv.writer(file, delimiter=delimiter).writerows(rows)
+        processor = Processor(str(csv_file))
+
+        assert sniff(csv_file.read_bytes()[:SNIFF_BYTES]) == (detected, delimiter)
+        assert processor.process() == expected
+        # UTF-16 can't be split into byte ranges, it falls back to the serial path
+        assert processor.process(workers=2) == expected
+        assert processor.process_incremental() == expected
+
+        with MappedCsv(str(csv_file)) as reader:
+            assert reader.splittable == (encoding != "utf-16")
+
+    # UTF-8, ASCII included, without a byte order mark
+    assert sniff("Full Name\nJosé\n".encode()) == ("utf-8", ",")
+    assert sniff(b"Full Name;University ID\n") == ("utf-8", ";")
+    assert sniff(b"") == ("utf-8", ",")
+    # Only samples that aren't UTF-8 keep the platform default encoding
+    assert sniff("Full Name\nJosé\n".encode("cp1252")) == (None, ",")
+
+
+def test_parallel_chunks_across_multiline_field(tmp_path, monkeypatch):
+    """Test a quoted field spanning many lines stays whole when chunks are smaller than it."""
+
+    from attendance_tool_msp.src.attendance_tool_msp import processor as processor_module
+
+    csv_file = write_quoted_sheet(tmp_path / "quoted.csv", rows=6)
+    note = "\n".join(f"Dr. Ahmed line {i}" for i in range(20))
+    with open(csv_file, "a", newline="") as file:
+        writer = csv.writer(file)
+        for name, doctor in [("Long Note", note), ("After Note", "Dr. Ali")]:
+            writer.writerow(
+                ["3/12/2025 10:00:00", name, "", "2023/00009", "SWE21201", "1:00 - 2:30", doctor]
+            )
+
+    # Chunks of 16 bytes: every line of the quoted field would start a chunk without quote tracking
+    monkeypatch.setattr(processor_module, "MAX_CHUNK_BYTES", 16)
+    processor = Processor(csv_file)
+    expected = processor.process()
+    assert processor.process(workers=2) == expected
+    assert sum(map(len, expected)) == 8
+
+    with MappedCsv(csv_file) as reader:
+        assert reader.row(6)["Doctor/TA Name"] == note
+        assert len(list(reader.iter_chunks(16))) == reader.row_count() == 8
+
+
+def test_ascii_sample_with_later_utf8(tmp_path, monkeypatch):
+    """Test an ASCII start of file is read as UTF-8, not the locale's code page."""
+
+    from attendance_tool_msp.src.attendance_tool_msp import reader as reader_module
+
+    # Windows' default encoding would garble the UTF-8 name after the sniffed sample
+    monkeypatch.setattr(reader_module, "_default_encoding", lambda: "cp1252")
+
+    csv_file = tmp_path / "late_utf8.csv"
+    with open(csv_file, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(HEADER)
+        names = ["Ahmed Hassan"] * (SNIFF_BYTES // 50) + ["José Müller"]
+        for i, name in enumerate(names):
+            writer.writerow(
+                ["3/12/2025 09:15:10", name, "", f"2023/{i:05d}", "SWE21201", "1:00 - 2:30", "Dr. Ali"]
+            )
+
+    with MappedCsv(str(csv_file)) as reader:
+        assert reader.encoding == "utf-8"
+        assert reader.row(-1)["Full Name"] == "José Müller"
@@ -0,0 +1,134 @@
+from attendance_tool_msp.src.attendance_tool_msp import (
+    Processor,
+    Exporter,
+    AttendanceRecord,
+    AttendanceBatch,
+)
+from pytest import raises
+import os
+
+row = {
+    "Timestamp": "3/12/2025 09:15:10",
+    "Full Name": "Ahmed Hassan",
+    "University Email": "ahmed.hassan@miuegypt.edu.eg",
+    "University ID": "2023/00001",
+    "Course Code": "SWE21201",
+    "Course Time": "1:00 - 2:30",
+    "Doctor/TA Name": "Dr. Ahmed Smith",
+}
+
+
+def test_from_row():
+    """Test the dictionary adapter keeps only the report fields."""
+
+    record = AttendanceRecord.from_row(row)
+    assert record.full_name == "Ahmed Hassan"
+    assert record.university_email == "ahmed.hassan@miuegypt.edu.eg"
+    assert record.table_cells() == (
+        "Ahmed Hassan",
+        "2023/00001",
+        "SWE21201",
+        "1:00 - 2:30",
+        "Dr. Ahmed Smith",
+    )
+    assert record.error is None
+
+    # No per-instance dictionary, unknown attributes cannot be added
+    assert not hasattr(record, "__dict__")
+    with raises(AttributeError):
+        record.timestamp = row["Timestamp"]
+
+    # Error from the argument or from the row's "error" key
+    assert AttendanceRecord.from_row(row, "Invalid name").error == "Invalid name"
+    assert AttendanceRecord.from_row({**row, "error": "Invalid ID"}).error == "Invalid ID"
+
+
+def test_to_dict():
+    """Test records convert back to row dictionaries without the dropped columns."""
+
+    expected = dict(row)
+    del expected["Timestamp"]
+    assert AttendanceRecord.from_row(row).to_dict() == expected
+
+    # Sheets without an email column, invalid rows keep their error
+    del expected["University Email"]
+    expected["error"] = "Invalid ID"
+    assert AttendanceRecord.from_row(expected).to_dict() == expected
+
+
+def test_process_records():
+    """Test process_records() matches process() for every dataset."""
+
+    for csv_file in [
+        "datasets/mixed_data.csv",
+        "datasets/no_email.csv",
+        "datasets/large_data.csv",
+    ]:
+        valid_rows, invalid_rows = Processor(csv_file).process()
+        valid_records, invalid_records = Processor(csv_file).process_records()
+
+        assert valid_records == [AttendanceRecord.from_row(row) for row in valid_rows]
+        assert invalid_records == [AttendanceRecord.from_row(row) for row in invalid_rows]
+
+        # iter_records() streams the same records, in file order
+        records = list(Processor(csv_file).iter_records())
+        assert sorted(records, key=lambda record: record.error is not None) == (
+            valid_records + invalid_records
+        )
+
+
+def test_batch_encoding():
+    """Test the batch stores each distinct value once and decodes rows back to records."""
+
+    records = Processor("datasets/large_data.csv").process_records()[0]
+    batch = AttendanceBatch(records)
+
+    assert len(batch) == len(records)
+    assert list(batch) == records
+    assert batch[0] == records[0]
+    assert batch[-1] == records[-1]
+
+    # One dictionary entry per distinct value, one integer code per row
+    course_codes = batch.values("course_code")
+    assert len(course_codes) == len(set(record.course_code for record in records))
+    assert len(batch.codes("course_code")) == len(records)
+    assert [course_codes[code] for code in batch.codes("course_code")] == [
+        record.course_code for record in records
+    ]
+
+
+def test_batch_group_by_and_dedupe():
+    """Test grouping and duplicate detection on the integer codes."""
+
+    first = AttendanceRecord.from_row(row)
+    other_course = AttendanceRecord.from_row({**row, "Course Code": "CSC23002"})
+    repeated = AttendanceRecord.from_row({**row, "Full Name": "Ahmed H."})
+    batch = AttendanceBatch([first, other_course, repeated])
+
+    assert batch.group_by() == {"SWE21201": [0, 2], "CSC23002": [1]}
+    assert batch.group_by("course_code", "course_time") == {
+        ("SWE21201", "1:00 - 2:30"): [0, 2],
+        ("CSC23002", "1:00 - 2:30"): [1],
+    }
+
+    # Same university ID, course code and course time as the first row
+    assert batch.duplicate_indices() == [2]
+    assert list(batch.dedupe()) == [first, other_course]
+    assert list(batch.take([2, 0])) == [repeated, first]
+
+
+def test_process_batch_export():
+    """Test process_batch() matches process_records() and exports like it."""
+
+    processor = Processor("datasets/mixed_data.csv")
+    valid_records, invalid_records = processor.process_records()
+    valid_batch, invalid_batch = processor.process_batch()
+
+    assert list(valid_batch) == valid_records
+    assert list(invalid_batch) == invalid_records
+
+    exporter = Exporter(valid_batch, invalid_batch, "Batch Export Test")
+    assert exporter.valid_rows is valid_batch
+    filename = exporter.export_pdf()
+    assert os.path.getsize(filename) > 0
+    os.remove(filename)
@@ -0,0 +1,159 @@
+from attendance_tool_msp.src.attendance_tool_msp.server import ReportServer, main
+from pytest import raises
+from urllib.parse import quote
+import asyncio, io, json, os, docx
+
+mixed_data = os.path.abspath("datasets/mixed_data.csv")
+
+
+async def request(port, method, target, body=b""):
+    """Send one HTTP request to the local server and return (status, headers, body)."""
+
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    head = f"{method} {target} HTTP/1.1\r\nHost: localhost\r\n"
+    if method == "POST":
+        head += f"Content-Length: {len(body)}\r\n"
+    writer.write(head.encode() + b"\r\n" + body)
+    await writer.drain()
+
+    response = await reader.read()
+    writer.close()
+    await writer.wait_closed()
+
+    head, _, payload = response.partition(b"\r\n\r\n")
+    status_line, *header_lines = head.decode("latin-1").split("\r\n")
+    headers = dict(line.split(": ", 1) for line in header_lines)
+    return int(status_line.split()[1]), headers, payload
+
+
+def test_server_exports_and_metrics():
+    """Test exporting uploaded CSV files on localhost, errors and latency metrics."""
+
+    with open(mixed_data, "rb") as file:
+        csv_data = file.read()
+
+    async def scenario():
+        server = ReportServer(port=0, workers=1, max_concurrency=1)
+        await server.start()
+        try:
+            # Concurrent requests queue on the semaphore and all succeed
+            responses = await asyncio.gather(
+                request(server.port, "POST", "/export?format=pdf&title=Server%20Test", csv_data),
+                request(server.port, "POST", "/export?format=docx&title=Server%20Test", csv_data),
+            )
+            errors = [
+                await request(server.port, "POST", "/export?format=xlsx", csv_data),
+                await request(server.port, "POST", "/export", b"Full Name\nJohn Doe\n"),
+                await request(server.port, "GET", "/export"),
+                await request(server.port, "GET", "/unknown"),
+            ]
+            metrics = await request(server.port, "GET", "/metrics")
+        finally:
+            await server.close()
+        return responses, errors, metrics
+
+    files_before = set(os.listdir())
+    (pdf, word), errors, metrics = asyncio.run(scenario())
+
+    status, headers, payload = pdf
+    assert status == 200
+    assert headers["Content-Type"] == "application/pdf"
+    assert 'filename="Server_Test.pdf"' in headers["Content-Disposition"]
+    assert payload.startswith(b"%PDF-")
+
+    status, headers, payload = word
+    assert status == 200
+    document = docx.Document(io.BytesIO(payload))
+    rows = int(headers["X-Valid-Rows"]) + int(headers["X-Invalid-Rows"])
+    assert len(document.tables[0].rows) == 1 + rows
+
+    assert [error[0] for error in errors] == [400, 400, 405, 404]
+    assert b"Missing required column" in errors[1][2]
+
+    # Reports are streamed back, nothing is written to the current directory
+    assert set(os.listdir()) == files_before
+
+    status, _, payload = metrics
+    assert status == 200
+    metrics = json.loads(payload)
+    assert metrics["requests"] == 7  # /metrics is counted before it answers
+    assert metrics["responses"] == {"200": 2, "400": 2, "404": 1, "405": 1}
+    assert metrics["exported_rows"] == 2 * rows
+    assert metrics["export_latency_ms"]["count"] == 2
+    assert 0 < metrics["export_latency_ms"]["p50"] <= metrics["export_latency_ms"]["max"]
+    assert metrics["exports_in_flight"] == 0 and metrics["exports_waiting"] == 0
+
+
+def test_server_unicode_titles_and_failures(monkeypatch):
+    """Test non-Latin-1 report titles, and unexpected errors answered with a 500."""
+
+    with open(mixed_data, "rb") as file:
+        csv_data = file.read()
+    title = "تقرير الحضور"
+
+    async def scenario():
+        server = ReportServer(port=0, workers=1, max_concurrency=1)
+        await server.start()
+        try:
+            report = await request(server.port, "POST", f"/export?format=docx&title={quote(title)}", csv_data)
+
+            async def broken_route(*args):
+                raise RuntimeError("Unexpected bug")
+
+            monkeypatch.setattr(server, "_ReportServer__route", broken_route)
+            failure = await request(server.port, "GET", "/health")
+            monkeypatch.undo()
+            # Longer than the 64 KiB line limit of the stream reader
+            too_long = await request(server.port, "GET", "/" + "x" * 70000)
+            metrics = await request(server.port, "GET", "/metrics")
+        finally:
+            await server.close()
+        return report, failure, too_long, metrics
+
+    report, failure, too_long, metrics = asyncio.run(scenario())
+
+    status, headers, payload = report
+    assert status == 200
+    # Latin-1 only header, with an ASCII fallback name and the UTF-8 name (RFC 5987)
+    assert headers["Content-Disposition"] == (
+        "attachment; filename=\"report.docx\"; "
+        f"filename*=UTF-8''{quote(title.replace(' ', '_') + '.docx')}"
+    )
+    assert docx.Document(io.BytesIO(payload)).tables
+
+    status, _, payload = failure
+    assert status == 500
+    assert b"RuntimeError" in payload
+    assert too_long[0] == 400
+
+    metrics = json.loads(metrics[2])
+    assert metrics["responses"] == {"200": 1, "400": 1, "500": 1}
+
+
+def test_server_arguments():
+    """Test invalid server settings are rejected before anything is started."""
+
+    with raises(ValueError):
+        ReportServer(workers=0)
+    with raises(ValueError):
+        ReportServer(max_concurrency=-1)
+    with raises(ValueError):
+        ReportServer(max_upload_bytes=0)
+
+
+def test_server_prints_assigned_port(monkeypatch, capsys):
+    """Test the command line prints the port picked for --port 0 once the server is listening."""
+
+    async def serve_once(server, ready=None):
+        await server.start()
+        try:
+            ready()
+        finally:
+            await server.close()
+
+    monkeypatch.setattr(ReportServer, "serve_forever", serve_once)
+    main(["--port", "0", "--workers", "1"])
+
+    output = capsys.readouterr().out
+    assert ":0 " not in output
+    assert int(output.split("127.0.0.1:")[1].split()[0]) > 0
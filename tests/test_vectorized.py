@@ -0,0 +1,90 @@
+from attendance_tool_msp.src.attendance_tool_msp import Processor
+from pytest import raises, importorskip
+import csv, glob, random
+
+# The vectorized engine is optional, skip these tests without NumPy
+importorskip("numpy")
+
+from attendance_tool_msp.src.attendance_tool_msp.vectorized import validate_rows
+
+# Values the masks must not wrongly accept: whitespace, case, Unicode digits and letters,
+# lengths around the limits, empty cells and malformed addresses
+EDGE_VALUES = {
+    "Full Name": [
+        "Ahmed Hassan", "ahmed hassan", " Ahmed Hassan", "Ahmed  Hassan", "Ahmed\tHassan",
+        "Al", "Abc", "A" * 50, "A" * 51, "One Two Three Four Five", "One Two Three Four Five Six",
+        "O'Neil Smith", "Mary-Jane Doe", "Mary-jane Doe", "José Hassan", "Ahmed Hassan\n",
+        "Ahmed\x00", "---", "", None,
+    ],
+    "University Email": [
+        "ahmed@miuegypt.edu.eg", "Ahmed.Hassan@miuegypt.edu.eg", "ahmed@MIUEGYPT.EDU.EG",
+        " ahmed@miuegypt.edu.eg", ".ahmed@miuegypt.edu.eg", "ahmed.@miuegypt.edu.eg",
+        "ah..med@miuegypt.edu.eg", "a" * 64 + "@miuegypt.edu.eg", "a" * 65 + "@miuegypt.edu.eg",
+        "ahmed@gmail.com", "ahmed@@miuegypt.edu.eg", "@miuegypt.edu.eg", "ahméd@miuegypt.edu.eg",
+        "-ahmed_1@miuegypt.edu.eg", "ahmed", "", None,
+    ],
+    "University ID": [
+        "2023/00001", "202300001", " 2023/00001", "2009/00001", "2010/00001", "2099/00001",
+        "２０２３/00001", "2023/0001", "2023-00001", "2023/000012", "abcd/efghi", "2023/00001\x00",
+        "", None,
+    ],
+    "Course Code": ["SWE21201", "swe21201", "SWE21201 lecture", " CSC101", "SW21201", "", None],
+    "Course Time": ["1:00 - 2:30", "1 to 2:30", "13:00 - 2:30", "1:60 - 2", "", None],
+    "Doctor/TA Name": ["Dr. Ahmed Smith", "ahmed smith", "ta mike", "Dr.", "Ahmed@Smith", "", None],
+}
+
+
+def test_vectorized_matches_scalar():
+    """Test the vectorized engine returns the same rows as the scalar engine for every dataset."""
+
+    for csv_file in sorted(glob.glob("datasets/*.csv")):
+        expected = Processor(csv_file).process()
+        assert Processor(csv_file, engine="vectorized").process() == expected
+        assert Processor(csv_file, engine="vectorized").process(workers=2) == expected
+        assert Processor(csv_file, engine="auto").process() == expected
+
+
+def test_vectorized_edge_values():
+    """Test random combinations of edge values get the scalar normalization and error messages."""
+
+    generator = random.Random(2025)
+    rows = [
+        {column: generator.choice(values) for column, values in EDGE_VALUES.items()}
+        for _ in range(3000)
+    ]
+
+    for has_email in (True, False):
+        expected = []
+        for row in rows:
+            row = dict(row)
+            try:
+                Processor.validate_row(row, has_email)
+            except ValueError as error:
+                expected.append((row, str(error)))
+            else:
+                expected.append((row, None))
+
+        # Small batches mix fast and slow values differently from batch to batch
+        for batch_size in (1, 7, 4096):
+            copies = [dict(row) for row in rows]
+            assert list(validate_rows(copies, has_email, batch_size)) == expected
+
+
+def test_engine_property(tmp_path):
+    """Test engine validation, and short rows read through a csv file."""
+
+    with raises(ValueError):
+        Processor("datasets/mixed_data.csv", engine="gpu")
+    assert Processor("datasets/mixed_data.csv", engine="auto").engine == "auto"
+
+    # Missing trailing cells are None, extra cells are stored under the None key
+    csv_file = tmp_path / "short_rows.csv"
+    with open(csv_file, "w", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(EDGE_VALUES)
+        writer.writerow(["Ahmed Hassan", "ahmed@miuegypt.edu.eg", "2023/00001"])
+        writer.writerow(["Ahmed Hassan", "ahmed@miuegypt.edu.eg", "2023/00001", "SWE21201",
+                         "1:00 - 2:30", "Dr. Ahmed Smith", "extra"])
+
+    expected = Processor(str(csv_file)).process()
+    assert Processor(str(csv_file), engine="vectorized").process() == expected
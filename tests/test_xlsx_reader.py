@@ -0,0 +1,186 @@
+from attendance_tool_msp.src.attendance_tool_msp import Processor
+from attendance_tool_msp.src.attendance_tool_msp.xlsx_reader import XlsxReader
+from pytest import raises
+from datetime import date, datetime
+from xml.sax.saxutils import escape
+import csv, zipfile
+
+MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PACKAGE_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+
+def column_letters(index):
+    """Convert a 0-based column index to its letters (0 -> A, 26 -> AA)."""
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
+
+
+def write_workbook(path, rows, sheet_name="Form Responses 1"):
+    """
+    Write a minimal .xlsx workbook like a Google Forms download.
+
+    Cells are given as str (shared string), int/float (number), datetime (date
+    serial with a date and time style), date (date serial with a date style),
+    ("inline", text) or None (no cell).
+    """
+    strings = {}
+    sheet_rows = []
+    for row_number, row in enumerate(rows, 1):
+        cells = []
+        for column, value in enumerate(row):
+            reference = f"{column_letters(column)}{row_number}"
+            if value is None:
+                continue
+            if isinstance(value, tuple):
+                cells.append(f'<c r="{reference}" t="inlineStr"><is><t>{escape(value[1])}</t></is></c>')
+            elif isinstance(value, datetime):
+                serial = (value - datetime(1899, 12, 30)).total_seconds() / 86400
+                cells.append(f'<c r="{reference}" s="1"><v>{serial!r}</v></c>')
+            elif isinstance(value, date):
+                serial = (value - date(1899, 12, 30)).days
+                cells.append(f'<c r="{reference}" s="2"><v>{serial}</v></c>')
+            elif isinstance(value, (int, float)):
+                cells.append(f'<c r="{reference}"><v>{value}</v></c>')
+            else:
+                # Shared strings are stored once, like Excel does
+                index = strings.setdefault(value, len(strings))
+                cells.append(f'<c r="{reference}" t="s"><v>{index}</v></c>')
+        sheet_rows.append(f'<row r="{row_number}">{"".join(cells)}</row>')
+
+    shared = "".join(f"<si><t>{escape(text)}</t></si>" for text in strings)
+    parts = {
+        "[Content_Types].xml": '<?xml version="1.0"?><Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types"/>',
+        "_rels/.rels": f'<Relationships xmlns="{PACKAGE_REL_NS}"><Relationship Id="rId1" Type="{REL_NS}/officeDocument" Target="xl/workbook.xml"/></Relationships>',
+        "xl/workbook.xml": f'<workbook xmlns="{MAIN_NS}" xmlns:r="{REL_NS}"><sheets><sheet name="{sheet_name}" sheetId="1" r:id="rId1"/></sheets></workbook>',
+        "xl/_rels/workbook.xml.rels": (
+            f'<Relationships xmlns="{PACKAGE_REL_NS}">'
+            f'<Relationship Id="rId1" Type="{REL_NS}/worksheet" Target="worksheets/sheet1.xml"/>'
+            f'<Relationship Id="rId2" Type="{REL_NS}/sharedStrings" Target="sharedStrings.xml"/>'
+            f'<Relationship Id="rId3" Type="{REL_NS}/styles" Target="/xl/styles.xml"/>'
+            "</Relationships>"
+        ),
+        "xl/sharedStrings.xml": f'<sst xmlns="{MAIN_NS}">{shared}</sst>',
+        "xl/styles.xml": (
+            f'<styleSheet xmlns="{MAIN_NS}"><numFmts><numFmt numFmtId="164" formatCode="m/d/yyyy h:mm:ss"/></numFmts>'
+            '<cellXfs><xf numFmtId="0"/><xf numFmtId="164"/><xf numFmtId="14"/></cellXfs></styleSheet>'
+        ),
+        "xl/worksheets/sheet1.xml": f'<worksheet xmlns="{MAIN_NS}"><sheetData>{"".join(sheet_rows)}</sheetData></worksheet>',
+    }
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in parts.items():
+            archive.writestr(name, data)
+    return str(path)
+
+
+def csv_rows_as_cells(csv_file):
+    """Read a dataset, turning Google Forms timestamps into dates and 9-digit IDs into numbers."""
+    with open(csv_file, newline="") as file:
+        rows = list(csv.reader(file))
+
+    cells = [rows[0]]
+    for row in rows[1:]:
+        row = list(row)
+        try:
+            row[0] = datetime.strptime(row[0], "%m/%d/%Y %H:%M:%S")
+        except ValueError:
+            pass
+        if row[3].isdigit():
+            row[3] = int(row[3])
+        cells.append(row)
+    return cells
+
+
+def test_xlsx_matches_csv(tmp_path):
+    """Test an .xlsx download of a sheet gives the same results as its CSV export."""
+
+    for csv_file in ["datasets/mixed_data.csv", "datasets/duplicate_submissions.csv"]:
+        xlsx_file = write_workbook(tmp_path / "responses.xlsx", csv_rows_as_cells(csv_file))
+
+        for dedupe in (None, "latest"):
+            expected = Processor(csv_file, dedupe=dedupe).process()
+            processor = Processor(xlsx_file, dedupe=dedupe)
+            assert processor.process() == expected
+            # Workbooks can't be split into byte ranges, both paths read them serially
+            assert processor.process(workers=2) == expected
+            assert processor.process_incremental() == expected
+
+
+def test_xlsx_cells(tmp_path):
+    """Test cell types, gaps, blank rows and short rows are read like a CSV export."""
+
+    header = ["Full Name", "University ID", "Score", "Submitted"]
+    xlsx_file = write_workbook(
+        tmp_path / "cells.xlsx",
+        [
+            header,
+            [("inline", "Ahmed Hassan"), 202306246, 1.5, datetime(2025, 3, 12, 9, 15, 10)],
+            [],
+            ["Sara Ali", None, 3, date(2025, 3, 12)],
+            ["Nour Samy", "", 0.1, datetime(2025, 3, 13)],
+            ["Omar Nabil"],
+            ["Mona Adel", "2023/00001", None, None, "extra"],
+        ],
+        sheet_name="Responses",
+    )
+
+    with XlsxReader(xlsx_file) as reader:
+        assert reader.sheet_name == "Responses"
+        assert reader.fieldnames == header
+        rows = list(reader)
+
+    assert rows == [
+        {"Full Name": "Ahmed Hassan", "University ID": "202306246", "Score": "1.5", "Submitted": "3/12/2025 09:15:10"},
+        {"Full Name": "Sara Ali", "University ID": "", "Score": "3", "Submitted": "3/12/2025"},
+        {"Full Name": "Nour Samy", "University ID": "", "Score": "0.1", "Submitted": "3/13/2025 00:00:00"},
+        {"Full Name": "Omar Nabil", "University ID": "", "Score": "", "Submitted": ""},
+        {"Full Name": "Mona Adel", "University ID": "2023/00001", "Score": "", "Submitted": "", None: ["extra"]},
+    ]
+
+    with raises(ValueError):
+        XlsxReader(xlsx_file, sheet="Missing")
+
+    # Not a zip archive
+    broken_file = tmp_path / "broken.xlsx"
+    broken_file.write_text("Full Name,University ID\n")
+    with raises(ValueError):
+        Processor(str(broken_file)).process()
+
+
+def test_spilled_shared_strings(tmp_path, monkeypatch):
+    """Test large shared strings tables are read back from a temporary file with flat memory."""
+
+    from attendance_tool_msp.src.attendance_tool_msp import xlsx_reader
+    import tracemalloc
+
+    # Spilling every table, with a tiny cache, gives the same results
+    csv_file = "datasets/mixed_data.csv"
+    xlsx_file = write_workbook(tmp_path / "responses.xlsx", csv_rows_as_cells(csv_file))
+    monkeypatch.setattr(xlsx_reader, "SHARED_STRINGS_CACHE", 2)
+    monkeypatch.setattr(xlsx_reader, "SHARED_STRINGS_MEMORY_BYTES", 0)
+    assert Processor(xlsx_file).process() == Processor(csv_file).process()
+
+    # A sheet of distinct names: its strings table is most of the memory when kept as a list
+    rows = [["Full Name", "University ID", "Course Code"]]
+    for i in range(10000):
+        rows.append([f"Student Number {i:06d} Of A Large Course", f"2023/{i:05d}", "SWE21201"])
+    xlsx_file = write_workbook(tmp_path / "large.xlsx", rows)
+
+    def peak_memory(threshold):
+        monkeypatch.setattr(xlsx_reader, "SHARED_STRINGS_MEMORY_BYTES", threshold)
+        tracemalloc.start()
+        with XlsxReader(xlsx_file) as reader:
+            last = None
+            for last in reader:
+                pass
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert last == dict(zip(rows[0], rows[-1]))
+        return peak
+
+    # About 3 times less here, the peak is then mostly the parser's buffers
+    assert peak_memory(0) < peak_memory(1 << 30) / 2